@@ -7,7 +7,18 @@ from sqlalchemy import engine_from_config, pool
 
 from app.core.config import get_settings
 from app.db.base import Base
-from app.models import Character, Episode, EpisodeCharacter, Job, StorySeries, Theme  # noqa: F401
+from app.models import (  # noqa: F401
+    Character,
+    Episode,
+    EpisodeCharacter,
+    IdempotencyKey,
+    Job,
+    MediaAsset,
+    StoryContext,
+    StorySeries,
+    Theme,
+    ThemeKnowledge,
+)
 
 config = context.config
 settings = get_settings()
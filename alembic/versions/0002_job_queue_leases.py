@@ -0,0 +1,35 @@
+"""add job queue lease columns
+
+Revision ID: 0002_job_queue_leases
+Revises: 0001_phase1_schema
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_job_queue_leases"
+down_revision: str | None = "0001_phase1_schema"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add worker lease tracking and the claim index to jobs."""
+
+    op.add_column("jobs", sa.Column("worker_id", sa.String(length=128), nullable=True))
+    op.add_column("jobs", sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("jobs", sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"))
+    op.create_index("ix_jobs_status_id", "jobs", ["status", "id"])
+
+
+def downgrade() -> None:
+    """Drop worker lease tracking from jobs."""
+
+    op.drop_index("ix_jobs_status_id", table_name="jobs")
+    op.drop_column("jobs", "attempts")
+    op.drop_column("jobs", "lease_expires_at")
+    op.drop_column("jobs", "worker_id")
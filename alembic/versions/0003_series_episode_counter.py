@@ -0,0 +1,38 @@
+"""add per-series episode counter
+
+Revision ID: 0003_series_episode_counter
+Revises: 0002_job_queue_leases
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_series_episode_counter"
+down_revision: str | None = "0002_job_queue_leases"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add story_series.last_episode_number and backfill it from existing episodes."""
+
+    op.add_column("story_series", sa.Column("last_episode_number", sa.Integer(), nullable=False, server_default="0"))
+    op.execute(
+        """
+        UPDATE story_series
+        SET last_episode_number = COALESCE(
+            (SELECT MAX(episodes.episode_number) FROM episodes WHERE episodes.series_id = story_series.id),
+            0
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the per-series episode counter."""
+
+    op.drop_column("story_series", "last_episode_number")
@@ -0,0 +1,40 @@
+"""add keyset pagination indexes
+
+Revision ID: 0004_keyset_pagination_indexes
+Revises: 0003_series_episode_counter
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_keyset_pagination_indexes"
+down_revision: str | None = "0003_series_episode_counter"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEXES = [
+    ("ix_episodes_created_at_id", "episodes", ["created_at", "id"]),
+    ("ix_episodes_series_id_created_at_id", "episodes", ["series_id", "created_at", "id"]),
+    ("ix_episodes_status_created_at_id", "episodes", ["status", "created_at", "id"]),
+    ("ix_episodes_theme_id_created_at_id", "episodes", ["theme_id", "created_at", "id"]),
+    ("ix_jobs_created_at_id", "jobs", ["created_at", "id"]),
+    ("ix_jobs_status_created_at_id", "jobs", ["status", "created_at", "id"]),
+    ("ix_characters_created_at_id", "characters", ["created_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    """Create composite indexes backing the ``(created_at, id)`` keyset listings."""
+
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes."""
+
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,28 @@
+"""default jobs to the episode pipeline
+
+Revision ID: 0005_episode_pipeline_job_type
+Revises: 0004_keyset_pagination_indexes
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_episode_pipeline_job_type"
+down_revision: str | None = "0004_keyset_pagination_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Make ``episode_pipeline`` the default job type."""
+
+    op.alter_column("jobs", "type", server_default="episode_pipeline")
+
+
+def downgrade() -> None:
+    """Restore the phase 1 stub job type default."""
+
+    op.alter_column("jobs", "type", server_default="phase1_stub")
@@ -0,0 +1,39 @@
+"""add theme knowledge passages
+
+Revision ID: 0006_theme_knowledge
+Revises: 0005_episode_pipeline_job_type
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_theme_knowledge"
+down_revision: str | None = "0005_episode_pipeline_job_type"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the theme_knowledge table."""
+
+    op.create_table(
+        "theme_knowledge",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("theme_id", sa.Integer(), nullable=False),
+        sa.Column("source_text", sa.Text(), nullable=False),
+        sa.Column("source_ref", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(["theme_id"], ["themes.id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_theme_knowledge_theme_id", "theme_knowledge", ["theme_id"])
+
+
+def downgrade() -> None:
+    """Drop the theme_knowledge table."""
+
+    op.drop_index("ix_theme_knowledge_theme_id", table_name="theme_knowledge")
+    op.drop_table("theme_knowledge")
@@ -0,0 +1,38 @@
+"""add memoized story contexts
+
+Revision ID: 0007_story_contexts
+Revises: 0006_theme_knowledge
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_story_contexts"
+down_revision: str | None = "0006_theme_knowledge"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the story_contexts table and index continuation links."""
+
+    op.create_table(
+        "story_contexts",
+        sa.Column("episode_id", sa.Integer(), primary_key=True),
+        sa.Column("context_text", sa.Text(), nullable=False),
+        sa.Column("chain_length", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(["episode_id"], ["episodes.id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_episodes_continuation_from_episode_id", "episodes", ["continuation_from_episode_id"])
+
+
+def downgrade() -> None:
+    """Drop the story_contexts table and the continuation index."""
+
+    op.drop_index("ix_episodes_continuation_from_episode_id", table_name="episodes")
+    op.drop_table("story_contexts")
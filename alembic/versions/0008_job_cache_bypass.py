@@ -0,0 +1,29 @@
+"""add job generation cache bypass flag
+
+Revision ID: 0008_job_cache_bypass
+Revises: 0007_story_contexts
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0008_job_cache_bypass"
+down_revision: str | None = "0007_story_contexts"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add jobs.cache_bypass."""
+
+    op.add_column("jobs", sa.Column("cache_bypass", sa.Boolean(), nullable=False, server_default=sa.text("false")))
+
+
+def downgrade() -> None:
+    """Drop jobs.cache_bypass."""
+
+    op.drop_column("jobs", "cache_bypass")
@@ -0,0 +1,44 @@
+"""add media assets
+
+Revision ID: 0009_media_assets
+Revises: 0008_job_cache_bypass
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0009_media_assets"
+down_revision: str | None = "0008_job_cache_bypass"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the media_assets table."""
+
+    op.create_table(
+        "media_assets",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("episode_id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=32), nullable=False),
+        sa.Column("content_type", sa.String(length=128), nullable=False),
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(["episode_id"], ["episodes.id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_media_assets_episode_id", "media_assets", ["episode_id"])
+    op.create_index("ix_media_assets_sha256", "media_assets", ["sha256"])
+
+
+def downgrade() -> None:
+    """Drop the media_assets table."""
+
+    op.drop_index("ix_media_assets_sha256", table_name="media_assets")
+    op.drop_index("ix_media_assets_episode_id", table_name="media_assets")
+    op.drop_table("media_assets")
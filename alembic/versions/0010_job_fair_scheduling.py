@@ -0,0 +1,46 @@
+"""add job priority and fair-share scheduling columns
+
+Revision ID: 0010_job_fair_scheduling
+Revises: 0009_media_assets
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0010_job_fair_scheduling"
+down_revision: str | None = "0009_media_assets"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add jobs.priority, jobs.client_key and jobs.fair_rank with their scheduling indexes."""
+
+    op.add_column("jobs", sa.Column("priority", sa.Integer(), nullable=False, server_default="10"))
+    op.add_column("jobs", sa.Column("client_key", sa.String(length=128), nullable=False, server_default="anonymous"))
+    op.add_column("jobs", sa.Column("fair_rank", sa.BigInteger(), nullable=False, server_default="0"))
+    op.create_index(
+        "ix_jobs_status_priority_fair_rank_id",
+        "jobs",
+        ["status", sa.text("priority DESC"), "fair_rank", "id"],
+    )
+    op.create_index("ix_jobs_status_fair_rank", "jobs", ["status", "fair_rank"])
+    op.create_index("ix_jobs_status_client_key_fair_rank", "jobs", ["status", "client_key", "fair_rank"])
+    # Claims no longer walk queued jobs by id alone.
+    op.drop_index("ix_jobs_status_id", table_name="jobs")
+
+
+def downgrade() -> None:
+    """Drop the fair-share scheduling columns and restore the id-ordered claim index."""
+
+    op.create_index("ix_jobs_status_id", "jobs", ["status", "id"])
+    op.drop_index("ix_jobs_status_client_key_fair_rank", table_name="jobs")
+    op.drop_index("ix_jobs_status_fair_rank", table_name="jobs")
+    op.drop_index("ix_jobs_status_priority_fair_rank_id", table_name="jobs")
+    op.drop_column("jobs", "fair_rank")
+    op.drop_column("jobs", "client_key")
+    op.drop_column("jobs", "priority")
@@ -0,0 +1,28 @@
+"""add index for reaping jobs with expired leases
+
+Revision ID: 0012_job_lease_reaper_index
+Revises: 0011_idempotency_keys
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0012_job_lease_reaper_index"
+down_revision: str | None = "0011_idempotency_keys"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index running jobs by lease expiry for the reaper."""
+
+    op.create_index("ix_jobs_status_lease_expires_at", "jobs", ["status", "lease_expires_at"])
+
+
+def downgrade() -> None:
+    """Drop the lease expiry index."""
+
+    op.drop_index("ix_jobs_status_lease_expires_at", table_name="jobs")
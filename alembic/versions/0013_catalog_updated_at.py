@@ -0,0 +1,36 @@
+"""add updated_at to themes, characters, series and episodes
+
+Revision ID: 0013_catalog_updated_at
+Revises: 0012_job_lease_reaper_index
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0013_catalog_updated_at"
+down_revision: str | None = "0012_job_lease_reaper_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("themes", "characters", "story_series", "episodes")
+
+
+def upgrade() -> None:
+    """Add an updated_at column, used for ETag and Last-Modified, to each table."""
+
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        )
+
+
+def downgrade() -> None:
+    """Drop the updated_at columns."""
+
+    for table in TABLES:
+        op.drop_column(table, "updated_at")
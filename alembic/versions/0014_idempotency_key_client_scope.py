@@ -0,0 +1,37 @@
+"""scope idempotency keys to the client that sent them
+
+Revision ID: 0014_idempotency_key_client_scope
+Revises: 0013_catalog_updated_at
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0014_idempotency_key_client_scope"
+down_revision: str | None = "0013_catalog_updated_at"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add idempotency_keys.client_key and make keys unique per client."""
+
+    op.add_column(
+        "idempotency_keys",
+        sa.Column("client_key", sa.String(length=128), nullable=False, server_default="anonymous"),
+    )
+    op.drop_constraint("uq_idempotency_keys_key", "idempotency_keys", type_="unique")
+    op.create_unique_constraint("uq_idempotency_keys_client_key_key", "idempotency_keys", ["client_key", "key"])
+
+
+def downgrade() -> None:
+    """Make keys globally unique again, keeping the newest row of each key."""
+
+    op.execute("DELETE FROM idempotency_keys WHERE id NOT IN (SELECT max(id) FROM idempotency_keys GROUP BY key)")
+    op.drop_constraint("uq_idempotency_keys_client_key_key", "idempotency_keys", type_="unique")
+    op.create_unique_constraint("uq_idempotency_keys_key", "idempotency_keys", ["key"])
+    op.drop_column("idempotency_keys", "client_key")
@@ -0,0 +1,29 @@
+"""add a script generation counter to episodes
+
+Revision ID: 0015_episode_script_generation
+Revises: 0014_idempotency_key_client_scope
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0015_episode_script_generation"
+down_revision: str | None = "0014_idempotency_key_client_scope"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add episodes.script_generation, bumped whenever the script text is replaced."""
+
+    op.add_column("episodes", sa.Column("script_generation", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    """Drop episodes.script_generation."""
+
+    op.drop_column("episodes", "script_generation")
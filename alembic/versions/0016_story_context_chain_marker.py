@@ -0,0 +1,29 @@
+"""record the chain a memoized story context was built from
+
+Revision ID: 0016_story_context_chain_marker
+Revises: 0015_episode_script_generation
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0016_story_context_chain_marker"
+down_revision: str | None = "0015_episode_script_generation"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add story_contexts.chain_updated_at; existing memos never match and are rebuilt."""
+
+    op.add_column("story_contexts", sa.Column("chain_updated_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop story_contexts.chain_updated_at."""
+
+    op.drop_column("story_contexts", "chain_updated_at")
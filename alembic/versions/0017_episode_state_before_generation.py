@@ -0,0 +1,31 @@
+"""keep the status and script an episode had before its current generation
+
+Revision ID: 0017_episode_state_before_generation
+Revises: 0016_story_context_chain_marker
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0017_episode_state_before_generation"
+down_revision: str | None = "0016_story_context_chain_marker"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add episodes.status_before_generation and episodes.script_before_generation."""
+
+    op.add_column("episodes", sa.Column("status_before_generation", sa.String(length=32), nullable=True))
+    op.add_column("episodes", sa.Column("script_before_generation", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop episodes.script_before_generation and episodes.status_before_generation."""
+
+    op.drop_column("episodes", "script_before_generation")
+    op.drop_column("episodes", "status_before_generation")
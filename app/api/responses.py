@@ -0,0 +1,39 @@
+"""Fast JSON responses serialized by precompiled Pydantic adapters."""
+
+from collections.abc import Mapping
+from typing import Any, Generic, TypeVar
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+
+class JSONAdapter(Generic[T]):
+    """A response type compiled once into a Pydantic validator and JSON serializer.
+
+    FastAPI's default path validates a returned value against ``response_model``,
+    converts the result to Python primitives and encodes those with ``json``.
+    ``response`` validates once instead, reading ORM rows through
+    ``from_attributes`` and passing schema instances through unchanged, and
+    pydantic-core writes the JSON bytes directly. Routes keep ``response_model``
+    for the OpenAPI schema; FastAPI skips it when a ``Response`` is returned.
+    """
+
+    def __init__(self, type_: Any) -> None:
+        self._adapter: TypeAdapter[T] = TypeAdapter(type_)
+
+    def validate(self, value: Any) -> T:
+        """Return ``value`` as the response type, reading attributes of ORM rows."""
+
+        return self._adapter.validate_python(value, from_attributes=True)
+
+    def dump_json(self, value: Any) -> bytes:
+        """Return the JSON body of ``value``."""
+
+        return self._adapter.dump_json(self.validate(value))
+
+    def response(self, value: Any, *, status_code: int = 200, headers: Mapping[str, str] | None = None) -> Response:
+        """Return ``value`` as an ``application/json`` response."""
+
+        return Response(self.dump_json(value), status_code=status_code, headers=headers, media_type="application/json")
@@ -0,0 +1,148 @@
+"""Media asset API endpoints."""
+
+import re
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.responses import JSONAdapter
+from app.core.blob_store import BlobTooLargeError, EmptyBlobError, get_blob_store
+from app.core.conditional import etag_matches
+from app.db.session import get_async_db
+from app.models.media_asset import MEDIA_ASSET_KINDS
+from app.repositories.aio import create_media_asset, get_episode, get_media_asset, list_episode_media_assets
+from app.schemas.media_asset import MediaAssetRead
+
+router = APIRouter(tags=["assets"])
+
+# Blobs are addressed by content, so a URL's bytes never change.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# At most 127 characters, so a validated type always fits ``MediaAsset.content_type``.
+MEDIA_TYPE_PATTERN = re.compile(r"[a-z0-9][a-z0-9!#$&^_.+-]{0,62}/[a-z0-9][a-z0-9!#$&^_.+-]{0,62}")
+# Content is served inline from this origin, so types a browser runs as a document are refused.
+REFUSED_MEDIA_TYPES = frozenset({"image/svg+xml"})
+
+MEDIA_ASSET = JSONAdapter(MediaAssetRead)
+MEDIA_ASSET_LIST = JSONAdapter(list[MediaAssetRead])
+
+
+def _upload_media_type(kind: str, content_type: str | None) -> str:
+    """Return the bare media type of an upload, which must belong to the asset's kind."""
+
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if (
+        not MEDIA_TYPE_PATTERN.fullmatch(media_type)
+        or not media_type.startswith(f"{kind}/")
+        or media_type in REFUSED_MEDIA_TYPES
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Content-Type must be a {kind}/* media type for {kind} assets",
+        )
+    return media_type
+
+
+@router.post("/episodes/{episode_id}/assets", response_model=MediaAssetRead, status_code=201)
+async def upload_episode_asset_endpoint(
+    episode_id: int,
+    request: Request,
+    kind: str = Query(...),
+    filename: str | None = Query(None, max_length=255),
+    db: AsyncSession = Depends(get_async_db),
+) -> MediaAssetRead:
+    """Stream the raw request body into the blob store and attach it to an episode.
+
+    ``Content-Type`` must be a media type of the asset's kind (``audio/*`` for
+    audio); other types get ``415`` and empty bodies ``400``, before anything is stored.
+    """
+
+    if kind not in MEDIA_ASSET_KINDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"kind must be one of {', '.join(MEDIA_ASSET_KINDS)}",
+        )
+    content_type = _upload_media_type(kind, request.headers.get("content-type"))
+    if not await get_episode(db, episode_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Episode not found")
+
+    store = get_blob_store()
+    too_large = HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="Upload too large")
+    empty = HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Upload is empty")
+    declared_length = request.headers.get("content-length")
+    if declared_length == "0":
+        raise empty
+    if store.max_bytes is not None and declared_length and declared_length.isdigit():
+        if int(declared_length) > store.max_bytes:
+            raise too_large
+    try:
+        blob = await store.write_stream(request.stream())
+    except BlobTooLargeError as exc:
+        raise too_large from exc
+    except EmptyBlobError as exc:
+        raise empty from exc
+
+    return await create_media_asset(
+        db,
+        episode_id=episode_id,
+        kind=kind,
+        content_type=content_type,
+        sha256=blob.sha256,
+        size_bytes=blob.size_bytes,
+        filename=filename,
+    )
+
+
+@router.get("/episodes/{episode_id}/assets", response_model=list[MediaAssetRead])
+async def list_episode_assets_endpoint(
+    episode_id: int,
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """Return the media assets of an episode, oldest first."""
+
+    if not await get_episode(db, episode_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Episode not found")
+    return MEDIA_ASSET_LIST.response(await list_episode_media_assets(db, episode_id))
+
+
+@router.get("/assets/{asset_id}", response_model=MediaAssetRead)
+async def get_asset_endpoint(asset_id: int, db: AsyncSession = Depends(get_async_db)) -> Response:
+    """Return the metadata of one media asset."""
+
+    asset = await get_media_asset(db, asset_id)
+    if not asset:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Asset not found")
+    return MEDIA_ASSET.response(asset)
+
+
+@router.get("/assets/{asset_id}/content")
+async def get_asset_content_endpoint(
+    asset_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """Serve an asset's bytes with range support and a content-derived ETag."""
+
+    asset = await get_media_asset(db, asset_id)
+    if not asset:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Asset not found")
+
+    headers = {
+        "ETag": f'"{asset.sha256}"',
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        "X-Content-Type-Options": "nosniff",
+    }
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    path = get_blob_store().path_for(asset.sha256)
+    if not path.is_file():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Asset content missing")
+    return FileResponse(
+        path,
+        media_type=asset.content_type,
+        headers=headers,
+        filename=asset.filename,
+        content_disposition_type="inline",
+    )
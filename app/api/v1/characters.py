@@ -1,24 +1,54 @@
 """Character API endpoints for phase 1."""
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-
-from app.db.session import get_db
-from app.repositories.character_repository import create_character, list_characters
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.responses import JSONAdapter
+from app.core.conditional import is_not_modified, not_modified, validator_headers
+from app.db.session import get_async_db
+from app.repositories.aio import create_character, list_characters_page
+from app.repositories.pagination import InvalidCursorError
 from app.schemas.character import CharacterCreate, CharacterRead
+from app.schemas.pagination import CursorPage
+from app.services import catalog_service
 
 router = APIRouter(prefix="/characters", tags=["characters"])
 
+CHARACTER_LIST = JSONAdapter(list[CharacterRead])
+CHARACTER_PAGE = JSONAdapter(CursorPage[CharacterRead])
+
 
 @router.get("", response_model=list[CharacterRead])
-def get_characters(db: Session = Depends(get_db)) -> list[CharacterRead]:
-    """Return all active characters for selection in the UI."""
+async def get_characters(request: Request, db: AsyncSession = Depends(get_async_db)) -> Response:
+    """Return all active characters for selection in the UI, or ``304`` if the client's copy is current."""
+
+    characters = await catalog_service.get_character_list(db)
+    headers = validator_headers(characters.etag, characters.last_modified)
+    if is_not_modified(request, characters.etag, characters.last_modified):
+        return not_modified(headers)
+    return CHARACTER_LIST.response(characters.items, headers=headers)
+
+
+@router.get("/page", response_model=CursorPage[CharacterRead])
+async def get_characters_page(
+    cursor: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    active: bool | None = None,
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """Return characters newest first, one keyset page at a time."""
 
-    return list_characters(db)
+    try:
+        characters, next_cursor = await list_characters_page(db, cursor=cursor, limit=limit, active=active)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return CHARACTER_PAGE.response({"items": characters, "next_cursor": next_cursor})
 
 
 @router.post("", response_model=CharacterRead, status_code=201)
-def create_character_endpoint(payload: CharacterCreate, db: Session = Depends(get_db)) -> CharacterRead:
+async def create_character_endpoint(payload: CharacterCreate, db: AsyncSession = Depends(get_async_db)) -> CharacterRead:
     """Create a new reusable character definition."""
 
-    return create_character(db, payload)
+    character = await create_character(db, payload)
+    catalog_service.invalidate_characters()
+    return character
@@ -1,33 +1,154 @@
 """Episode API endpoints for phase 1."""
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import json
+from collections.abc import AsyncGenerator
 
-from app.db.session import get_db
-from app.repositories.episode_repository import get_episode
-from app.schemas.episode import EpisodeCreate, EpisodeCreateResponse, EpisodeRead
-from app.services.episode_service import create_episode_and_job
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.responses import JSONAdapter
+from app.core.clients import client_key
+from app.core.conditional import is_not_modified, not_modified, validator_headers, version_tag
+from app.core.script_events import ScriptFeed, script_feed_hub
+from app.db.session import get_async_db
+from app.repositories.aio import get_episode, list_episodes_page
+from app.repositories.pagination import InvalidCursorError
+from app.schemas.episode import EpisodeBatchCreate, EpisodeBatchResponse, EpisodeCreate, EpisodeCreateResponse, EpisodeRead
+from app.schemas.pagination import CursorPage
+from app.services.episode_service import create_episode_and_job, create_episodes_batch
 
 router = APIRouter(prefix="/episodes", tags=["episodes"])
 
+EPISODE = JSONAdapter(EpisodeRead)
+EPISODE_PAGE = JSONAdapter(CursorPage[EpisodeRead])
+
+
+@router.get("", response_model=CursorPage[EpisodeRead])
+async def list_episodes_endpoint(
+    cursor: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    series_id: int | None = None,
+    status_filter: str | None = Query(None, alias="status"),
+    theme_id: int | None = None,
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """Return episodes newest first, one keyset page at a time."""
+
+    try:
+        episodes, next_cursor = await list_episodes_page(
+            db, cursor=cursor, limit=limit, series_id=series_id, status=status_filter, theme_id=theme_id
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return EPISODE_PAGE.response({"items": episodes, "next_cursor": next_cursor})
+
 
 @router.post("", response_model=EpisodeCreateResponse, status_code=201)
-def create_episode_endpoint(
+async def create_episode_endpoint(
     payload: EpisodeCreate,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    request: Request,
+    idempotency_key: str | None = Header(None, min_length=1, max_length=255),
+    db: AsyncSession = Depends(get_async_db),
 ) -> EpisodeCreateResponse:
-    """Create an episode and enqueue a background stub job."""
+    """Create an episode and enqueue its job for the worker pool.
 
-    episode_id, job_id = create_episode_and_job(db, payload, background_tasks)
+    Retries that repeat the ``Idempotency-Key`` header of an earlier request get
+    that request's ids back instead of a second episode and job.
+    """
+
+    key = client_key(request)
+    episode_id, job_id = await db.run_sync(
+        lambda session: create_episode_and_job(session, payload, client_key=key, idempotency_key=idempotency_key)
+    )
     return EpisodeCreateResponse(episode_id=episode_id, job_id=job_id)
 
 
+@router.post(":batch", response_model=EpisodeBatchResponse, status_code=201)
+async def create_episodes_batch_endpoint(
+    payload: EpisodeBatchCreate,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+) -> EpisodeBatchResponse:
+    """Create many episodes and enqueue their jobs at batch priority; failures are reported per item."""
+
+    key = client_key(request)
+    results = await db.run_sync(lambda session: create_episodes_batch(session, payload.items, client_key=key))
+    return EpisodeBatchResponse(results=results)
+
+
 @router.get("/{episode_id}", response_model=EpisodeRead)
-def get_episode_endpoint(episode_id: int, db: Session = Depends(get_db)) -> EpisodeRead:
-    """Return one episode by id."""
+async def get_episode_endpoint(episode_id: int, request: Request, db: AsyncSession = Depends(get_async_db)) -> Response:
+    """Return one episode by id, or ``304`` if the client's copy is current."""
 
-    episode = get_episode(db, episode_id)
+    episode = await get_episode(db, episode_id)
     if not episode:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Episode not found")
-    return episode
+    etag = version_tag("episode", episode_id, episode.updated_at)
+    headers = validator_headers(etag, episode.updated_at)
+    if is_not_modified(request, etag, episode.updated_at):
+        return not_modified(headers)
+    return EPISODE.response(episode, headers=headers)
+
+
+async def _script_event_stream(feed: ScriptFeed, generation: int | None, offset: int) -> AsyncGenerator[str, None]:
+    """Yield new script text as ``script`` events until the episode's job finishes.
+
+    Text comes from the episode's shared feed, which polls the database once per
+    interval for all viewers; the final ``done`` event always follows the complete
+    script. Event ids are ``<generation>:<offset>``, which lets a reconnecting client
+    resume through ``Last-Event-ID``; when the script was replaced since, e.g. by a
+    retry, a ``reset`` event precedes the new script from its start.
+    """
+
+    try:
+        version = 0
+        while True:
+            version = await feed.wait_for_change(version)
+            if feed.closed:
+                return
+            if feed.generation != generation:
+                if offset > 0:
+                    yield "event: reset\ndata: {}\n\n"
+                generation, offset = feed.generation, 0
+            if len(feed.text) > offset:
+                text, offset = feed.text[offset:], len(feed.text)
+                yield f"id: {generation}:{offset}\nevent: script\ndata: {json.dumps({'text': text})}\n\n"
+            if feed.finished:
+                yield f"event: done\ndata: {json.dumps({'status': feed.job_status})}\n\n"
+                return
+    finally:
+        script_feed_hub.unsubscribe(feed)
+
+
+def _parse_script_event_id(last_event_id: str) -> tuple[int | None, int]:
+    """Return the generation and offset of a ``Last-Event-ID``, or ``(None, 0)`` to start over."""
+
+    generation, _, offset = last_event_id.partition(":")
+    if not (generation.isdigit() and offset.isdigit()):
+        return None, 0
+    return int(generation), int(offset)
+
+
+@router.get("/{episode_id}/script/events")
+async def stream_episode_script_endpoint(
+    episode_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+) -> StreamingResponse:
+    """Stream the episode script as Server-Sent Events while it is being generated."""
+
+    try:
+        if not await get_episode(db, episode_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Episode not found")
+        engine = db.bind
+    finally:
+        # Release the pooled connection now; the shared feed opens a short session per poll.
+        await db.close()
+
+    generation, offset = _parse_script_event_id(request.headers.get("last-event-id", ""))
+    return StreamingResponse(
+        _script_event_stream(script_feed_hub.subscribe(engine, episode_id), generation, offset),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
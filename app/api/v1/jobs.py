@@ -1,20 +1,59 @@
 """Job API endpoints for phase 1."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
-from app.repositories.job_repository import get_job
+from app.api.responses import JSONAdapter
+from app.db.session import get_async_db
+from app.repositories.aio import cancel_job, get_job, list_jobs_page
+from app.repositories.pagination import InvalidCursorError
 from app.schemas.job import JobRead
+from app.schemas.pagination import CursorPage
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+JOB = JSONAdapter(JobRead)
+JOB_PAGE = JSONAdapter(CursorPage[JobRead])
+
+
+@router.get("", response_model=CursorPage[JobRead])
+async def list_jobs_endpoint(
+    cursor: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    status_filter: str | None = Query(None, alias="status"),
+    series_id: int | None = None,
+    theme_id: int | None = None,
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """Return jobs newest first, one keyset page at a time."""
+
+    try:
+        jobs, next_cursor = await list_jobs_page(
+            db, cursor=cursor, limit=limit, status=status_filter, series_id=series_id, theme_id=theme_id
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return JOB_PAGE.response({"items": jobs, "next_cursor": next_cursor})
+
 
 @router.get("/{job_id}", response_model=JobRead)
-def get_job_endpoint(job_id: int, db: Session = Depends(get_db)) -> JobRead:
+async def get_job_endpoint(job_id: int, db: AsyncSession = Depends(get_async_db)) -> Response:
     """Return current status of a background job."""
 
-    job = get_job(db, job_id)
+    job = await get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return JOB.response(job)
+
+
+@router.post("/{job_id}/cancel", response_model=JobRead)
+async def cancel_job_endpoint(job_id: int, db: AsyncSession = Depends(get_async_db)) -> Response:
+    """Cancel a queued or running job; a running job stops at its next stage boundary."""
+
+    job = await cancel_job(db, job_id)
+    if job:
+        return JOB.response(job)
+    job = await get_job(db, job_id)
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
-    return job
+    raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Job already {job.status}")
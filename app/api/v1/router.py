@@ -2,6 +2,7 @@
 
 from fastapi import APIRouter
 
+from app.api.v1.assets import router as assets_router
 from app.api.v1.characters import router as characters_router
 from app.api.v1.episodes import router as episodes_router
 from app.api.v1.jobs import router as jobs_router
@@ -14,3 +15,4 @@ api_router.include_router(characters_router)
 api_router.include_router(series_router)
 api_router.include_router(episodes_router)
 api_router.include_router(jobs_router)
+api_router.include_router(assets_router)
@@ -1,17 +1,25 @@
 """Story series API endpoints for phase 1."""
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
-from app.repositories.series_repository import list_series
+from app.api.responses import JSONAdapter
+from app.core.conditional import is_not_modified, not_modified, validator_headers
+from app.db.session import get_async_db
 from app.schemas.series import StorySeriesRead
+from app.services.catalog_service import get_series_list
 
 router = APIRouter(prefix="/series", tags=["series"])
 
+SERIES_LIST = JSONAdapter(list[StorySeriesRead])
+
 
 @router.get("", response_model=list[StorySeriesRead])
-def get_series_endpoint(db: Session = Depends(get_db)) -> list[StorySeriesRead]:
-    """Return all available story series."""
+async def get_series_endpoint(request: Request, db: AsyncSession = Depends(get_async_db)) -> Response:
+    """Return all available story series, or ``304`` if the client's copy is current."""
 
-    return list_series(db)
+    series = await get_series_list(db)
+    headers = validator_headers(series.etag, series.last_modified)
+    if is_not_modified(request, series.etag, series.last_modified):
+        return not_modified(headers)
+    return SERIES_LIST.response(series.items, headers=headers)
@@ -1,17 +1,25 @@
 """Theme API endpoints for phase 1."""
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
-from app.repositories.theme_repository import list_themes
+from app.api.responses import JSONAdapter
+from app.core.conditional import is_not_modified, not_modified, validator_headers
+from app.db.session import get_async_db
 from app.schemas.theme import ThemeRead
+from app.services import catalog_service
 
 router = APIRouter(prefix="/themes", tags=["themes"])
 
+THEME_LIST = JSONAdapter(list[ThemeRead])
+
 
 @router.get("", response_model=list[ThemeRead])
-def get_themes(db: Session = Depends(get_db)) -> list[ThemeRead]:
-    """Return all active story themes."""
+async def get_themes(request: Request, db: AsyncSession = Depends(get_async_db)) -> Response:
+    """Return all active story themes, or ``304`` if the client's copy is current."""
 
-    return list_themes(db)
+    themes = await catalog_service.get_theme_list(db)
+    headers = validator_headers(themes.etag, themes.last_modified)
+    if is_not_modified(request, themes.etag, themes.last_modified):
+        return not_modified(headers)
+    return THEME_LIST.response(themes.items, headers=headers)
@@ -0,0 +1,138 @@
+"""Content-addressed local blob store for media assets."""
+
+import hashlib
+import os
+import tempfile
+from collections.abc import AsyncIterable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+
+# Request body chunks are gathered up to this size before each threadpool write.
+WRITE_BUFFER_BYTES = 1024 * 1024
+
+
+class BlobTooLargeError(ValueError):
+    """Raised when a blob exceeds the configured maximum size."""
+
+
+class EmptyBlobError(ValueError):
+    """Raised when a blob has no content; nothing is stored."""
+
+
+@dataclass(frozen=True, slots=True)
+class StoredBlob:
+    """Digest and size of a blob that is now in the store."""
+
+    sha256: str
+    size_bytes: int
+
+
+class BlobStore:
+    """Store immutable blobs under their SHA-256, sharded as ``ab/cd/abcd...``.
+
+    Writes stream into a temp file inside the store while hashing, then the file is
+    atomically renamed into place, so a blob path either does not exist or holds
+    the complete content. Identical content is stored once.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int | None = None) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._tmp_dir = root / "tmp"
+
+    def path_for(self, sha256: str) -> Path:
+        """Return where the blob with ``sha256`` is (or would be) stored."""
+
+        if len(sha256) != 64 or not all(char in "0123456789abcdef" for char in sha256):
+            raise ValueError("Invalid SHA-256 digest")
+        return self.root / sha256[:2] / sha256[2:4] / sha256
+
+    def exists(self, sha256: str) -> bool:
+        """Return whether the blob is stored."""
+
+        return self.path_for(sha256).is_file()
+
+    def _open_temp(self) -> tuple[BinaryIO, Path]:
+        self._tmp_dir.mkdir(parents=True, exist_ok=True)
+        handle, name = tempfile.mkstemp(dir=self._tmp_dir, suffix=".part")
+        return os.fdopen(handle, "wb"), Path(name)
+
+    def _commit(self, temp_path: Path, sha256: str, size: int) -> StoredBlob:
+        if size == 0:
+            raise EmptyBlobError("Blob is empty")
+        target = self.path_for(sha256)
+        if target.exists():
+            temp_path.unlink(missing_ok=True)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(temp_path, target)
+        return StoredBlob(sha256=sha256, size_bytes=size)
+
+    def _check_size(self, size: int) -> None:
+        if self.max_bytes is not None and size > self.max_bytes:
+            raise BlobTooLargeError(f"Blob exceeds {self.max_bytes} bytes")
+
+    def write_chunks(self, chunks: Iterable[bytes]) -> StoredBlob:
+        """Store a blob from an iterable of byte chunks."""
+
+        file, temp_path = self._open_temp()
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with file:
+                for chunk in chunks:
+                    size += len(chunk)
+                    self._check_size(size)
+                    digest.update(chunk)
+                    file.write(chunk)
+            return self._commit(temp_path, digest.hexdigest(), size)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    async def write_stream(self, chunks: AsyncIterable[bytes]) -> StoredBlob:
+        """Store a blob from an async byte stream such as a request body.
+
+        Chunks are gathered into buffers of ``WRITE_BUFFER_BYTES`` that are hashed and
+        written in the threadpool, so large uploads never block the event loop and
+        are never held in memory as a whole.
+        """
+
+        file, temp_path = await run_in_threadpool(self._open_temp)
+        digest = hashlib.sha256()
+        buffer = bytearray()
+        size = 0
+
+        def append(data: bytes) -> None:
+            digest.update(data)
+            file.write(data)
+
+        try:
+            try:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    self._check_size(size)
+                    buffer += chunk
+                    if len(buffer) >= WRITE_BUFFER_BYTES:
+                        await run_in_threadpool(append, bytes(buffer))
+                        buffer.clear()
+                if buffer:
+                    await run_in_threadpool(append, bytes(buffer))
+            finally:
+                await run_in_threadpool(file.close)
+            return await run_in_threadpool(self._commit, temp_path, digest.hexdigest(), size)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=1)
+def get_blob_store() -> BlobStore:
+    """Return the process-wide blob store configured in settings."""
+
+    settings = get_settings()
+    return BlobStore(Path(settings.media_root), max_bytes=settings.media_max_upload_bytes)
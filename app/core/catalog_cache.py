@@ -0,0 +1,140 @@
+"""Versioned in-process read-through cache for catalog lists."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.config import get_settings
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheEntry:
+    version: int
+    expires_at: float
+    value: tuple[Any, ...]
+    validator: Any
+
+
+class CatalogCache:
+    """Cache small, rarely changing lists such as themes, characters and series.
+
+    Every name carries a version counter. ``invalidate`` bumps it, so an entry
+    loaded before the write, even one still in flight, is never served after it.
+    Memory is bounded by an LRU limit on the number of entries and by refusing to
+    store lists longer than ``max_items``; entries also expire after ``ttl_sec`` to
+    bound staleness across processes. A loader may return a validator, such as the
+    HTTP ETag of the data it read, which is stored and served with the list.
+    """
+
+    def __init__(self, *, ttl_sec: float, max_entries: int, max_items: int) -> None:
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def version(self, *names: str) -> tuple[int, ...]:
+        """Return the current version of each name."""
+
+        with self._lock:
+            return tuple(self._versions.get(name, 0) for name in names)
+
+    def lookup(self, name: str) -> tuple[tuple[Any, ...], Any] | None:
+        """Return the cached list for ``name`` and its validator when fresh, counting a hit or miss."""
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None or entry.version != self._versions.get(name, 0) or entry.expires_at <= now:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(name)
+            self.hits += 1
+            return entry.value, entry.validator
+
+    def get(self, name: str) -> tuple[Any, ...] | None:
+        """Return the cached list for ``name`` when it is fresh, counting a hit or miss."""
+
+        cached = self.lookup(name)
+        return None if cached is None else cached[0]
+
+    def put(self, name: str, value: Sequence[Any], version: int, validator: Any = None) -> None:
+        """Store ``value`` if it was loaded at the still-current ``version``."""
+
+        if len(value) > self.max_items:
+            return
+        with self._lock:
+            if version != self._versions.get(name, 0):
+                return
+            self._entries[name] = _CacheEntry(version, time.monotonic() + self.ttl_sec, tuple(value), validator)
+            self._entries.move_to_end(name)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    async def get_or_load(self, name: str, loader: Callable[[], Awaitable[Sequence[Any]]]) -> tuple[Any, ...]:
+        """Return the cached list for ``name``, loading and storing it on a miss."""
+
+        cached = self.get(name)
+        if cached is not None:
+            return cached
+        (version,) = self.version(name)
+        value = tuple(await loader())
+        self.put(name, value, version)
+        return value
+
+    async def get_or_load_validated(
+        self, name: str, loader: Callable[[], Awaitable[tuple[Sequence[Any], Any]]]
+    ) -> tuple[tuple[Any, ...], Any]:
+        """Return the cached list for ``name`` and its validator, loading both on a miss."""
+
+        cached = self.lookup(name)
+        if cached is not None:
+            return cached
+        (version,) = self.version(name)
+        value, validator = await loader()
+        value = tuple(value)
+        self.put(name, value, version, validator)
+        return value, validator
+
+    def invalidate(self, *names: str) -> None:
+        """Drop the given names and bump their versions."""
+
+        with self._lock:
+            for name in names:
+                self._versions[name] = self._versions.get(name, 0) + 1
+                self._entries.pop(name, None)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss and size counters."""
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
+
+
+settings = get_settings()
+catalog_cache = CatalogCache(
+    ttl_sec=settings.catalog_cache_ttl_sec,
+    max_entries=settings.catalog_cache_max_entries,
+    max_items=settings.catalog_cache_max_items,
+)
@@ -0,0 +1,19 @@
+"""Identify the client a request comes from for fair job scheduling."""
+
+from fastapi import Request
+
+CLIENT_KEY_HEADER = "X-Client-Key"
+CLIENT_KEY_MAX_LENGTH = 128
+
+
+def client_key(request: Request) -> str:
+    """Return the ``X-Client-Key`` header, else the client's address, else ``anonymous``.
+
+    Jobs are rotated between these keys, so API integrations should send a stable
+    key of their own instead of sharing an address behind a proxy.
+    """
+
+    key = request.headers.get(CLIENT_KEY_HEADER, "").strip()
+    if not key and request.client is not None:
+        key = request.client.host
+    return (key or "anonymous")[:CLIENT_KEY_MAX_LENGTH]
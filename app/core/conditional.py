@@ -0,0 +1,64 @@
+"""ETag and Last-Modified validators for conditional GET requests."""
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite returns naive timestamps; every stored timestamp is UTC.
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def version_tag(*parts: object) -> str:
+    """Return a strong ETag built from version parts such as ids, counts and timestamps."""
+
+    values = [
+        str(int(_as_utc(part).timestamp() * 1_000_000)) if isinstance(part, datetime) else str(part) for part in parts
+    ]
+    return f'"{"-".join(values)}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header value matches ``etag``."""
+
+    if if_none_match is None:
+        return False
+    candidates = [value.strip().removeprefix("W/") for value in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def validator_headers(etag: str, last_modified: datetime | None) -> dict[str, str]:
+    """Return the validator headers of a response that clients must revalidate before reuse."""
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None) -> bool:
+    """Return whether the client's cached copy is current.
+
+    ``If-None-Match`` takes precedence; ``If-Modified-Since`` is only consulted
+    without it, at the one-second resolution of HTTP dates.
+    """
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    """Return an empty ``304 Not Modified`` response carrying the validators."""
+
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
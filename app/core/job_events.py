@@ -0,0 +1,238 @@
+"""In-process fan-out of job state changes for Server-Sent Events viewers."""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+
+import psycopg
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.models.job import JOB_TERMINAL_STATUSES, Job
+
+logger = logging.getLogger(__name__)
+
+JOB_EVENTS_CHANNEL = "job_events"
+
+
+@dataclass(frozen=True, slots=True)
+class JobEvent:
+    """Snapshot of the job fields shown to viewers."""
+
+    id: int
+    episode_id: int
+    status: str
+    progress_pct: int
+    step: str
+    error_message: str | None = None
+
+    @property
+    def is_terminal(self) -> bool:
+        """Return whether no further state changes will follow."""
+
+        return self.status in JOB_TERMINAL_STATUSES
+
+    @classmethod
+    def from_job(cls, job: Job) -> "JobEvent":
+        """Build an event from a loaded job row."""
+
+        return cls(
+            id=job.id,
+            episode_id=job.episode_id,
+            status=job.status,
+            progress_pct=job.progress_pct,
+            step=job.step,
+            error_message=job.error_message,
+        )
+
+    def to_json(self) -> str:
+        """Serialize the event for a PostgreSQL NOTIFY payload."""
+
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, payload: str) -> "JobEvent":
+        """Parse an event from a NOTIFY payload."""
+
+        return cls(**json.loads(payload))
+
+
+class JobSubscription:
+    """Latest-state mailbox for one viewer of one job.
+
+    Only the newest event is kept: a slow viewer skips intermediate progress ticks
+    but always ends on the latest (and therefore terminal) state.
+    """
+
+    def __init__(self, broker: "JobEventBroker", job_id: int) -> None:
+        self.job_id = job_id
+        self._broker = broker
+        self._loop = asyncio.get_running_loop()
+        self._latest: JobEvent | None = None
+        self._ready = asyncio.Event()
+
+    def push(self, event: JobEvent) -> None:
+        """Deliver an event from any thread."""
+
+        try:
+            self._loop.call_soon_threadsafe(self._deliver, event)
+        except RuntimeError:
+            # The viewer's event loop is already closed.
+            pass
+
+    def _deliver(self, event: JobEvent) -> None:
+        self._latest = event
+        self._ready.set()
+
+    async def next_event(self) -> JobEvent:
+        """Wait for and return the newest undelivered event."""
+
+        await self._ready.wait()
+        self._ready.clear()
+        assert self._latest is not None
+        return self._latest
+
+    def close(self) -> None:
+        """Stop receiving events."""
+
+        self._broker.unsubscribe(self)
+
+
+class JobEventBroker:
+    """Route job events to the subscriptions of this process.
+
+    Updates made in this process are published directly by the repository. Updates
+    made by workers in other processes arrive through a relay task that runs only
+    while there are viewers: ``LISTEN`` on PostgreSQL, or one shared query per poll
+    interval for all watched jobs on other databases. Whenever the relay (re)starts
+    listening it publishes the current state of every watched job, since changes
+    made before that are never notified; a failed relay is restarted with
+    exponential backoff while viewers remain.
+    """
+
+    def __init__(
+        self, poll_interval_sec: float = 1.0, retry_backoff_sec: float = 1.0, retry_backoff_max_sec: float = 30.0
+    ) -> None:
+        self.poll_interval_sec = poll_interval_sec
+        self.retry_backoff_sec = retry_backoff_sec
+        self.retry_backoff_max_sec = retry_backoff_max_sec
+        self._lock = threading.Lock()
+        self._subscriptions: dict[int, set[JobSubscription]] = defaultdict(set)
+        self._relay: asyncio.Task[None] | None = None
+        self._relay_engine: AsyncEngine | None = None
+
+    def subscribe(self, job_id: int) -> JobSubscription:
+        """Register a viewer for one job; must be called from the viewer's event loop."""
+
+        subscription = JobSubscription(self, job_id)
+        with self._lock:
+            self._subscriptions[job_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: JobSubscription) -> None:
+        """Remove a viewer registration."""
+
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.job_id)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.job_id]
+
+    def subscribed_job_ids(self) -> list[int]:
+        """Return the ids of all jobs that currently have viewers."""
+
+        with self._lock:
+            return list(self._subscriptions)
+
+    def publish(self, event: JobEvent) -> None:
+        """Push an event to every viewer of its job."""
+
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(event.id, ()))
+        for subscription in subscriptions:
+            subscription.push(event)
+
+    def ensure_relay(self, engine: AsyncEngine) -> None:
+        """Start the cross-process relay task on the running loop unless one is active."""
+
+        loop = asyncio.get_running_loop()
+        relay = self._relay
+        if relay is not None and relay.get_loop() is loop and not relay.done() and self._relay_engine is engine:
+            return
+        if relay is not None and relay.get_loop() is loop:
+            relay.cancel()
+        self._start_relay(loop, engine)
+
+    def _start_relay(self, loop: asyncio.AbstractEventLoop, engine: AsyncEngine) -> None:
+        self._relay_engine = engine
+        self._relay = loop.create_task(self._run_relay(engine))
+        self._relay.add_done_callback(self._relay_finished)
+
+    def _relay_finished(self, relay: "asyncio.Task[None]") -> None:
+        # A viewer that subscribed after the relay last saw no viewers, but before the task
+        # finished, found it still running in ensure_relay; restart the relay for them.
+        if relay is not self._relay or relay.cancelled():
+            return
+        if self.subscribed_job_ids() and self._relay_engine is not None:
+            self._start_relay(relay.get_loop(), self._relay_engine)
+
+    async def _run_relay(self, engine: AsyncEngine) -> None:
+        """Forward job changes made by other processes until no viewers are left."""
+
+        failures = 0
+        while self.subscribed_job_ids():
+            try:
+                if engine.dialect.name == "postgresql":
+                    await self._listen(engine)
+                else:
+                    await self._poll(engine)
+                return
+            except Exception:
+                delay = min(self.retry_backoff_max_sec, self.retry_backoff_sec * 2**failures)
+                failures += 1
+                logger.exception("Job event relay failed; restarting in %.1fs", delay)
+                await asyncio.sleep(delay)
+
+    async def _publish_current(self, engine: AsyncEngine) -> None:
+        """Publish the current state of every watched job with one query."""
+
+        job_ids = self.subscribed_job_ids()
+        if not job_ids:
+            return
+        async with AsyncSession(engine) as db:
+            jobs = (await db.scalars(select(Job).where(Job.id.in_(job_ids)))).all()
+        for job in jobs:
+            self.publish(JobEvent.from_job(job))
+
+    async def _listen(self, engine: AsyncEngine) -> None:
+        conninfo = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        async with await psycopg.AsyncConnection.connect(conninfo, autocommit=True) as connection:
+            await connection.execute(f"LISTEN {JOB_EVENTS_CHANNEL}")
+            # A viewer may have read its job before LISTEN was active; changes since then were not notified.
+            await self._publish_current(engine)
+            while self.subscribed_job_ids():
+                async for notify in connection.notifies(timeout=self.poll_interval_sec):
+                    self.publish(JobEvent.from_json(notify.payload))
+
+    async def _poll(self, engine: AsyncEngine) -> None:
+        last_seen: dict[int, JobEvent] = {}
+        while True:
+            await asyncio.sleep(self.poll_interval_sec)
+            job_ids = self.subscribed_job_ids()
+            if not job_ids:
+                return
+            async with AsyncSession(engine) as db:
+                jobs = (await db.scalars(select(Job).where(Job.id.in_(job_ids)))).all()
+            for job in jobs:
+                event = JobEvent.from_job(job)
+                if last_seen.get(job.id) != event:
+                    last_seen[job.id] = event
+                    self.publish(event)
+
+
+job_event_broker = JobEventBroker()
@@ -0,0 +1,188 @@
+"""Per-request SQL instrumentation and Prometheus text exposition."""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Engine, event
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+
+class Histogram:
+    """Cumulative Prometheus histogram keyed by a fixed tuple of label values."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], buckets: Sequence[float]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, labels: tuple[str, ...], value: float) -> None:
+        """Record one observation."""
+
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0.0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, labels: tuple[str, ...]) -> int:
+        """Return the number of observations recorded for ``labels``."""
+
+        with self._lock:
+            series = self._series.get(labels)
+            return int(sum(series[:-1])) if series else 0
+
+    def sum(self, labels: tuple[str, ...]) -> float:
+        """Return the sum of observations recorded for ``labels``."""
+
+        with self._lock:
+            series = self._series.get(labels)
+            return series[-1] if series else 0.0
+
+    def clear(self) -> None:
+        """Drop all recorded observations."""
+
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> list[str]:
+        """Return the exposition lines of this histogram."""
+
+        with self._lock:
+            snapshot = {labels: list(series) for labels, series in self._series.items()}
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(snapshot.items()):
+            pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, labels)]
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, "+Inf"), series[:-1]):
+                cumulative += count
+                le = bound if isinstance(bound, str) else _format_number(bound)
+                bucket_labels = ",".join([*pairs, f'le="{le}"'])
+                lines.append(f"{self.name}_bucket{{{bucket_labels}}} {_format_number(cumulative)}")
+            label_block = f"{{{','.join(pairs)}}}" if pairs else ""
+            lines.append(f"{self.name}_sum{label_block} {_format_number(series[-1])}")
+            lines.append(f"{self.name}_count{label_block} {_format_number(cumulative)}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+REQUEST_LABELS = ("method", "route")
+
+request_duration = Histogram(
+    "http_request_duration_seconds", "Total request latency.", REQUEST_LABELS, LATENCY_BUCKETS
+)
+request_db_duration = Histogram(
+    "http_request_db_duration_seconds", "Time spent executing SQL per request.", REQUEST_LABELS, LATENCY_BUCKETS
+)
+request_db_statements = Histogram(
+    "http_request_db_statements", "SQL statements executed per request.", REQUEST_LABELS, STATEMENT_BUCKETS
+)
+HISTOGRAMS = (request_duration, request_db_duration, request_db_statements)
+
+
+def render_metrics() -> str:
+    """Return all metrics in the Prometheus text exposition format."""
+
+    return "\n".join(line for histogram in HISTOGRAMS for line in histogram.render()) + "\n"
+
+
+def reset_metrics() -> None:
+    """Drop all recorded observations."""
+
+    for histogram in HISTOGRAMS:
+        histogram.clear()
+
+
+@dataclass(slots=True)
+class RequestStats:
+    """SQL activity accumulated while serving one request."""
+
+    statements: int = 0
+    db_time_sec: float = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach statement timing hooks to a (sync) engine.
+
+    For async engines pass ``async_engine.sync_engine``; ``run_sync`` and driver
+    calls share the request's context, so their statements are attributed to it.
+    Statements outside a request (workers, scripts) only feed the slow-query log.
+    """
+
+    threshold_ms = get_settings().slow_query_threshold_ms
+    slow_after = threshold_ms / 1000 if threshold_ms is not None else None
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        conn.info["query_started_at"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _stop_timer(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        elapsed = time.perf_counter() - conn.info.pop("query_started_at", time.perf_counter())
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.db_time_sec += elapsed
+        if slow_after is not None and elapsed >= slow_after:
+            logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, " ".join(statement.split()))
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, DB time and statement count per route.
+
+    Requests are labelled with the matched route template (e.g.
+    ``/api/v1/jobs/{job_id}``) so label cardinality stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            _request_stats.reset(token)
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            labels = (scope["method"], route)
+            request_duration.observe(labels, elapsed)
+            request_db_duration.observe(labels, stats.db_time_sec)
+            request_db_statements.observe(labels, stats.statements)
+
@@ -0,0 +1,116 @@
+"""Shared polling of streamed episode scripts for Server-Sent Events viewers."""
+
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.config import get_settings
+from app.models.job import JOB_ACTIVE_STATUSES
+from app.repositories.aio import get_episode_script_tail
+
+logger = logging.getLogger(__name__)
+
+
+class ScriptFeed:
+    """The script of one episode as last read by its shared poll.
+
+    ``text`` is the whole script of ``generation``; viewers copy out the part past
+    their own offset. ``version`` counts the reads that changed anything, so a
+    viewer can wait for the next change without missing one. A ``closed`` feed gets
+    no more updates because the episode is gone or the poll failed.
+    """
+
+    def __init__(self, episode_id: int) -> None:
+        self.episode_id = episode_id
+        self.generation: int | None = None
+        self.text = ""
+        self.job_status: str | None = None
+        self.closed = False
+        self.version = 0
+        self.viewers = 0
+        self._changed = asyncio.Condition()
+
+    @property
+    def finished(self) -> bool:
+        """Return whether the job is done, so the script will not change any more."""
+
+        return not self.closed and self.version > 0 and self.job_status not in JOB_ACTIVE_STATUSES
+
+    async def wait_for_change(self, seen_version: int) -> int:
+        """Wait until the feed is newer than ``seen_version`` and return its version."""
+
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.version != seen_version)
+            return self.version
+
+    async def update(self, loaded: tuple[int, str, str | None] | None) -> None:
+        """Apply one read of the script and wake the viewers if anything changed."""
+
+        async with self._changed:
+            if loaded is None:
+                self.closed = True
+            else:
+                generation, text, job_status = loaded
+                if generation != self.generation:
+                    self.generation, self.text = generation, text
+                elif not text and job_status == self.job_status and self.version > 0:
+                    return
+                else:
+                    self.text += text
+                self.job_status = job_status
+            self.version += 1
+            self._changed.notify_all()
+
+
+class ScriptFeedHub:
+    """Run one poll per watched episode and share it between all of its viewers.
+
+    A feed and its poll task exist only while the episode has viewers and its job is
+    active, so the database sees one short query per episode and poll interval
+    however many clients follow the script.
+    """
+
+    def __init__(self) -> None:
+        self._feeds: dict[tuple[asyncio.AbstractEventLoop, int], ScriptFeed] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def subscribe(self, engine: AsyncEngine, episode_id: int) -> ScriptFeed:
+        """Return the running feed of ``episode_id``, starting its poll if needed."""
+
+        loop = asyncio.get_running_loop()
+        feed = self._feeds.get((loop, episode_id))
+        if feed is None:
+            feed = self._feeds[(loop, episode_id)] = ScriptFeed(episode_id)
+            task = loop.create_task(self._poll(engine, loop, feed))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        feed.viewers += 1
+        return feed
+
+    def unsubscribe(self, feed: ScriptFeed) -> None:
+        """Drop a viewer; the poll stops once the feed has none."""
+
+        feed.viewers -= 1
+
+    async def _poll(self, engine: AsyncEngine, loop: asyncio.AbstractEventLoop, feed: ScriptFeed) -> None:
+        try:
+            while feed.viewers > 0:
+                async with AsyncSession(engine) as db:
+                    loaded = await get_episode_script_tail(
+                        db, feed.episode_id, generation=feed.generation, offset=len(feed.text)
+                    )
+                await feed.update(loaded)
+                if feed.closed or feed.finished:
+                    return
+                await asyncio.sleep(get_settings().script_stream_poll_interval_sec)
+        except Exception:
+            logger.exception("Script poll of episode %s stopped unexpectedly", feed.episode_id)
+            await feed.update(None)
+        finally:
+            # Later viewers start a new poll instead of joining one that has ended.
+            if self._feeds.get((loop, feed.episode_id)) is feed:
+                del self._feeds[(loop, feed.episode_id)]
+
+
+script_feed_hub = ScriptFeedHub()
@@ -1,8 +1,19 @@
 """SQLAlchemy declarative base for all ORM models."""
 
+from datetime import datetime, timezone
+
 from sqlalchemy.orm import DeclarativeBase
 
 
 class Base(DeclarativeBase):
     """Base class used by all ORM models."""
 
+
+def utcnow() -> datetime:
+    """Return the current time in UTC.
+
+    Used for ``updated_at`` columns that feed HTTP validators: set in Python, the
+    value keeps microsecond precision even on SQLite, whose ``now()`` has seconds.
+    """
+
+    return datetime.now(timezone.utc)
@@ -1,23 +1,55 @@
 """Database engine and session helpers."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import get_settings
+from app.core.metrics import instrument_engine
 
 settings = get_settings()
 
+ASYNC_DRIVERS = {"postgresql": "psycopg", "sqlite": "aiosqlite"}
+
+
+def async_database_url(url: str) -> str:
+    """Return ``url`` rewritten to use the async driver of its backend."""
+
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for database backend '{parsed.get_backend_name()}'")
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+
 engine = create_engine(settings.database_url, pool_pre_ping=True)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
 
+async_engine = create_async_engine(
+    settings.database_async_url or async_database_url(settings.database_url),
+    pool_pre_ping=True,
+)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+if settings.metrics_enabled:
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
+
 
 def get_db() -> Generator[Session, None, None]:
-    """Yield a database session for request-scoped usage."""
+    """Yield a database session for scripts and worker code."""
 
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield an async database session for request-scoped usage."""
+
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,18 +1,34 @@
 """FastAPI application entrypoint."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
 
 from app.api.v1.router import api_router
+from app.core.catalog_cache import catalog_cache
 from app.core.config import get_settings
-from app.web.routes import router as web_router
+from app.core.metrics import PROMETHEUS_CONTENT_TYPE, MetricsMiddleware, render_metrics
+from app.web.routes import precompile_templates, router as web_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Compile every template at startup rather than on the first request or at import."""
+
+    precompile_templates()
+    yield
 
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI app."""
 
     settings = get_settings()
-    app = FastAPI(title=settings.app_name)
+    app = FastAPI(title=settings.app_name, lifespan=lifespan)
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
 
     app.mount("/static", StaticFiles(directory="app/static"), name="static")
     app.include_router(web_router)
@@ -24,6 +40,18 @@ def create_app() -> FastAPI:
 
         return {"status": "ok"}
 
+    @app.get("/health/cache")
+    def cache_stats() -> dict[str, int]:
+        """Return catalog cache hit and miss counters."""
+
+        return catalog_cache.stats()
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics() -> Response:
+        """Return request and SQL metrics in the Prometheus text format."""
+
+        return Response(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
     return app
 
 
@@ -2,8 +2,23 @@
 
 from app.models.character import Character
 from app.models.episode import Episode, EpisodeCharacter
+from app.models.idempotency_key import IdempotencyKey
 from app.models.job import Job
+from app.models.media_asset import MediaAsset
+from app.models.story_context import StoryContext
 from app.models.story_series import StorySeries
 from app.models.theme import Theme
+from app.models.theme_knowledge import ThemeKnowledge
 
-__all__ = ["Character", "Episode", "EpisodeCharacter", "Job", "StorySeries", "Theme"]
+__all__ = [
+    "Character",
+    "Episode",
+    "EpisodeCharacter",
+    "IdempotencyKey",
+    "Job",
+    "MediaAsset",
+    "StoryContext",
+    "StorySeries",
+    "Theme",
+    "ThemeKnowledge",
+]
@@ -2,10 +2,10 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, utcnow
 
 
 class Episode(Base):
@@ -20,13 +20,23 @@ class Episode(Base):
     user_prompt: Mapped[str] = mapped_column(Text, nullable=False)
     theme_id: Mapped[int] = mapped_column(ForeignKey("themes.id", ondelete="RESTRICT"), nullable=False)
     continuation_from_episode_id: Mapped[int | None] = mapped_column(
-        ForeignKey("episodes.id", ondelete="SET NULL"), nullable=True
+        ForeignKey("episodes.id", ondelete="SET NULL"), nullable=True, index=True
     )
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     script_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Bumped whenever script_text is replaced rather than appended to, so stream offsets of an older
+    # script are recognised as stale.
+    script_generation: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    # The status and script the episode had before its current generation started, restored when that
+    # generation fails; both are cleared once it ends.
+    status_before_generation: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    script_before_generation: Mapped[str | None] = mapped_column(Text, nullable=True)
     target_duration_sec: Mapped[int] = mapped_column(Integer, nullable=False, default=15, server_default="15")
     status: Mapped[str] = mapped_column(String(32), nullable=False, default="draft", server_default="draft")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), default=utcnow, onupdate=utcnow
+    )
 
     series = relationship("StorySeries", back_populates="episodes")
     theme = relationship("Theme")
@@ -34,7 +44,13 @@ class Episode(Base):
     characters = relationship("EpisodeCharacter", back_populates="episode", cascade="all, delete-orphan")
     jobs = relationship("Job", back_populates="episode", cascade="all, delete-orphan")
 
-    __table_args__ = (UniqueConstraint("series_id", "episode_number", name="uq_episode_series_number"),)
+    __table_args__ = (
+        UniqueConstraint("series_id", "episode_number", name="uq_episode_series_number"),
+        Index("ix_episodes_created_at_id", "created_at", "id"),
+        Index("ix_episodes_series_id_created_at_id", "series_id", "created_at", "id"),
+        Index("ix_episodes_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_episodes_theme_id_created_at_id", "theme_id", "created_at", "id"),
+    )
 
 
 class EpisodeCharacter(Base):
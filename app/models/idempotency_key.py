@@ -0,0 +1,33 @@
+"""Idempotency key model for safely retried creation requests."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class IdempotencyKey(Base):
+    """Result of the first request sent with a client-chosen ``Idempotency-Key``.
+
+    Keys are scoped to the ``client_key`` that sent them, so one client can never
+    replay another client's request. The row is inserted in the same transaction
+    as the episode and job it points to, so it exists exactly when they do. After
+    ``expires_at`` the key may be reused for a new request.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    client_key: Mapped[str] = mapped_column(
+        String(128), nullable=False, default="anonymous", server_default="anonymous"
+    )
+    key: Mapped[str] = mapped_column(String(255), nullable=False)
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    episode_id: Mapped[int | None] = mapped_column(ForeignKey("episodes.id", ondelete="CASCADE"), nullable=True)
+    job_id: Mapped[int | None] = mapped_column(ForeignKey("jobs.id", ondelete="CASCADE"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+
+    __table_args__ = (UniqueConstraint("client_key", "key", name="uq_idempotency_keys_client_key_key"),)
@@ -2,27 +2,65 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
 
+JOB_ACTIVE_STATUSES = ("queued", "running")
+JOB_TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+# Claim order: higher priorities first, so web form users are not queued behind bulk API backfills.
+JOB_PRIORITY_INTERACTIVE = 20
+JOB_PRIORITY_DEFAULT = 10
+JOB_PRIORITY_BATCH = 0
+
+# Failure messages are stored for display; exception texts can be arbitrarily long.
+JOB_ERROR_MESSAGE_MAX_CHARS = 2000
+
 
 class Job(Base):
-    """Background task state for an episode pipeline run."""
+    """Background task state for an episode pipeline run.
+
+    ``fair_rank`` orders the queued jobs of one priority across clients: each new
+    job of a client ranks after that client's queued jobs but never before the head
+    of the queue, so workers round-robin between clients instead of draining one
+    client's backlog first.
+
+    A running job's worker renews ``lease_expires_at`` with periodic heartbeats; a
+    job whose lease ran out belongs to a dead worker and is re-queued by the reaper.
+    """
 
     __tablename__ = "jobs"
 
     id: Mapped[int] = mapped_column(primary_key=True)
     episode_id: Mapped[int] = mapped_column(ForeignKey("episodes.id", ondelete="CASCADE"), nullable=False, index=True)
-    type: Mapped[str] = mapped_column(String(64), nullable=False, default="phase1_stub", server_default="phase1_stub")
+    type: Mapped[str] = mapped_column(String(64), nullable=False, default="episode_pipeline", server_default="episode_pipeline")
     status: Mapped[str] = mapped_column(String(32), nullable=False, default="queued", server_default="queued")
     progress_pct: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     step: Mapped[str] = mapped_column(String(128), nullable=False, default="queued", server_default="queued")
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    worker_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    cache_bypass: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default="false")
+    priority: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=JOB_PRIORITY_DEFAULT, server_default=str(JOB_PRIORITY_DEFAULT)
+    )
+    client_key: Mapped[str] = mapped_column(String(128), nullable=False, default="anonymous", server_default="anonymous")
+    fair_rank: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
 
     episode = relationship("Episode", back_populates="jobs")
+
+    __table_args__ = (
+        Index("ix_jobs_status_priority_fair_rank_id", "status", text("priority DESC"), "fair_rank", "id"),
+        Index("ix_jobs_status_fair_rank", "status", "fair_rank"),
+        Index("ix_jobs_status_client_key_fair_rank", "status", "client_key", "fair_rank"),
+        Index("ix_jobs_status_lease_expires_at", "status", "lease_expires_at"),
+        Index("ix_jobs_created_at_id", "created_at", "id"),
+        Index("ix_jobs_status_created_at_id", "status", "created_at", "id"),
+    )
@@ -0,0 +1,27 @@
+"""Memoized story-so-far context of an episode's continuation chain."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class StoryContext(Base):
+    """Compacted summaries of an episode and all its ancestors, oldest first.
+
+    Rows are derived data: they are deleted whenever the summary of the episode or
+    of any ancestor changes and rebuilt on the next read. ``chain_length`` and
+    ``chain_updated_at`` record the state of the chain the text was built from; a
+    row is only served while they still match, so a context computed from a chain
+    that changed during the load is never used.
+    """
+
+    __tablename__ = "story_contexts"
+
+    episode_id: Mapped[int] = mapped_column(ForeignKey("episodes.id", ondelete="CASCADE"), primary_key=True)
+    context_text: Mapped[str] = mapped_column(Text, nullable=False)
+    chain_length: Mapped[int] = mapped_column(Integer, nullable=False)
+    chain_updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -0,0 +1,26 @@
+"""Theme knowledge passages retrieved by the RAG stage."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+
+class ThemeKnowledge(Base):
+    """One source passage (e.g. a book excerpt) that gives insight into a theme.
+
+    Embeddings are not stored in the database; they live in the per-theme vector
+    index built from these rows (see ``app/rag``).
+    """
+
+    __tablename__ = "theme_knowledge"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    theme_id: Mapped[int] = mapped_column(ForeignKey("themes.id", ondelete="CASCADE"), nullable=False, index=True)
+    source_text: Mapped[str] = mapped_column(Text, nullable=False)
+    source_ref: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    theme = relationship("Theme")
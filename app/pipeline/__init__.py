@@ -0,0 +1,23 @@
+"""Episode generation pipeline exports."""
+
+from app.pipeline.engine import Pipeline, PipelineCancelledError, PipelineError, PipelineTimeoutError, Stage
+from app.pipeline.executor import (
+    create_stage_executor,
+    get_stage_executor,
+    lease_stage_executor,
+    replace_stage_executor,
+)
+from app.pipeline.stages import build_episode_pipeline
+
+__all__ = [
+    "Pipeline",
+    "PipelineCancelledError",
+    "PipelineError",
+    "PipelineTimeoutError",
+    "Stage",
+    "build_episode_pipeline",
+    "create_stage_executor",
+    "get_stage_executor",
+    "lease_stage_executor",
+    "replace_stage_executor",
+]
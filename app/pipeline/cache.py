@@ -0,0 +1,171 @@
+"""Content-addressed cache for generated episode text."""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from app.core.config import get_settings
+
+# Fraction of the disk budget kept after an eviction pass, so passes stay infrequent.
+DISK_EVICTION_TARGET = 0.9
+
+
+def generation_cache_key(
+    *,
+    user_prompt: str,
+    theme: Mapping[str, Any],
+    characters: Sequence[Mapping[str, Any]],
+    target_duration_sec: int,
+    story_context: str | None,
+    knowledge_version: str | None,
+    model_version: str,
+) -> str:
+    """Return the SHA-256 hex key of a generation request.
+
+    The key covers the resolved inputs the stages see rather than row ids: the
+    theme's text, every character's name, speech style and description, the story
+    context and the generation of the theme's knowledge index. Editing a theme or
+    character, or rebuilding the index, therefore yields a new key. The prompt's
+    whitespace is normalized and characters are sorted, so equivalent submissions
+    share one key.
+    """
+
+    payload = {
+        "user_prompt": " ".join(user_prompt.split()),
+        "theme": dict(theme),
+        "characters": sorted(json.dumps(character, sort_keys=True) for character in characters),
+        "target_duration_sec": target_duration_sec,
+        "story_context": story_context,
+        "knowledge_version": knowledge_version,
+        "model_version": model_version,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+class GenerationCache:
+    """Two-tier cache of generation results: an in-memory LRU over a disk store.
+
+    Disk entries are JSON files sharded by key prefix and written through a temp
+    file plus ``os.replace``, so concurrent workers never read a partial entry.
+    Reads refresh a file's modification time; when the store exceeds
+    ``disk_max_bytes`` the least recently used files are deleted.
+    """
+
+    def __init__(self, directory: Path, *, memory_entries: int, disk_max_bytes: int) -> None:
+        self.directory = directory
+        self.memory_entries = memory_entries
+        self.disk_max_bytes = disk_max_bytes
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._disk_bytes: int | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached value of ``key`` from memory or disk, if any."""
+
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+        path = self._path(key)
+        try:
+            value = json.loads(path.read_bytes())
+            os.utime(path)
+        except (FileNotFoundError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: dict[str, Any]) -> None:
+        """Store ``value`` in both tiers, evicting old disk entries over budget."""
+
+        with self._lock:
+            self._remember(key, value)
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(value, separators=(",", ":")).encode()
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_bytes()
+            else:
+                self._disk_bytes += len(data)
+            over_budget = self._disk_bytes > self.disk_max_bytes
+        if over_budget:
+            self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used disk entries until under the eviction target."""
+
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        target = self.disk_max_bytes * DISK_EVICTION_TARGET
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        with self._lock:
+            self._disk_bytes = total
+
+    def clear(self) -> None:
+        """Drop the in-memory tier and reset counters; disk entries are kept."""
+
+        with self._lock:
+            self._memory.clear()
+            self._disk_bytes = None
+            self.hits = 0
+            self.misses = 0
+
+    def _remember(self, key: str, value: dict[str, Any]) -> None:
+        """Insert into the memory tier; caller holds the lock."""
+
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _scan_disk_bytes(self) -> int:
+        total = 0
+        for path in self.directory.glob("*/*.json"):
+            try:
+                total += path.stat().st_size
+            except FileNotFoundError:
+                continue
+        return total
+
+
+@lru_cache(maxsize=1)
+def get_generation_cache() -> GenerationCache:
+    """Return the process-wide generation cache configured in settings."""
+
+    settings = get_settings()
+    return GenerationCache(
+        Path(settings.generation_cache_dir),
+        memory_entries=settings.generation_cache_memory_entries,
+        disk_max_bytes=settings.generation_cache_max_bytes,
+    )
@@ -0,0 +1,198 @@
+"""Dependency-graph executor for episode generation stages."""
+
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass
+from typing import Any
+
+StageFunction = Callable[[dict[str, Any]], Mapping[str, Any]]
+ProgressCallback = Callable[[str, float], None]
+StopCallback = Callable[[], bool]
+
+# How often a run looks for queued stages that have started, since their timeouts run from the start.
+STAGE_START_POLL_SEC = 0.05
+
+
+@dataclass(frozen=True, slots=True)
+class Stage:
+    """One unit of work that maps named inputs to named outputs.
+
+    ``run`` receives a dict holding exactly the declared ``inputs`` and must return
+    every declared output. It is submitted to an executor, so for process pools it
+    must be a picklable module-level function. ``weight`` is the stage's share of
+    the job's progress bar; ``timeout_sec``, if set, bounds the stage's wall-clock
+    time from the moment an executor worker starts it, so time spent queued behind
+    other jobs' stages does not count.
+    """
+
+    name: str
+    run: StageFunction
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    weight: float = 1.0
+    timeout_sec: float | None = None
+
+
+class PipelineError(RuntimeError):
+    """Raised when a pipeline graph is invalid or a stage fails.
+
+    ``abandoned`` names the stages a timed-out or cancelled run left running on the
+    executor; they still occupy a worker of it until they return.
+    """
+
+    def __init__(self, message: str, stage: str | None = None, *, abandoned: tuple[str, ...] = ()) -> None:
+        super().__init__(message)
+        self.stage = stage
+        self.abandoned = abandoned
+
+
+class PipelineTimeoutError(PipelineError):
+    """Raised when a stage or the whole run exceeds its time limit."""
+
+
+class PipelineCancelledError(PipelineError):
+    """Raised when a run is stopped by its ``should_stop`` callback."""
+
+
+class Pipeline:
+    """Run stages as soon as their inputs exist, independent stages concurrently.
+
+    The graph is derived from the stages' declared inputs and outputs and is
+    validated on construction: every output has one producer, every input is
+    either produced by a stage or listed in ``initial_inputs``, and there are no
+    cycles. Wall-clock time is therefore the critical path of the graph rather
+    than the sum of all stages.
+    """
+
+    def __init__(self, stages: Iterable[Stage], *, initial_inputs: Iterable[str] = ()) -> None:
+        self.stages = tuple(stages)
+        self.initial_inputs = frozenset(initial_inputs)
+        self._producers: dict[str, str] = {}
+        for stage in self.stages:
+            for output in stage.outputs:
+                if output in self._producers or output in self.initial_inputs:
+                    raise PipelineError(f"Output '{output}' is produced more than once", stage.name)
+                self._producers[output] = stage.name
+        for stage in self.stages:
+            missing = [name for name in stage.inputs if name not in self._producers and name not in self.initial_inputs]
+            if missing:
+                raise PipelineError(f"Stage '{stage.name}' needs unknown inputs {missing}", stage.name)
+        self.order = self._topological_order()
+        self.total_weight = sum(stage.weight for stage in self.stages) or 1.0
+
+    def _topological_order(self) -> tuple[str, ...]:
+        """Return stage names in a dependency-respecting order, rejecting cycles."""
+
+        available = set(self.initial_inputs)
+        remaining = {stage.name: stage for stage in self.stages}
+        order: list[str] = []
+        while remaining:
+            ready = [stage for stage in remaining.values() if available.issuperset(stage.inputs)]
+            if not ready:
+                raise PipelineError(f"Stages {sorted(remaining)} form a dependency cycle")
+            for stage in ready:
+                order.append(stage.name)
+                available.update(stage.outputs)
+                del remaining[stage.name]
+        return tuple(order)
+
+    def run(
+        self,
+        inputs: Mapping[str, Any],
+        executor: Executor,
+        on_progress: ProgressCallback | None = None,
+        *,
+        timeout_sec: float | None = None,
+        should_stop: StopCallback | None = None,
+    ) -> dict[str, Any]:
+        """Execute the graph on ``executor`` and return all initial and produced values.
+
+        ``on_progress(stage_name, fraction)`` is called from this thread after each
+        stage completes, with the completed share of the total stage weight. The
+        first failing stage cancels stages that have not started yet and raises
+        ``PipelineError`` chained to the original exception.
+
+        ``should_stop()`` is checked after every completed stage and raises
+        ``PipelineCancelledError`` when it returns true. A stage running past its
+        ``timeout_sec``, or the run past ``timeout_sec``, raises
+        ``PipelineTimeoutError``. In both cases the call returns at once instead of
+        waiting for running stages, which finish in the background and are discarded;
+        the error's ``abandoned`` lists them.
+        """
+
+        missing = self.initial_inputs.difference(inputs)
+        if missing:
+            raise PipelineError(f"Missing initial inputs {sorted(missing)}")
+        values = dict(inputs)
+        pending = {stage.name: stage for stage in self.stages}
+        running: dict[Future[Mapping[str, Any]], Stage] = {}
+        deadlines: dict[Future[Mapping[str, Any]], float] = {}
+        run_deadline = time.monotonic() + timeout_sec if timeout_sec is not None else None
+        completed_weight = 0.0
+
+        def submit_ready() -> None:
+            for stage in [stage for stage in pending.values() if all(name in values for name in stage.inputs)]:
+                del pending[stage.name]
+                future = executor.submit(stage.run, {name: values[name] for name in stage.inputs})
+                running[future] = stage
+
+        def start_deadlines(now: float) -> bool:
+            # Starts the timeout of every stage a worker picked up; returns whether one is still queued.
+            queued = False
+            for future, stage in running.items():
+                if stage.timeout_sec is None or future in deadlines:
+                    continue
+                if future.running() or future.done():
+                    deadlines[future] = now + stage.timeout_sec
+                else:
+                    queued = True
+            return queued
+
+        def abandon() -> tuple[str, ...]:
+            # Cancels stages that have not started and returns the names of those still running.
+            return tuple(running[other].name for other in running if not other.cancel())
+
+        submit_ready()
+        while running:
+            now = time.monotonic()
+            queued = start_deadlines(now)
+            limits = list(deadlines.values())
+            if queued:
+                limits.append(now + STAGE_START_POLL_SEC)
+            if run_deadline is not None:
+                limits.append(run_deadline)
+            wait_sec = max(min(limits) - now, 0) if limits else None
+            done, _ = wait(running, timeout=wait_sec, return_when=FIRST_COMPLETED)
+            if not done:
+                now = time.monotonic()
+                if run_deadline is not None and now >= run_deadline:
+                    raise PipelineTimeoutError(f"Pipeline timed out after {timeout_sec:g}s", abandoned=abandon())
+                stage = next((running[future] for future, deadline in deadlines.items() if now >= deadline), None)
+                if stage is not None:
+                    raise PipelineTimeoutError(
+                        f"Stage '{stage.name}' timed out after {stage.timeout_sec:g}s", stage.name, abandoned=abandon()
+                    )
+                continue
+            for future in done:
+                stage = running.pop(future)
+                deadlines.pop(future, None)
+                try:
+                    result = future.result()
+                    missing_outputs = [name for name in stage.outputs if name not in result]
+                    if missing_outputs:
+                        raise PipelineError(f"Stage '{stage.name}' did not return {missing_outputs}", stage.name)
+                except Exception as exc:
+                    abandon()
+                    wait(running)
+                    if isinstance(exc, PipelineError):
+                        raise
+                    raise PipelineError(f"Stage '{stage.name}' failed: {exc}", stage.name) from exc
+                values.update({name: result[name] for name in stage.outputs})
+                completed_weight += stage.weight
+                if on_progress is not None:
+                    on_progress(stage.name, completed_weight / self.total_weight)
+            if should_stop is not None and should_stop():
+                raise PipelineCancelledError("Pipeline was cancelled", abandoned=abandon())
+            submit_ready()
+        return values
@@ -0,0 +1,101 @@
+"""Shared executor that runs pipeline stages."""
+
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from app.core.config import get_settings
+
+EXECUTOR_KINDS = ("thread", "process")
+
+_shared_executor: Executor | None = None
+_shared_executor_lock = threading.Lock()
+# Runs currently using each executor, and replaced executors waiting for their last run to finish.
+_executor_leases: Counter[Executor] = Counter()
+_retired_executors: set[Executor] = set()
+
+
+def create_stage_executor(kind: str, max_workers: int) -> Executor:
+    """Return a new thread or process pool for pipeline stages."""
+
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pipeline-stage")
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=max_workers)
+    raise ValueError(f"Unknown pipeline executor '{kind}', expected one of {EXECUTOR_KINDS}")
+
+
+def _current_executor() -> Executor:
+    global _shared_executor
+    if _shared_executor is None:
+        settings = get_settings()
+        _shared_executor = create_stage_executor(settings.pipeline_executor, settings.pipeline_max_workers)
+    return _shared_executor
+
+
+def get_stage_executor() -> Executor:
+    """Return the process-wide stage executor configured in settings."""
+
+    with _shared_executor_lock:
+        return _current_executor()
+
+
+@contextmanager
+def lease_stage_executor() -> Iterator[Executor]:
+    """Use the shared stage executor for one run.
+
+    A replaced executor is shut down once the last run using it leaves this block,
+    so runs that already hold it are not cut off mid-run.
+    """
+
+    with _shared_executor_lock:
+        executor = _current_executor()
+        _executor_leases[executor] += 1
+    try:
+        yield executor
+    finally:
+        with _shared_executor_lock:
+            _executor_leases[executor] -= 1
+            retire = False
+            if not _executor_leases[executor]:
+                del _executor_leases[executor]
+                retire = executor in _retired_executors
+                _retired_executors.discard(executor)
+        if retire:
+            _shutdown_executor(executor)
+
+
+def replace_stage_executor(stale: Executor) -> None:
+    """Stop handing out ``stale`` and shut it down once no run uses it any more.
+
+    Called when a run abandons stages that are still running: they keep their
+    workers until they return, which would otherwise shrink the shared pool for
+    every later job. Later runs get a new pool at once. ``stale`` is shut down with
+    its queued stages cancelled as soon as its last leased run ends, which for the
+    run that abandoned the stages is right after this call; a process pool also
+    terminates its worker processes, stuck stages included. Threads cannot be
+    killed, so an abandoned stage on a thread pool still runs to completion before
+    its thread exits.
+    """
+
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is stale:
+            _shared_executor = None
+        retire = stale in _executor_leases
+        if retire:
+            _retired_executors.add(stale)
+    if not retire:
+        _shutdown_executor(stale)
+
+
+def _shutdown_executor(executor: Executor) -> None:
+    # Snapshot the workers first: shutdown() forgets them once it returns.
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    if isinstance(executor, ProcessPoolExecutor):
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
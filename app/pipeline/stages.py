@@ -0,0 +1,176 @@
+"""Offline stub providers for the episode generation stages.
+
+Each provider is a module-level function so it can run on a thread or a process
+pool. Retrieval uses the local theme knowledge index; the generation stubs sleep
+for ``STUB_LATENCY_SEC`` to stand in for a remote model call and derive
+deterministic output from their inputs.
+"""
+
+import re
+import time
+from collections.abc import Callable, Iterator
+from functools import partial
+from typing import Any
+
+from app.core.config import get_settings
+from app.pipeline.engine import Pipeline, Stage
+from app.rag import retrieve_passages
+
+STUB_LATENCY_SEC = 0.1
+# Part of every generation cache key; bump it whenever generated output would change.
+GENERATION_MODEL_VERSION = "stub-1"
+WORDS_PER_SECOND = 2.5
+TOKEN_PATTERN = re.compile(r"\S+\s*|\s+")
+
+EPISODE_INPUTS = (
+    "user_prompt",
+    "theme_key",
+    "theme_label",
+    "theme_description",
+    "characters",
+    "story_context",
+)
+
+
+def retrieve_lore(inputs: dict[str, Any]) -> dict[str, Any]:
+    """RAG: return the theme knowledge passages closest to the prompt.
+
+    Falls back to the theme description when no index has been built for the theme.
+    """
+
+    (passages,) = retrieve_passages(inputs["theme_key"], [inputs["user_prompt"]], get_settings().rag_top_k)
+    lore = " ".join(passages) if passages else inputs["theme_description"]
+    return {"lore": f"{inputs['theme_label']}: {lore}"}
+
+
+def _script_lines(inputs: dict[str, Any]) -> list[str]:
+    speakers = [character["name"] for character in inputs["characters"]] or ["Narrator"]
+    lines = []
+    if inputs["story_context"]:
+        lines.append(f"Narrator: Previously: {' '.join(inputs['story_context'].splitlines())}")
+    lines.append(f"Narrator: {inputs['lore']}")
+    lines.extend(f"{speaker}: {inputs['user_prompt']}" for speaker in speakers)
+    return lines
+
+
+def stream_script(inputs: dict[str, Any]) -> Iterator[str]:
+    """LLM: yield the script token by token, as a streaming model API would.
+
+    Joining the chunks gives exactly the ``script`` returned by ``write_script``.
+    """
+
+    tokens = TOKEN_PATTERN.findall("\n".join(_script_lines(inputs)))
+    for token in tokens:
+        time.sleep(STUB_LATENCY_SEC / len(tokens))
+        yield token
+
+
+def write_script(inputs: dict[str, Any], on_chunk: Callable[[str], None] | None = None) -> dict[str, Any]:
+    """LLM: turn prompt, lore and characters into a script and a summary.
+
+    ``on_chunk`` receives each streamed chunk as soon as it is generated.
+    """
+
+    chunks = []
+    for chunk in stream_script(inputs):
+        chunks.append(chunk)
+        if on_chunk is not None:
+            on_chunk(chunk)
+    speakers = [character["name"] for character in inputs["characters"]] or ["Narrator"]
+    summary = f"{', '.join(speakers)}: {inputs['user_prompt']}"
+    return {"script": "".join(chunks), "summary": summary}
+
+
+def synthesize_audio(inputs: dict[str, Any]) -> dict[str, Any]:
+    """TTS: return one audio clip description per script line."""
+
+    time.sleep(STUB_LATENCY_SEC)
+    clips = [
+        {"line": index, "duration_sec": round(len(line.split()) / WORDS_PER_SECOND, 2)}
+        for index, line in enumerate(inputs["script"].splitlines())
+    ]
+    return {"audio": clips}
+
+
+def generate_visuals(inputs: dict[str, Any]) -> dict[str, Any]:
+    """Visual generation: return one image prompt per script line."""
+
+    time.sleep(STUB_LATENCY_SEC)
+    prompts = [
+        {"line": index, "prompt": f"{inputs['theme_label']} scene: {line.split(':', 1)[-1].strip()}"}
+        for index, line in enumerate(inputs["script"].splitlines())
+    ]
+    return {"visuals": prompts}
+
+
+def sync_media(inputs: dict[str, Any]) -> dict[str, Any]:
+    """Final sync: align audio clips and images on one timeline."""
+
+    time.sleep(STUB_LATENCY_SEC)
+    timeline = []
+    offset = 0.0
+    for clip, visual in zip(inputs["audio"], inputs["visuals"]):
+        timeline.append({"start_sec": round(offset, 2), "audio": clip, "visual": visual})
+        offset += clip["duration_sec"]
+    return {"timeline": timeline}
+
+
+def build_episode_pipeline(on_script_chunk: Callable[[str], None] | None = None) -> Pipeline:
+    """Return the episode graph: RAG, then LLM, then TTS and visuals in parallel, then sync.
+
+    ``on_script_chunk`` is called from the LLM stage with each streamed script chunk;
+    it is only usable with a thread executor, since it runs in the stage's worker.
+    Stage timeouts come from ``PIPELINE_STAGE_TIMEOUTS`` (by stage name), falling
+    back to ``PIPELINE_STAGE_TIMEOUT_SEC``.
+    """
+
+    settings = get_settings()
+
+    def timeout(name: str) -> float | None:
+        return settings.pipeline_stage_timeouts.get(name, settings.pipeline_stage_timeout_sec)
+
+    return Pipeline(
+        [
+            Stage(
+                "rag",
+                retrieve_lore,
+                inputs=("theme_key", "theme_label", "theme_description", "user_prompt"),
+                outputs=("lore",),
+                weight=1,
+                timeout_sec=timeout("rag"),
+            ),
+            Stage(
+                "llm",
+                partial(write_script, on_chunk=on_script_chunk) if on_script_chunk else write_script,
+                inputs=("user_prompt", "lore", "characters", "story_context"),
+                outputs=("script", "summary"),
+                weight=3,
+                timeout_sec=timeout("llm"),
+            ),
+            Stage(
+                "tts",
+                synthesize_audio,
+                inputs=("script",),
+                outputs=("audio",),
+                weight=2,
+                timeout_sec=timeout("tts"),
+            ),
+            Stage(
+                "visual",
+                generate_visuals,
+                inputs=("script", "theme_label"),
+                outputs=("visuals",),
+                weight=2,
+                timeout_sec=timeout("visual"),
+            ),
+            Stage(
+                "sync",
+                sync_media,
+                inputs=("audio", "visuals"),
+                outputs=("timeline",),
+                weight=1,
+                timeout_sec=timeout("sync"),
+            ),
+        ],
+        initial_inputs=EPISODE_INPUTS,
+    )
@@ -0,0 +1,17 @@
+"""Theme knowledge retrieval exports."""
+
+from app.rag.embedding import HashingEmbedder
+from app.rag.index import IndexRegistry, SearchResult, VectorIndex, write_index
+from app.rag.retrieval import get_embedder, get_index_registry, knowledge_version, retrieve_passages
+
+__all__ = [
+    "HashingEmbedder",
+    "IndexRegistry",
+    "SearchResult",
+    "VectorIndex",
+    "get_embedder",
+    "get_index_registry",
+    "knowledge_version",
+    "retrieve_passages",
+    "write_index",
+]
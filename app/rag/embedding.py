@@ -0,0 +1,43 @@
+"""Offline text embedder for theme knowledge retrieval."""
+
+import hashlib
+import re
+from collections.abc import Sequence
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class HashingEmbedder:
+    """Embed text by hashing its tokens into a fixed number of signed buckets.
+
+    Token hashes come from BLAKE2b rather than ``hash()`` so vectors are identical
+    across processes and restarts. Rows are L2-normalized, so a dot product is the
+    cosine similarity.
+    """
+
+    name = "hashing"
+
+    def __init__(self, dim: int = 256) -> None:
+        self.dim = dim
+        self._token_cache: dict[str, tuple[int, float]] = {}
+
+    def _bucket(self, token: str) -> tuple[int, float]:
+        cached = self._token_cache.get(token)
+        if cached is None:
+            digest = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+            cached = self._token_cache[token] = (digest % self.dim, 1.0 if digest >> 63 else -1.0)
+        return cached
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Return a ``(len(texts), dim)`` float32 matrix of unit-length rows."""
+
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in TOKEN_PATTERN.findall(text.lower()):
+                column, sign = self._bucket(token)
+                vectors[row, column] += sign
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
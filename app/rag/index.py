@@ -0,0 +1,230 @@
+"""Memory-mapped float32 vector index for theme knowledge, one per ``Theme.key``."""
+
+import json
+import os
+import shutil
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+CURRENT_FILE = "CURRENT"
+SEARCH_CHUNK_ROWS = 65536
+KMEANS_ITERATIONS = 10
+KEEP_GENERATIONS = 2
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResult:
+    """Top-k matches per query; missing slots hold id ``-1`` and score ``-inf``."""
+
+    ids: np.ndarray
+    scores: np.ndarray
+
+
+def _top_k(scores: np.ndarray, rows: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the ``k`` best ``(rows, scores)`` per query, best first, padded if short."""
+
+    count = scores.shape[1]
+    if count < k:
+        scores = np.pad(scores, ((0, 0), (0, k - count)), constant_values=-np.inf)
+        rows = np.pad(rows, ((0, 0), (0, k - count)), constant_values=-1)
+    if scores.shape[1] > k:
+        best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        scores = np.take_along_axis(scores, best, axis=1)
+        rows = np.take_along_axis(rows, best, axis=1)
+    order = np.argsort(-scores, axis=1, kind="stable")
+    return np.take_along_axis(rows, order, axis=1), np.take_along_axis(scores, order, axis=1)
+
+
+def _kmeans(vectors: np.ndarray, nlist: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """Cluster unit vectors by cosine similarity; return ``(centroids, assignments)``."""
+
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), size=nlist, replace=False)].copy()
+    assignments = np.zeros(len(vectors), dtype=np.int64)
+    for _ in range(KMEANS_ITERATIONS):
+        for start in range(0, len(vectors), SEARCH_CHUNK_ROWS):
+            chunk = vectors[start : start + SEARCH_CHUNK_ROWS]
+            assignments[start : start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, vectors)
+        counts = np.bincount(assignments, minlength=nlist)
+        empty = counts == 0
+        sums[empty] = vectors[rng.choice(len(vectors), size=int(empty.sum()), replace=False)]
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids = (sums / np.where(norms > 0, norms, 1)).astype(np.float32)
+    return centroids, assignments
+
+
+class VectorIndex:
+    """Read-only view of one index generation on disk.
+
+    Vectors, ids and passage texts are ``np.memmap`` views, so every process that
+    opens the same generation shares one copy through the OS page cache. With a
+    coarse quantizer (``nlist > 0``) rows are stored grouped by cluster and a
+    search scans only the ``nprobe`` clusters closest to each query.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        meta = json.loads((path / "meta.json").read_text())
+        self.dim: int = meta["dim"]
+        self.count: int = meta["count"]
+        self.nlist: int = meta["nlist"]
+        self.embedder: str = meta["embedder"]
+        self.vectors = self._map("vectors.f32", np.float32, (self.count, self.dim))
+        self.ids = self._map("ids.i64", np.int64, (self.count,))
+        self._text_offsets = self._map("text_offsets.i64", np.int64, (self.count + 1,))
+        self._texts = self._map("texts.bin", np.uint8, (int(self._text_offsets[-1]),))
+        self.centroids = self._map("centroids.f32", np.float32, (self.nlist, self.dim)) if self.nlist else None
+        self.list_offsets = self._map("list_offsets.i64", np.int64, (self.nlist + 1,)) if self.nlist else None
+
+    def _map(self, name: str, dtype: type, shape: tuple[int, ...]) -> np.ndarray:
+        if 0 in shape:
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(self.path / name, dtype=dtype, mode="r", shape=shape)
+
+    def text(self, row: int) -> str:
+        """Return the passage text stored at ``row``."""
+
+        start, end = self._text_offsets[row], self._text_offsets[row + 1]
+        return bytes(self._texts[start:end]).decode()
+
+    def search(self, queries: np.ndarray, k: int, *, nprobe: int | None = None) -> SearchResult:
+        """Return the ``k`` most similar passages for each row of ``queries``.
+
+        ``ids`` holds ``ThemeKnowledge`` ids. A flat scan multiplies the whole
+        query batch against fixed-size chunks of the mapped matrix; an IVF search
+        does the same over the rows of the clusters probed by any query, masking
+        out the clusters each query did not probe.
+        """
+
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        rows, scores = self.search_rows(queries, k, nprobe=nprobe)
+        ids = np.where(rows >= 0, self.ids[np.maximum(rows, 0)] if self.count else -1, -1)
+        return SearchResult(ids=ids, scores=scores)
+
+    def search_rows(self, queries: np.ndarray, k: int, *, nprobe: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Return the best row positions and scores per query (``-1`` when missing)."""
+
+        if self.centroids is None or nprobe is None or nprobe >= self.nlist:
+            return self._scan(queries, k, 0, self.count)
+        probes = np.argpartition(-(queries @ self.centroids.T), nprobe - 1, axis=1)[:, :nprobe]
+        probed = np.zeros((len(queries), self.nlist), dtype=bool)
+        np.put_along_axis(probed, probes, True, axis=1)
+        # Gather the rows of every cluster probed by any query once, score the whole
+        # batch against them chunk by chunk and mask out the clusters a query skipped.
+        clusters = np.flatnonzero(probed.any(axis=0))
+        starts, stops = self.list_offsets[clusters], self.list_offsets[clusters + 1]
+        candidate_rows = np.concatenate([np.arange(start, stop) for start, stop in zip(starts, stops)])
+        row_clusters = np.repeat(clusters, stops - starts)
+        best_rows = np.full((len(queries), 0), -1, dtype=np.int64)
+        best_scores = np.full((len(queries), 0), -np.inf, dtype=np.float32)
+        for chunk_start in range(0, len(candidate_rows), SEARCH_CHUNK_ROWS):
+            chunk_rows = candidate_rows[chunk_start : chunk_start + SEARCH_CHUNK_ROWS]
+            hit = probed[:, row_clusters[chunk_start : chunk_start + SEARCH_CHUNK_ROWS]]
+            scores = np.where(hit, queries @ self.vectors[chunk_rows].T, -np.inf).astype(np.float32)
+            rows = np.where(hit, chunk_rows, -1)
+            best_rows, best_scores = _top_k(
+                np.concatenate([best_scores, scores], axis=1), np.concatenate([best_rows, rows], axis=1), k
+            )
+        return _top_k(best_scores, best_rows, k)
+
+    def _scan(self, queries: np.ndarray, k: int, start: int, stop: int) -> tuple[np.ndarray, np.ndarray]:
+        best_rows = np.full((len(queries), 0), -1, dtype=np.int64)
+        best_scores = np.full((len(queries), 0), -np.inf, dtype=np.float32)
+        for chunk_start in range(start, stop, SEARCH_CHUNK_ROWS):
+            chunk_stop = min(chunk_start + SEARCH_CHUNK_ROWS, stop)
+            scores = queries @ self.vectors[chunk_start:chunk_stop].T
+            rows = np.broadcast_to(np.arange(chunk_start, chunk_stop), scores.shape)
+            best_rows, best_scores = _top_k(
+                np.concatenate([best_scores, scores], axis=1), np.concatenate([best_rows, rows], axis=1), k
+            )
+        return _top_k(best_scores, best_rows, k)
+
+
+def write_index(
+    root: Path,
+    key: str,
+    ids: Sequence[int],
+    vectors: np.ndarray,
+    texts: Sequence[str],
+    *,
+    embedder: str,
+    nlist: int = 0,
+) -> Path:
+    """Write a new index generation for ``key`` and atomically make it current.
+
+    Files are written into a fresh generation directory and published by replacing
+    the ``CURRENT`` pointer, so readers never see a partial index; processes that
+    still map an older generation keep a consistent view until they reopen.
+    """
+
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    ids_array = np.asarray(ids, dtype=np.int64)
+    encoded = [text.encode() for text in texts]
+    nlist = min(nlist, len(vectors))
+    centroids = list_offsets = None
+    if nlist:
+        centroids, assignments = _kmeans(vectors, nlist)
+        order = np.argsort(assignments, kind="stable")
+        vectors, ids_array = vectors[order], ids_array[order]
+        encoded = [encoded[row] for row in order]
+        list_offsets = np.concatenate([[0], np.cumsum(np.bincount(assignments, minlength=nlist))]).astype(np.int64)
+
+    theme_dir = root / key
+    generation = theme_dir / f"{time.time_ns()}-{os.getpid()}"
+    generation.mkdir(parents=True)
+    vectors.tofile(generation / "vectors.f32")
+    ids_array.tofile(generation / "ids.i64")
+    np.concatenate([[0], np.cumsum([len(item) for item in encoded])]).astype(np.int64).tofile(
+        generation / "text_offsets.i64"
+    )
+    (generation / "texts.bin").write_bytes(b"".join(encoded))
+    if centroids is not None and list_offsets is not None:
+        centroids.tofile(generation / "centroids.f32")
+        list_offsets.tofile(generation / "list_offsets.i64")
+    meta = {"dim": int(vectors.shape[1]), "count": len(ids_array), "nlist": nlist, "embedder": embedder}
+    (generation / "meta.json").write_text(json.dumps(meta))
+
+    pointer = theme_dir / f"{CURRENT_FILE}.{os.getpid()}.tmp"
+    pointer.write_text(generation.name)
+    os.replace(pointer, theme_dir / CURRENT_FILE)
+
+    generations = sorted(path for path in theme_dir.iterdir() if path.is_dir())
+    for stale in generations[:-KEEP_GENERATIONS]:
+        shutil.rmtree(stale, ignore_errors=True)
+    return generation
+
+
+class IndexRegistry:
+    """Per-process cache of opened indexes that follows ``CURRENT`` pointer changes."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._lock = threading.Lock()
+        self._open: dict[str, VectorIndex] = {}
+
+    def generation(self, key: str) -> str | None:
+        """Return the name of the current generation of ``key``, or ``None`` if none was built."""
+
+        try:
+            return (self.root / key / CURRENT_FILE).read_text().strip()
+        except FileNotFoundError:
+            return None
+
+    def get(self, key: str) -> VectorIndex | None:
+        """Return the current index of ``key``, or ``None`` if none was built."""
+
+        generation = self.generation(key)
+        if generation is None:
+            return None
+        with self._lock:
+            index = self._open.get(key)
+            if index is None or index.path.name != generation:
+                index = self._open[key] = VectorIndex(self.root / key / generation)
+            return index
@@ -0,0 +1,45 @@
+"""Theme knowledge lookup used by the RAG pipeline stage."""
+
+from collections.abc import Sequence
+from functools import lru_cache
+from pathlib import Path
+
+from app.core.config import get_settings
+from app.rag.embedding import HashingEmbedder
+from app.rag.index import IndexRegistry
+
+
+@lru_cache(maxsize=1)
+def get_index_registry() -> IndexRegistry:
+    """Return the process-wide registry over ``KNOWLEDGE_INDEX_DIR``."""
+
+    return IndexRegistry(Path(get_settings().knowledge_index_dir))
+
+
+@lru_cache(maxsize=8)
+def get_embedder(dim: int) -> HashingEmbedder:
+    """Return a shared embedder producing ``dim``-dimensional vectors."""
+
+    return HashingEmbedder(dim)
+
+
+def knowledge_version(theme_key: str) -> str | None:
+    """Return the current index generation of a theme; every rebuild changes it."""
+
+    return get_index_registry().generation(theme_key)
+
+
+def retrieve_passages(theme_key: str, queries: Sequence[str], k: int) -> list[list[str]]:
+    """Return up to ``k`` passages of a theme for each query, most similar first.
+
+    All queries are embedded and searched as one batch. Themes without a built
+    index return no passages.
+    """
+
+    index = get_index_registry().get(theme_key)
+    if index is None or not queries:
+        return [[] for _ in queries]
+    settings = get_settings()
+    nprobe = settings.knowledge_ivf_nprobe if index.nlist else None
+    rows, _ = index.search_rows(get_embedder(index.dim).embed(queries), k, nprobe=nprobe)
+    return [[index.text(int(row)) for row in query_rows if row >= 0] for query_rows in rows]
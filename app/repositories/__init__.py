@@ -1,8 +1,8 @@
 """Repository package exports."""
 
 from app.repositories.character_repository import create_character, get_characters_by_ids, list_characters
-from app.repositories.episode_repository import create_episode, get_episode, list_recent_episodes
-from app.repositories.job_repository import create_job, get_job, update_job_state
+from app.repositories.episode_repository import get_episode, list_recent_episodes
+from app.repositories.job_repository import claim_next_job, get_job
 from app.repositories.series_repository import get_default_series, get_series, list_series
 from app.repositories.theme_repository import get_theme, list_themes
 
@@ -10,12 +10,10 @@ __all__ = [
     "create_character",
     "get_characters_by_ids",
     "list_characters",
-    "create_episode",
     "get_episode",
     "list_recent_episodes",
-    "create_job",
+    "claim_next_job",
     "get_job",
-    "update_job_state",
     "get_default_series",
     "get_series",
     "list_series",
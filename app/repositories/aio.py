@@ -0,0 +1,193 @@
+"""Async variants of the repository helpers for ``AsyncSession`` callers.
+
+Each helper runs the matching sync repository function through
+``AsyncSession.run_sync``: the SQL is defined once, while all I/O goes through the
+async driver on the event loop instead of occupying a threadpool worker.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.base import Base
+from app.models.character import Character
+from app.models.episode import Episode
+from app.models.job import Job
+from app.models.media_asset import MediaAsset
+from app.models.story_series import StorySeries
+from app.models.theme import Theme
+from app.repositories import (
+    character_repository,
+    episode_repository,
+    job_repository,
+    markers,
+    media_asset_repository,
+    series_repository,
+    theme_repository,
+)
+from app.schemas.character import CharacterCreate
+
+
+async def list_characters(db: AsyncSession) -> list[Character]:
+    """Return active characters sorted by name."""
+
+    return await db.run_sync(character_repository.list_characters)
+
+
+async def list_characters_page(
+    db: AsyncSession, *, cursor: str | None = None, limit: int = 20, active: bool | None = None
+) -> tuple[list[Character], str | None]:
+    """Return one newest-first page of characters and the next cursor."""
+
+    return await db.run_sync(
+        lambda session: character_repository.list_characters_page(session, cursor=cursor, limit=limit, active=active)
+    )
+
+
+async def create_character(db: AsyncSession, payload: CharacterCreate) -> Character:
+    """Insert and return a new character row."""
+
+    return await db.run_sync(character_repository.create_character, payload)
+
+
+async def get_characters_by_ids(db: AsyncSession, character_ids: list[int]) -> list[Character]:
+    """Return all characters that match the given ids."""
+
+    return await db.run_sync(character_repository.get_characters_by_ids, character_ids)
+
+
+async def get_episode(db: AsyncSession, episode_id: int) -> Episode | None:
+    """Return one episode by id."""
+
+    return await db.run_sync(episode_repository.get_episode, episode_id)
+
+
+async def get_table_marker(db: AsyncSession, model: type[Base]) -> markers.ChangeMarker:
+    """Return the change marker of ``model``'s table with one aggregate query."""
+
+    return await db.run_sync(markers.get_table_marker, model)
+
+
+async def get_episode_script_tail(
+    db: AsyncSession, episode_id: int, *, generation: int | None, offset: int
+) -> tuple[int, str, str | None] | None:
+    """Return the script generation, its unseen text and the latest job status."""
+
+    return await db.run_sync(
+        lambda session: episode_repository.get_episode_script_tail(
+            session, episode_id, generation=generation, offset=offset
+        )
+    )
+
+
+async def list_recent_episodes(db: AsyncSession, limit: int = 10) -> list[Episode]:
+    """Return recent episodes for quick UI selection."""
+
+    return await db.run_sync(episode_repository.list_recent_episodes, limit)
+
+
+async def list_episodes_page(
+    db: AsyncSession,
+    *,
+    cursor: str | None = None,
+    limit: int = 20,
+    series_id: int | None = None,
+    status: str | None = None,
+    theme_id: int | None = None,
+) -> tuple[list[Episode], str | None]:
+    """Return one newest-first page of episodes and the next cursor."""
+
+    return await db.run_sync(
+        lambda session: episode_repository.list_episodes_page(
+            session, cursor=cursor, limit=limit, series_id=series_id, status=status, theme_id=theme_id
+        )
+    )
+
+
+async def list_jobs_page(
+    db: AsyncSession,
+    *,
+    cursor: str | None = None,
+    limit: int = 20,
+    status: str | None = None,
+    series_id: int | None = None,
+    theme_id: int | None = None,
+) -> tuple[list[Job], str | None]:
+    """Return one newest-first page of jobs and the next cursor."""
+
+    return await db.run_sync(
+        lambda session: job_repository.list_jobs_page(
+            session, cursor=cursor, limit=limit, status=status, series_id=series_id, theme_id=theme_id
+        )
+    )
+
+
+async def get_job(db: AsyncSession, job_id: int) -> Job | None:
+    """Return one job by id."""
+
+    return await db.run_sync(job_repository.get_job, job_id)
+
+
+async def cancel_job(db: AsyncSession, job_id: int) -> Job | None:
+    """Cancel a queued or running job; ``None`` if it is missing or already finished."""
+
+    return await db.run_sync(job_repository.cancel_job, job_id)
+
+
+async def get_media_asset(db: AsyncSession, asset_id: int) -> MediaAsset | None:
+    """Return one media asset by id."""
+
+    return await db.run_sync(media_asset_repository.get_media_asset, asset_id)
+
+
+async def list_episode_media_assets(db: AsyncSession, episode_id: int) -> list[MediaAsset]:
+    """Return the media assets of an episode in upload order."""
+
+    return await db.run_sync(media_asset_repository.list_episode_media_assets, episode_id)
+
+
+async def create_media_asset(
+    db: AsyncSession,
+    *,
+    episode_id: int,
+    kind: str,
+    content_type: str,
+    sha256: str,
+    size_bytes: int,
+    filename: str | None,
+) -> MediaAsset:
+    """Insert and return a media asset row for a stored blob."""
+
+    return await db.run_sync(
+        lambda session: media_asset_repository.create_media_asset(
+            session,
+            episode_id=episode_id,
+            kind=kind,
+            content_type=content_type,
+            sha256=sha256,
+            size_bytes=size_bytes,
+            filename=filename,
+        )
+    )
+
+
+async def list_series(db: AsyncSession) -> list[StorySeries]:
+    """Return all story series ordered by creation date descending."""
+
+    return await db.run_sync(series_repository.list_series)
+
+
+async def get_series(db: AsyncSession, series_id: int) -> StorySeries | None:
+    """Return one series by id."""
+
+    return await db.run_sync(series_repository.get_series, series_id)
+
+
+async def list_themes(db: AsyncSession) -> list[Theme]:
+    """Return all active themes sorted by label."""
+
+    return await db.run_sync(theme_repository.list_themes)
+
+
+async def get_theme(db: AsyncSession, theme_id: int) -> Theme | None:
+    """Return a single theme by id when present."""
+
+    return await db.run_sync(theme_repository.get_theme, theme_id)
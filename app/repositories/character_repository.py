@@ -1,9 +1,12 @@
 """Character repository helpers."""
 
+from collections.abc import Collection
+
 from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
 from app.models.character import Character
+from app.repositories.pagination import paginate
 from app.schemas.character import CharacterCreate
 
 
@@ -14,6 +17,21 @@ def list_characters(db: Session) -> list[Character]:
     return list(db.scalars(statement).all())
 
 
+def list_characters_page(
+    db: Session,
+    *,
+    cursor: str | None = None,
+    limit: int = 20,
+    active: bool | None = None,
+) -> tuple[list[Character], str | None]:
+    """Return one newest-first page of characters and the next cursor."""
+
+    statement: Select[tuple[Character]] = select(Character)
+    if active is not None:
+        statement = statement.where(Character.active.is_(active))
+    return paginate(db, statement, created_at=Character.created_at, row_id=Character.id, cursor=cursor, limit=limit)
+
+
 def create_character(db: Session, payload: CharacterCreate) -> Character:
     """Insert and return a new character row."""
 
@@ -31,3 +49,11 @@ def get_characters_by_ids(db: Session, character_ids: list[int]) -> list[Charact
         return []
     statement: Select[tuple[Character]] = select(Character).where(Character.id.in_(character_ids))
     return list(db.scalars(statement).all())
+
+
+def get_existing_character_ids(db: Session, character_ids: Collection[int]) -> set[int]:
+    """Return the subset of ``character_ids`` that exist."""
+
+    if not character_ids:
+        return set()
+    return set(db.scalars(select(Character.id).where(Character.id.in_(character_ids))).all())
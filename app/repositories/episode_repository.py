@@ -1,9 +1,83 @@
 """Episode repository helpers."""
 
-from sqlalchemy import Select, desc, func, select
-from sqlalchemy.orm import Session
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
+from typing import Any
 
+from sqlalchemy import CTE, Select, Subquery, case, delete, desc, func, insert, literal, select, true, update
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.models.character import Character
 from app.models.episode import Episode, EpisodeCharacter
+from app.models.job import Job
+from app.models.story_context import StoryContext
+from app.models.story_series import StorySeries
+from app.models.theme import Theme
+from app.repositories.job_repository import fair_rank_base
+from app.repositories.pagination import paginate
+
+# Guards recursive chain queries against a continuation cycle introduced by manual edits.
+MAX_CHAIN_DEPTH = 10000
+
+
+@dataclass(frozen=True, slots=True)
+class EpisodeReferences:
+    """Existence checks for everything a new episode refers to."""
+
+    theme_active: bool
+    continuation_exists: bool
+    character_count: int
+    series_id: int | None
+    job_rank_base: int
+
+
+def get_episode_references(
+    db: Session,
+    *,
+    theme_id: int,
+    continuation_from_episode_id: int | None,
+    character_ids: Collection[int],
+    series_id: int | None,
+    client_key: str = "anonymous",
+) -> EpisodeReferences:
+    """Check the references of a new episode with a single query.
+
+    ``series_id`` of the result is the requested series if it exists, the default
+    (oldest) series if none was requested, and ``None`` otherwise. The same query
+    reads the fair-share rank base for the job of ``client_key``.
+    """
+
+    if continuation_from_episode_id is None:
+        continuation_exists = true()
+    else:
+        continuation_exists = select(Episode.id).where(Episode.id == continuation_from_episode_id).exists()
+    if character_ids:
+        character_count = (
+            select(func.count(Character.id)).where(Character.id.in_(set(character_ids))).scalar_subquery()
+        )
+    else:
+        character_count = literal(0)
+    series = select(StorySeries.id)
+    if series_id is None:
+        series = series.order_by(StorySeries.id.asc()).limit(1)
+    else:
+        series = series.where(StorySeries.id == series_id)
+
+    statement = select(
+        select(Theme.id).where(Theme.id == theme_id, Theme.active.is_(True)).exists(),
+        continuation_exists,
+        character_count,
+        series.scalar_subquery(),
+        fair_rank_base(client_key),
+    )
+    theme_active, continuation_ok, count, resolved_series_id, job_rank_base = db.execute(statement).one()
+    return EpisodeReferences(
+        theme_active=bool(theme_active),
+        continuation_exists=bool(continuation_ok),
+        character_count=count,
+        series_id=resolved_series_id,
+        job_rank_base=job_rank_base,
+    )
 
 
 def get_episode(db: Session, episode_id: int) -> Episode | None:
@@ -12,50 +86,244 @@ def get_episode(db: Session, episode_id: int) -> Episode | None:
     return db.get(Episode, episode_id)
 
 
-def list_recent_episodes(db: Session, limit: int = 10) -> list[Episode]:
-    """Return recent episodes for quick UI selection."""
+def _chain_cte(episode_id: int, *, ancestors: bool) -> CTE:
+    """Return a recursive CTE of ``(id, depth)`` walking continuation links from one episode."""
+
+    chain = (
+        select(Episode.id, Episode.continuation_from_episode_id, literal(0).label("depth"))
+        .where(Episode.id == episode_id)
+        .cte("continuation_chain", recursive=True)
+    )
+    if ancestors:
+        link = Episode.id == chain.c.continuation_from_episode_id
+    else:
+        link = Episode.continuation_from_episode_id == chain.c.id
+    return chain.union_all(
+        select(Episode.id, Episode.continuation_from_episode_id, chain.c.depth + 1)
+        .join(chain, link)
+        .where(chain.c.depth < MAX_CHAIN_DEPTH)
+    )
+
+
+def get_continuation_chain(db: Session, episode_id: int) -> list[Episode]:
+    """Return an episode and all episodes it continues, oldest first, in one query.
 
-    statement: Select[tuple[Episode]] = select(Episode).order_by(desc(Episode.created_at)).limit(limit)
+    Ancestors are collected with a recursive CTE over ``continuation_from_episode_id``
+    (supported by PostgreSQL and SQLite), so the cost does not grow with the number
+    of round trips a lazy walk of ``continuation_from`` would need.
+    """
+
+    chain = _chain_cte(episode_id, ancestors=True)
+    statement: Select[tuple[Episode]] = (
+        select(Episode).join(chain, Episode.id == chain.c.id).order_by(chain.c.depth.desc())
+    )
     return list(db.scalars(statement).all())
 
 
-def next_episode_number(db: Session, series_id: int) -> int:
-    """Return the next episode number within a series."""
+def continuation_descendant_ids(episode_id: int) -> Select[tuple[int]]:
+    """Return a query for the ids of an episode and every episode continuing it."""
+
+    chain = _chain_cte(episode_id, ancestors=False)
+    return select(chain.c.id)
+
+
+def continuation_chain_marker(episode_id: int) -> Subquery:
+    """Return a one-row subquery of the length and latest ``updated_at`` of an episode's ancestor chain.
+
+    Editing, unlinking or deleting any episode of the chain changes one of the two,
+    so the pair tells whether something derived from the chain is still current.
+    """
+
+    chain = _chain_cte(episode_id, ancestors=True)
+    return (
+        select(func.count().label("chain_length"), func.max(Episode.updated_at).label("chain_updated_at"))
+        .join(chain, Episode.id == chain.c.id)
+        .subquery("chain_marker")
+    )
+
+
+def get_job_episode(db: Session, job_id: int) -> tuple[Episode, bool] | None:
+    """Return the episode of a job, with theme and characters loaded, and the job's cache bypass flag."""
+
+    statement: Select[tuple[Episode, bool]] = (
+        select(Episode, Job.cache_bypass)
+        .join(Job, Job.episode_id == Episode.id)
+        .where(Job.id == job_id)
+        .options(
+            joinedload(Episode.theme),
+            selectinload(Episode.characters).joinedload(EpisodeCharacter.character),
+        )
+    )
+    row = db.execute(statement).one_or_none()
+    return (row[0], row[1]) if row else None
+
+
+def start_episode_script(db: Session, episode_id: int) -> None:
+    """Clear any earlier script text and mark the episode as generating.
+
+    The status and script the episode had are kept aside so a failed generation can
+    restore them; an episode left ``generating`` by a dead attempt keeps the ones
+    saved by that attempt.
+    """
+
+    generating = Episode.status == "generating"
+    db.execute(
+        update(Episode)
+        .where(Episode.id == episode_id)
+        .values(
+            script_text="",
+            status="generating",
+            script_generation=Episode.script_generation + 1,
+            status_before_generation=case((generating, Episode.status_before_generation), else_=Episode.status),
+            script_before_generation=case((generating, Episode.script_before_generation), else_=Episode.script_text),
+        )
+    )
+    db.commit()
+
+
+def reset_episode_script(db: Session, episode_id: int, *, status: str, script_text: str | None) -> None:
+    """Undo ``start_episode_script`` after a failed or cancelled generation.
+
+    Only an episode that is still ``generating`` is changed, so a generation that
+    completed meanwhile is never rolled back.
+    """
+
+    db.execute(
+        update(Episode)
+        .where(Episode.id == episode_id, Episode.status == "generating")
+        .values(
+            script_text=script_text,
+            status=status,
+            script_generation=Episode.script_generation + 1,
+            status_before_generation=None,
+            script_before_generation=None,
+        )
+    )
+    db.commit()
+
+
+def append_episode_script(db: Session, episode_id: int, text: str) -> None:
+    """Append streamed text to an episode's script in one ``UPDATE``."""
+
+    db.execute(
+        update(Episode)
+        .where(Episode.id == episode_id)
+        .values(script_text=func.coalesce(Episode.script_text, "").concat(text))
+    )
+    db.commit()
+
+
+def get_episode_script_tail(
+    db: Session, episode_id: int, *, generation: int | None, offset: int
+) -> tuple[int, str, str | None] | None:
+    """Return the script generation, its unseen text and the status of the episode's latest job.
+
+    The text is what follows ``offset`` characters while the script is still in
+    ``generation``, and the whole script once it was replaced, so repeated polls of
+    a growing script stay cheap and a restarted script is never read from a stale
+    offset.
+    """
+
+    job_status = (
+        select(Job.status)
+        .where(Job.episode_id == Episode.id)
+        .order_by(desc(Job.id))
+        .limit(1)
+        .correlate(Episode)
+        .scalar_subquery()
+    )
+    start = case((Episode.script_generation == (-1 if generation is None else generation), offset + 1), else_=1)
+    statement = select(
+        Episode.script_generation, func.substr(func.coalesce(Episode.script_text, ""), start), job_status
+    ).where(Episode.id == episode_id)
+    row = db.execute(statement).one_or_none()
+    return (row[0], row[1], row[2]) if row else None
+
+
+def save_episode_script(db: Session, episode_id: int, *, script_text: str, summary: str) -> None:
+    """Store generated text on an episode and mark it as generated.
+
+    The summary feeds the story context of the episode and of every episode that
+    continues it, so those memoized contexts are dropped in the same transaction.
+    """
 
-    statement = select(func.max(Episode.episode_number)).where(Episode.series_id == series_id)
-    current_max = db.scalar(statement)
-    return (current_max or 0) + 1
+    db.execute(
+        update(Episode)
+        .where(Episode.id == episode_id)
+        .values(
+            script_text=script_text,
+            summary=summary,
+            status="generated",
+            # A script streamed by this generation grows into the final text; any other is replaced.
+            script_generation=case(
+                (Episode.status == "generating", Episode.script_generation), else_=Episode.script_generation + 1
+            ),
+            status_before_generation=None,
+            script_before_generation=None,
+        )
+    )
+    db.execute(delete(StoryContext).where(StoryContext.episode_id.in_(continuation_descendant_ids(episode_id))))
+    db.commit()
+
+
+def list_recent_episodes(db: Session, limit: int = 10) -> list[Episode]:
+    """Return recent episodes for quick UI selection."""
 
+    statement: Select[tuple[Episode]] = (
+        select(Episode).order_by(desc(Episode.created_at), desc(Episode.id)).limit(limit)
+    )
+    return list(db.scalars(statement).all())
 
-def create_episode(
+
+def list_episodes_page(
     db: Session,
     *,
-    series_id: int,
-    title: str,
-    user_prompt: str,
-    theme_id: int,
-    continuation_from_episode_id: int | None,
-    character_ids: list[int],
-    target_duration_sec: int,
-) -> Episode:
-    """Create an episode and its character links in one transaction."""
-
-    episode = Episode(
-        series_id=series_id,
-        episode_number=next_episode_number(db, series_id),
-        title=title,
-        user_prompt=user_prompt,
-        theme_id=theme_id,
-        continuation_from_episode_id=continuation_from_episode_id,
-        target_duration_sec=target_duration_sec,
-        status="draft",
-    )
-    db.add(episode)
-    db.flush()
-
-    for character_id in character_ids:
-        db.add(EpisodeCharacter(episode_id=episode.id, character_id=character_id, role="support"))
+    cursor: str | None = None,
+    limit: int = 20,
+    series_id: int | None = None,
+    status: str | None = None,
+    theme_id: int | None = None,
+) -> tuple[list[Episode], str | None]:
+    """Return one newest-first page of episodes matching the filters and the next cursor."""
 
-    db.commit()
-    db.refresh(episode)
-    return episode
+    statement: Select[tuple[Episode]] = select(Episode)
+    if series_id is not None:
+        statement = statement.where(Episode.series_id == series_id)
+    if status is not None:
+        statement = statement.where(Episode.status == status)
+    if theme_id is not None:
+        statement = statement.where(Episode.theme_id == theme_id)
+    return paginate(db, statement, created_at=Episode.created_at, row_id=Episode.id, cursor=cursor, limit=limit)
+
+
+def get_existing_episode_ids(db: Session, episode_ids: Collection[int]) -> set[int]:
+    """Return the subset of ``episode_ids`` that exist."""
+
+    if not episode_ids:
+        return set()
+    return set(db.scalars(select(Episode.id).where(Episode.id.in_(episode_ids))).all())
+
+
+def insert_episodes(db: Session, rows: Sequence[dict[str, Any]], character_ids: Sequence[Sequence[int]]) -> list[int]:
+    """Bulk insert episodes plus their character links and return ids in input order.
+
+    ``character_ids[i]`` lists the characters of ``rows[i]``. Returned ids are matched
+    back through the unique ``(series_id, episode_number)`` pair, so the insert can be
+    batched without relying on ``RETURNING`` row order. The caller owns the
+    transaction and must commit.
+    """
+
+    if not rows:
+        return []
+    statement = insert(Episode).returning(Episode.id, Episode.series_id, Episode.episode_number)
+    inserted = {(series_id, number): episode_id for episode_id, series_id, number in db.execute(statement, list(rows))}
+    episode_ids = [inserted[(row["series_id"], row["episode_number"])] for row in rows]
+
+    links = [
+        {"episode_id": episode_id, "character_id": character_id, "role": "support"}
+        for episode_id, ids in zip(episode_ids, character_ids)
+        for character_id in ids
+    ]
+    if links:
+        db.execute(insert(EpisodeCharacter), links)
+    return episode_ids
@@ -0,0 +1,67 @@
+"""Idempotency key repository helpers."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.idempotency_key import IdempotencyKey
+
+
+def claim_idempotency_key(db: Session, key: str, *, client_key: str, request_hash: str, ttl_seconds: int) -> bool:
+    """Insert ``key`` of ``client_key`` for a new request and return whether this caller owns it.
+
+    Uses ``INSERT ... ON CONFLICT`` on the unique ``(client_key, key)`` pair, which
+    takes over an expired row and otherwise does nothing. On PostgreSQL a
+    concurrent duplicate blocks on the unique index until the first transaction
+    ends, then sees its committed row; SQLite serializes the writers. The caller
+    owns the transaction and must commit.
+    """
+
+    now = datetime.now(timezone.utc)
+    insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    statement = insert(IdempotencyKey).values(
+        client_key=client_key,
+        key=key,
+        request_hash=request_hash,
+        created_at=now,
+        expires_at=now + timedelta(seconds=ttl_seconds),
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[IdempotencyKey.client_key, IdempotencyKey.key],
+        set_={
+            "request_hash": statement.excluded.request_hash,
+            "episode_id": None,
+            "job_id": None,
+            "created_at": statement.excluded.created_at,
+            "expires_at": statement.excluded.expires_at,
+        },
+        where=IdempotencyKey.expires_at <= now,
+    ).returning(IdempotencyKey.id)
+    return db.execute(statement).first() is not None
+
+
+def get_idempotency_key(db: Session, key: str, *, client_key: str) -> IdempotencyKey | None:
+    """Return the stored result of an idempotency key sent by ``client_key``."""
+
+    return db.scalar(select(IdempotencyKey).where(IdempotencyKey.client_key == client_key, IdempotencyKey.key == key))
+
+
+def complete_idempotency_key(db: Session, key: str, *, client_key: str, episode_id: int, job_id: int) -> None:
+    """Record what the request that owns ``key`` created; the caller commits."""
+
+    db.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.client_key == client_key, IdempotencyKey.key == key)
+        .values(episode_id=episode_id, job_id=job_id)
+    )
+
+
+def delete_expired_idempotency_keys(db: Session) -> int:
+    """Delete expired keys, commit, and return how many were removed."""
+
+    result = db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at <= datetime.now(timezone.utc)))
+    db.commit()
+    return result.rowcount
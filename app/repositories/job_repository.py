@@ -1,18 +1,158 @@
 """Job repository helpers."""
 
-from sqlalchemy.orm import Session
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from typing import Any
 
-from app.models.job import Job
+from sqlalchemy import (
+    ColumnElement,
+    ScalarSelect,
+    Select,
+    Text,
+    Update,
+    and_,
+    case,
+    cast,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.orm import Session, aliased
 
+from app.core.job_events import JOB_EVENTS_CHANNEL, JobEvent, job_event_broker
+from app.models.episode import Episode
+from app.models.job import JOB_ACTIVE_STATUSES, JOB_PRIORITY_DEFAULT, JOB_TERMINAL_STATUSES, Job
+from app.repositories.pagination import paginate
 
-def create_job(db: Session, episode_id: int, job_type: str = "phase1_stub") -> Job:
-    """Create and persist a new queued job for an episode."""
+_JOB_EVENT_FIELDS = tuple(field.name for field in fields(JobEvent))
+_JOB_STATE_FIELDS = ("status", "progress_pct", "step", "error_message")
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more, which would fail the whole UPDATE; even four
+# bytes per character keeps a truncated message well below that. Listeners needing all of it re-read the row.
+_NOTIFY_ERROR_MESSAGE_CHARS = 1000
 
-    job = Job(episode_id=episode_id, type=job_type, status="queued", progress_pct=0, step="queued")
-    db.add(job)
+
+@dataclass(frozen=True, slots=True)
+class JobStateUpdate:
+    """New state values for one job.
+
+    With a ``worker_id`` the update only applies while that worker still holds the
+    lease of claim number ``attempt``, so a worker whose job was reaped, re-queued
+    or claimed again cannot overwrite the new owner's state.
+    """
+
+    job_id: int
+    status: str
+    progress_pct: int
+    step: str
+    error_message: str | None = None
+    worker_id: str | None = None
+    attempt: int | None = None
+
+    def condition(self) -> ColumnElement[bool]:
+        """Return the ``WHERE`` clause selecting the job row this update may change."""
+
+        if self.worker_id is None:
+            return Job.id == self.job_id
+        return and_(Job.id == self.job_id, Job.worker_id == self.worker_id, Job.attempts == self.attempt)
+
+
+def _notify_value(name: str) -> ColumnElement[Any]:
+    """Return the expression a NOTIFY payload carries for one ``JobEvent`` field."""
+
+    if name == "error_message":
+        return func.left(Job.error_message, _NOTIFY_ERROR_MESSAGE_CHARS)
+    return getattr(Job, name)
+
+
+def _execute_and_publish(db: Session, statement: Update) -> list[Job]:
+    """Run a job ``UPDATE ... RETURNING``, commit, and publish every changed row.
+
+    On PostgreSQL the NOTIFY for other processes is issued from the ``RETURNING``
+    clause, so it costs no extra round trip and is delivered on commit.
+    """
+
+    statement = statement.returning(Job)
+    if db.get_bind().dialect.name == "postgresql":
+        # Keys are rendered inline: json_build_object cannot infer types of bound parameters.
+        event_json = func.json_build_object(
+            *chain.from_iterable((literal_column(f"'{name}'"), _notify_value(name)) for name in _JOB_EVENT_FIELDS)
+        )
+        statement = statement.returning(func.pg_notify(JOB_EVENTS_CHANNEL, cast(event_json, Text)))
+    statement = statement.execution_options(synchronize_session=False, populate_existing=True)
+
+    jobs = [row[0] for row in db.execute(statement).all()]
     db.commit()
-    db.refresh(job)
-    return job
+    for job in jobs:
+        job_event_broker.publish(JobEvent.from_job(job))
+    return jobs
+
+
+def fair_rank_base(client_key: str) -> ScalarSelect[int]:
+    """Return a query for the rank after which a client's next job is queued.
+
+    That is the client's last queued rank, or the rank just before the head of the
+    queue if it is further along, so a client that was idle joins the rotation at
+    the current position instead of jumping ahead of everyone's backlog.
+    """
+
+    candidates = union_all(
+        select((func.min(Job.fair_rank) - 1).label("rank")).where(Job.status == "queued"),
+        select(func.max(Job.fair_rank).label("rank")).where(Job.status == "queued", Job.client_key == client_key),
+        select(literal(0).label("rank")),
+    ).subquery()
+    return select(func.max(candidates.c.rank)).scalar_subquery()
+
+
+def insert_jobs(
+    db: Session,
+    episode_ids: Sequence[int],
+    job_type: str = "episode_pipeline",
+    cache_bypass: Sequence[bool] | None = None,
+    *,
+    priority: int = JOB_PRIORITY_DEFAULT,
+    client_key: str = "anonymous",
+    rank_base: int | None = None,
+) -> list[int]:
+    """Bulk insert one queued job per episode and return the job ids in input order.
+
+    ``cache_bypass[i]`` makes the job for ``episode_ids[i]`` skip the generation
+    cache. The jobs get consecutive fair-share ranks after ``rank_base``, which is
+    read with ``fair_rank_base`` unless the caller already fetched it. Ids are
+    matched back by episode, so the insert can be batched without relying on
+    ``RETURNING`` row order. The caller owns the transaction and must commit.
+    """
+
+    if not episode_ids:
+        return []
+    if rank_base is None:
+        rank_base = db.scalar(select(fair_rank_base(client_key)))
+    statement = insert(Job).returning(Job.id, Job.episode_id)
+    rows = [
+        {
+            "episode_id": episode_id,
+            "type": job_type,
+            "status": "queued",
+            "progress_pct": 0,
+            "step": "queued",
+            "cache_bypass": bypass,
+            "priority": priority,
+            "client_key": client_key,
+            "fair_rank": rank_base + offset,
+        }
+        for offset, (episode_id, bypass) in enumerate(
+            zip(episode_ids, cache_bypass or [False] * len(episode_ids)), start=1
+        )
+    ]
+    inserted = {episode_id: job_id for job_id, episode_id in db.execute(statement, rows)}
+    return [inserted[episode_id] for episode_id in episode_ids]
 
 
 def get_job(db: Session, job_id: int) -> Job | None:
@@ -21,17 +161,188 @@ def get_job(db: Session, job_id: int) -> Job | None:
     return db.get(Job, job_id)
 
 
-def update_job_state(db: Session, job_id: int, *, status: str, progress_pct: int, step: str, error_message: str | None = None) -> Job | None:
-    """Update the current state values for a job."""
+def get_job_status(db: Session, job_id: int) -> str | None:
+    """Return only the current status of a job."""
+
+    return db.scalar(select(Job.status).where(Job.id == job_id))
 
-    job = get_job(db, job_id)
-    if not job:
-        return None
 
-    job.status = status
-    job.progress_pct = progress_pct
-    job.step = step
-    job.error_message = error_message
+def cancel_job(db: Session, job_id: int) -> Job | None:
+    """Mark a queued or running job as cancelled and publish the change.
+
+    Returns ``None`` when the job does not exist or has already finished. A queued
+    job is never claimed afterwards; a running job's worker notices the status at
+    its next stage boundary and stops.
+    """
+
+    statement = (
+        update(Job)
+        .where(Job.id == job_id, Job.status.in_(JOB_ACTIVE_STATUSES))
+        .values(status="cancelled", step="cancelled", lease_expires_at=None)
+    )
+    jobs = _execute_and_publish(db, statement)
+    return jobs[0] if jobs else None
+
+
+def list_jobs_page(
+    db: Session,
+    *,
+    cursor: str | None = None,
+    limit: int = 20,
+    status: str | None = None,
+    series_id: int | None = None,
+    theme_id: int | None = None,
+) -> tuple[list[Job], str | None]:
+    """Return one newest-first page of jobs matching the filters and the next cursor."""
+
+    statement: Select[tuple[Job]] = select(Job)
+    if status is not None:
+        statement = statement.where(Job.status == status)
+    if series_id is not None or theme_id is not None:
+        statement = statement.join(Episode, Episode.id == Job.episode_id)
+        if series_id is not None:
+            statement = statement.where(Episode.series_id == series_id)
+        if theme_id is not None:
+            statement = statement.where(Episode.theme_id == theme_id)
+    return paginate(db, statement, created_at=Job.created_at, row_id=Job.id, cursor=cursor, limit=limit)
+
+
+def claim_next_job(
+    db: Session, *, worker_id: str, lease_seconds: int, max_running_per_client: int | None = None
+) -> Job | None:
+    """Atomically lease the next queued job to a worker.
+
+    Jobs are taken by priority, then fair-share rank, then age, skipping clients
+    that already have ``max_running_per_client`` running jobs. PostgreSQL selects
+    the candidate with ``FOR UPDATE SKIP LOCKED`` so concurrent workers never wait
+    on or double-claim a row; the cap is best effort there, since two workers may
+    both see a client one below it. SQLite drops the locking clause but serializes
+    writers, which keeps the single ``UPDATE ... RETURNING`` atomic there too.
+    """
+
+    queued = aliased(Job)
+    candidate = select(queued.id).where(queued.status == "queued")
+    if max_running_per_client is not None:
+        running = aliased(Job)
+        running_count = (
+            select(func.count())
+            .select_from(running)
+            .where(running.status == "running", running.client_key == queued.client_key)
+            .correlate(queued)
+            .scalar_subquery()
+        )
+        candidate = candidate.where(running_count < max_running_per_client)
+    candidate = (
+        candidate.order_by(queued.priority.desc(), queued.fair_rank.asc(), queued.id.asc())
+        .limit(1)
+        .with_for_update(skip_locked=True, of=queued)
+        .scalar_subquery()
+    )
+    statement = (
+        update(Job)
+        .where(Job.id == candidate, Job.status == "queued")
+        .values(
+            status="running",
+            step="claimed",
+            worker_id=worker_id,
+            lease_expires_at=datetime.now(timezone.utc) + timedelta(seconds=lease_seconds),
+            attempts=Job.attempts + 1,
+        )
+    )
+    jobs = _execute_and_publish(db, statement)
+    return jobs[0] if jobs else None
+
+
+def renew_job_leases(db: Session, leases: dict[int, str], *, lease_seconds: int) -> set[int]:
+    """Extend the leases of running jobs still held by the given workers.
+
+    ``leases`` maps job ids to the worker id that claimed them. All leases are
+    renewed with one ``UPDATE``, which also bumps ``updated_at``. Returns the ids
+    whose lease was renewed; a missing id was finished, cancelled or reaped.
+    """
+
+    if not leases:
+        return set()
+    statement = (
+        update(Job)
+        .where(tuple_(Job.id, Job.worker_id).in_(list(leases.items())), Job.status == "running")
+        .values(lease_expires_at=datetime.now(timezone.utc) + timedelta(seconds=lease_seconds))
+        .returning(Job.id)
+        .execution_options(synchronize_session=False)
+    )
+    renewed = set(db.scalars(statement).all())
     db.commit()
-    db.refresh(job)
-    return job
+    return renewed
+
+
+def reap_expired_jobs(db: Session, *, max_attempts: int) -> tuple[list[Job], list[Job]]:
+    """Recover running jobs whose worker stopped renewing their lease.
+
+    Jobs with fewer than ``max_attempts`` claims go back to the queue at their
+    original priority and rank; the others fail and their episodes still
+    ``generating`` get back the status and script they had before the job started
+    generating them. Each outcome is one ``UPDATE`` published to
+    viewers, so concurrent reapers never handle a job twice. Returns the re-queued
+    and the failed jobs.
+    """
+
+    expired = (Job.status == "running", Job.lease_expires_at < datetime.now(timezone.utc))
+    requeued = _execute_and_publish(
+        db,
+        update(Job)
+        .where(*expired, Job.attempts < max_attempts)
+        .values(status="queued", progress_pct=0, step="requeued", worker_id=None, lease_expires_at=None),
+    )
+    failed = _execute_and_publish(
+        db,
+        update(Job)
+        .where(*expired, Job.attempts >= max_attempts)
+        .values(
+            status="failed",
+            step="failed",
+            lease_expires_at=None,
+            error_message=f"Worker stopped responding; gave up after {max_attempts} attempts",
+        ),
+    )
+    if failed:
+        # Episodes of failed jobs drop their partial scripts and return to their state before generation.
+        db.execute(
+            update(Episode)
+            .where(Episode.id.in_([job.episode_id for job in failed]), Episode.status == "generating")
+            .values(
+                status=func.coalesce(Episode.status_before_generation, "draft"),
+                script_text=Episode.script_before_generation,
+                script_generation=Episode.script_generation + 1,
+                status_before_generation=None,
+                script_before_generation=None,
+            )
+        )
+        db.commit()
+    return requeued, failed
+
+
+def update_job_states(db: Session, updates: Sequence[JobStateUpdate]) -> list[Job]:
+    """Apply several job state updates with a single statement.
+
+    The per-job values are folded into ``CASE`` expressions keyed by job id, so
+    flushing progress for many jobs at once still costs one round trip. Jobs that
+    already reached a terminal status, e.g. because they were cancelled, and jobs no
+    longer leased to the update's worker are left unchanged and are missing from the
+    result.
+    """
+
+    if not updates:
+        return []
+
+    if len(updates) == 1:
+        only = updates[0]
+        condition = only.condition()
+        values = {field: getattr(only, field) for field in _JOB_STATE_FIELDS}
+    else:
+        condition = or_(*(item.condition() for item in updates))
+        values = {
+            field: case({item.job_id: getattr(item, field) for item in updates}, value=Job.id)
+            for field in _JOB_STATE_FIELDS
+        }
+    statement = update(Job).where(condition, Job.status.not_in(JOB_TERMINAL_STATUSES)).values(**values)
+    return _execute_and_publish(db, statement)
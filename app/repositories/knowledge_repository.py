@@ -0,0 +1,28 @@
+"""Theme knowledge repository helpers."""
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.theme import Theme
+from app.models.theme_knowledge import ThemeKnowledge
+
+
+def list_theme_passages(db: Session, theme_key: str) -> list[tuple[int, str]]:
+    """Return ``(id, source_text)`` of every knowledge passage of a theme, by id."""
+
+    statement = (
+        select(ThemeKnowledge.id, ThemeKnowledge.source_text)
+        .join(Theme, Theme.id == ThemeKnowledge.theme_id)
+        .where(Theme.key == theme_key)
+        .order_by(ThemeKnowledge.id)
+    )
+    return [(row.id, row.source_text) for row in db.execute(statement)]
+
+
+def list_theme_keys_with_knowledge(db: Session) -> list[str]:
+    """Return the keys of all themes that have at least one knowledge passage."""
+
+    statement = (
+        select(Theme.key).where(select(ThemeKnowledge.id).where(ThemeKnowledge.theme_id == Theme.id).exists())
+    ).order_by(Theme.key)
+    return list(db.scalars(statement).all())
@@ -0,0 +1,28 @@
+"""Change markers that serve as cheap HTTP validators."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeMarker:
+    """The latest ``updated_at`` and the row count of a table.
+
+    Any insert or update changes the timestamp and any delete changes the count,
+    so the pair identifies a table's state without reading its rows.
+    """
+
+    last_modified: datetime | None
+    row_count: int
+
+
+def get_table_marker(db: Session, model: type[Base]) -> ChangeMarker:
+    """Return the change marker of ``model``'s table with one aggregate query."""
+
+    last_modified, row_count = db.execute(select(func.max(model.updated_at), func.count()).select_from(model)).one()
+    return ChangeMarker(last_modified=last_modified, row_count=row_count)
@@ -0,0 +1,47 @@
+"""Media asset repository helpers."""
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from app.models.media_asset import MediaAsset
+
+
+def get_media_asset(db: Session, asset_id: int) -> MediaAsset | None:
+    """Return one media asset by id."""
+
+    return db.get(MediaAsset, asset_id)
+
+
+def list_episode_media_assets(db: Session, episode_id: int) -> list[MediaAsset]:
+    """Return the media assets of an episode in upload order."""
+
+    statement: Select[tuple[MediaAsset]] = (
+        select(MediaAsset).where(MediaAsset.episode_id == episode_id).order_by(MediaAsset.id)
+    )
+    return list(db.scalars(statement).all())
+
+
+def create_media_asset(
+    db: Session,
+    *,
+    episode_id: int,
+    kind: str,
+    content_type: str,
+    sha256: str,
+    size_bytes: int,
+    filename: str | None,
+) -> MediaAsset:
+    """Insert and return a media asset row for a stored blob."""
+
+    asset = MediaAsset(
+        episode_id=episode_id,
+        kind=kind,
+        content_type=content_type,
+        sha256=sha256,
+        size_bytes=size_bytes,
+        filename=filename,
+    )
+    db.add(asset)
+    db.commit()
+    db.refresh(asset)
+    return asset
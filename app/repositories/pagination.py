@@ -0,0 +1,80 @@
+"""Keyset (cursor) pagination over ``(created_at, id)``, newest first."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, TypeVar
+
+from sqlalchemy import Select, String, tuple_, type_coerce
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+RowT = TypeVar("RowT")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(created_at: datetime | str, row_id: int) -> str:
+    """Return an opaque cursor pointing just after the given row."""
+
+    value = created_at.isoformat() if isinstance(created_at, datetime) else created_at
+    raw = json.dumps([value, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """Return the ``(created_at, id)`` pair encoded in a cursor."""
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+    if not isinstance(created_at, str) or not isinstance(row_id, int):
+        raise InvalidCursorError("Invalid cursor")
+    return created_at, row_id
+
+
+def paginate(
+    db: Session,
+    statement: Select[tuple[RowT]],
+    *,
+    created_at: InstrumentedAttribute[Any],
+    row_id: InstrumentedAttribute[int],
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[RowT], str | None]:
+    """Return one page of ``statement`` and the cursor of the next page, if any.
+
+    Pages are selected with a row-value comparison on ``(created_at, id)`` so that a
+    matching composite index serves every page at the same cost, however deep.
+    """
+
+    # SQLite stores timestamps as text in whichever format they were written with;
+    # comparing the raw text keeps rows that share a second from being skipped or repeated.
+    key = type_coerce(created_at, String) if db.get_bind().dialect.name == "sqlite" else created_at
+
+    if cursor is not None:
+        after_created_at, after_id = decode_cursor(cursor)
+        bound: datetime | str = after_created_at
+        if key is created_at:
+            try:
+                bound = datetime.fromisoformat(after_created_at)
+            except ValueError as exc:
+                raise InvalidCursorError("Invalid cursor") from exc
+        statement = statement.where(tuple_(key, row_id) < tuple_(bound, after_id))
+
+    statement = (
+        statement.add_columns(key.label("page_created_at"), row_id.label("page_id"))
+        .order_by(created_at.desc(), row_id.desc())
+        .limit(limit + 1)
+    )
+    rows = db.execute(statement).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1][1], rows[-1][2])
+    return [row[0] for row in rows], next_cursor
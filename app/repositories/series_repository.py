@@ -1,6 +1,8 @@
 """Story series repository helpers."""
 
-from sqlalchemy import Select, select
+from collections.abc import Collection, Mapping
+
+from sqlalchemy import Select, case, select, update
 from sqlalchemy.orm import Session
 
 from app.models.story_series import StorySeries
@@ -24,3 +26,39 @@ def get_default_series(db: Session) -> StorySeries | None:
 
     statement: Select[tuple[StorySeries]] = select(StorySeries).order_by(StorySeries.id.asc()).limit(1)
     return db.scalar(statement)
+
+
+def get_existing_series_ids(db: Session, series_ids: Collection[int]) -> set[int]:
+    """Return the subset of ``series_ids`` that exist."""
+
+    if not series_ids:
+        return set()
+    return set(db.scalars(select(StorySeries.id).where(StorySeries.id.in_(series_ids))).all())
+
+
+def reserve_episode_numbers(db: Session, counts: Mapping[int, int]) -> dict[int, int]:
+    """Reserve ``counts[series_id]`` consecutive episode numbers per series.
+
+    The per-series counter is advanced with one atomic ``UPDATE ... RETURNING``, so
+    concurrent writers never hand out the same number and no aggregate over the
+    series' episodes is needed. Returns the first reserved number of each series
+    that exists; the row locks are held until the caller commits.
+    """
+
+    if not counts:
+        return {}
+    if len(counts) == 1:
+        ((series_id, count),) = counts.items()
+        condition = StorySeries.id == series_id
+        increment = count
+    else:
+        condition = StorySeries.id.in_(list(counts))
+        increment = case(dict(counts), value=StorySeries.id)
+    statement = (
+        update(StorySeries)
+        .where(condition)
+        # The counter is not part of any representation, so it leaves the series' validator alone.
+        .values(last_episode_number=StorySeries.last_episode_number + increment, updated_at=StorySeries.updated_at)
+        .returning(StorySeries.id, StorySeries.last_episode_number)
+    )
+    return {series_id: last - counts[series_id] + 1 for series_id, last in db.execute(statement).all()}
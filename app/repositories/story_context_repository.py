@@ -0,0 +1,44 @@
+"""Memoized story context repository helpers."""
+
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.story_context import StoryContext
+from app.repositories.episode_repository import continuation_chain_marker
+
+
+def get_story_context(db: Session, episode_id: int) -> StoryContext | None:
+    """Return the memoized context of an episode, if its chain is unchanged since it was built."""
+
+    marker = continuation_chain_marker(episode_id)
+    statement = select(StoryContext).where(
+        StoryContext.episode_id == episode_id,
+        StoryContext.chain_length == marker.c.chain_length,
+        StoryContext.chain_updated_at == marker.c.chain_updated_at,
+    )
+    return db.scalar(statement)
+
+
+def save_story_context(
+    db: Session, episode_id: int, *, context_text: str, chain_length: int, chain_updated_at: datetime
+) -> None:
+    """Insert or replace the memoized context of an episode and the chain state it was built from, and commit."""
+
+    insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    statement = insert(StoryContext).values(
+        episode_id=episode_id, context_text=context_text, chain_length=chain_length, chain_updated_at=chain_updated_at
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[StoryContext.episode_id],
+        set_={
+            "context_text": statement.excluded.context_text,
+            "chain_length": statement.excluded.chain_length,
+            "chain_updated_at": statement.excluded.chain_updated_at,
+        },
+    )
+    db.execute(statement)
+    db.commit()
@@ -1,5 +1,7 @@
 """Theme repository helpers."""
 
+from collections.abc import Collection
+
 from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
@@ -17,3 +19,12 @@ def get_theme(db: Session, theme_id: int) -> Theme | None:
     """Return a single theme by id when present."""
 
     return db.get(Theme, theme_id)
+
+
+def get_active_theme_ids(db: Session, theme_ids: Collection[int]) -> set[int]:
+    """Return the subset of ``theme_ids`` that refer to active themes."""
+
+    if not theme_ids:
+        return set()
+    statement = select(Theme.id).where(Theme.id.in_(theme_ids), Theme.active.is_(True))
+    return set(db.scalars(statement).all())
@@ -1,18 +1,32 @@
 """Schema package exports."""
 
 from app.schemas.character import CharacterCreate, CharacterRead
-from app.schemas.episode import EpisodeCreate, EpisodeCreateResponse, EpisodeRead
+from app.schemas.episode import (
+    EpisodeBatchCreate,
+    EpisodeBatchItemResult,
+    EpisodeBatchResponse,
+    EpisodeCreate,
+    EpisodeCreateResponse,
+    EpisodeRead,
+)
 from app.schemas.job import JobRead
+from app.schemas.media_asset import MediaAssetRead
+from app.schemas.pagination import CursorPage
 from app.schemas.series import StorySeriesRead
 from app.schemas.theme import ThemeRead
 
 __all__ = [
     "CharacterCreate",
     "CharacterRead",
+    "CursorPage",
+    "EpisodeBatchCreate",
+    "EpisodeBatchItemResult",
+    "EpisodeBatchResponse",
     "EpisodeCreate",
     "EpisodeCreateResponse",
     "EpisodeRead",
     "JobRead",
+    "MediaAssetRead",
     "StorySeriesRead",
     "ThemeRead",
 ]
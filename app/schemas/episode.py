@@ -15,6 +15,7 @@ class EpisodeCreate(BaseModel):
     character_ids: list[int] = Field(default_factory=list)
     target_duration_sec: int = Field(default=15, ge=5, le=120)
     title: str | None = None
+    bypass_cache: bool = False
 
 
 class EpisodeRead(BaseModel):
@@ -41,3 +42,27 @@ class EpisodeCreateResponse(BaseModel):
 
     episode_id: int
     job_id: int
+
+
+EPISODE_BATCH_MAX_ITEMS = 500
+
+
+class EpisodeBatchCreate(BaseModel):
+    """Payload to create many episode jobs in one request."""
+
+    items: list[EpisodeCreate] = Field(min_length=1, max_length=EPISODE_BATCH_MAX_ITEMS)
+
+
+class EpisodeBatchItemResult(BaseModel):
+    """Outcome of one batch item; ids are set on success, ``error`` on failure."""
+
+    index: int
+    episode_id: int | None = None
+    job_id: int | None = None
+    error: str | None = None
+
+
+class EpisodeBatchResponse(BaseModel):
+    """Response payload for batch episode creation in request order."""
+
+    results: list[EpisodeBatchItemResult]
@@ -15,6 +15,7 @@ class JobRead(BaseModel):
     progress_pct: int
     step: str
     error_message: str | None
+    priority: int
     created_at: datetime
     updated_at: datetime
 
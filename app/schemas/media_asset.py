@@ -0,0 +1,20 @@
+"""Media asset schema definitions."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class MediaAssetRead(BaseModel):
+    """Response payload for media asset metadata."""
+
+    id: int
+    episode_id: int
+    kind: str
+    content_type: str
+    sha256: str
+    size_bytes: int
+    filename: str | None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,14 @@
+"""Pagination schema definitions."""
+
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+ItemT = TypeVar("ItemT")
+
+
+class CursorPage(BaseModel, Generic[ItemT]):
+    """One page of a keyset-paginated listing."""
+
+    items: list[ItemT]
+    next_cursor: str | None = None
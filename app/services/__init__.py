@@ -1,6 +1,6 @@
 """Service package exports."""
 
-from app.services.episode_service import create_episode_and_job
-from app.services.job_service import run_job_stub
+from app.services.episode_service import create_episode_and_job, create_episodes_batch
+from app.services.job_service import run_episode_pipeline
 
-__all__ = ["create_episode_and_job", "run_job_stub"]
+__all__ = ["create_episode_and_job", "create_episodes_batch", "run_episode_pipeline"]
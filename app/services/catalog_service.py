@@ -0,0 +1,110 @@
+"""Cached catalog reads shared by the API and the web UI."""
+
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.catalog_cache import catalog_cache
+from app.core.conditional import version_tag
+from app.models.character import Character
+from app.models.story_series import StorySeries
+from app.models.theme import Theme
+from app.repositories.aio import get_table_marker, list_characters, list_recent_episodes, list_series, list_themes
+from app.schemas.character import CharacterRead
+from app.schemas.episode import EpisodeRead
+from app.schemas.series import StorySeriesRead
+from app.schemas.theme import ThemeRead
+
+THEMES = "themes"
+CHARACTERS = "characters"
+SERIES = "series"
+RECENT_EPISODES = "recent_episodes"
+
+CATALOG_MODELS = {THEMES: Theme, CHARACTERS: Character, SERIES: StorySeries}
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogList(Generic[SchemaT]):
+    """A cached catalog list with the ETag and last modification time of the rows it holds."""
+
+    items: tuple[SchemaT, ...]
+    etag: str
+    last_modified: datetime | None
+
+
+async def _cached(
+    name: str,
+    db: AsyncSession,
+    query: Callable[[AsyncSession], Awaitable[Sequence[Any]]],
+    schema: type[SchemaT],
+) -> tuple[SchemaT, ...]:
+    """Serve ``name`` from the cache, loading rows as detached read schemas on a miss."""
+
+    async def load() -> list[SchemaT]:
+        return [schema.model_validate(row) for row in await query(db)]
+
+    return await catalog_cache.get_or_load(name, load)
+
+
+async def _cached_catalog(
+    name: str,
+    db: AsyncSession,
+    query: Callable[[AsyncSession], Awaitable[Sequence[Any]]],
+    schema: type[SchemaT],
+) -> CatalogList[SchemaT]:
+    """Serve catalog ``name`` with its validators from the cache; only a miss reads the table marker.
+
+    The marker is read before the rows, so a concurrent write can only leave the
+    ETag older than the body, which costs clients one more full response, never
+    newer, which would let them keep a stale body.
+    """
+
+    async def load() -> tuple[list[SchemaT], tuple[str, datetime | None]]:
+        marker = await get_table_marker(db, CATALOG_MODELS[name])
+        items = [schema.model_validate(row) for row in await query(db)]
+        return items, (version_tag(name, marker.row_count, marker.last_modified), marker.last_modified)
+
+    items, (etag, last_modified) = await catalog_cache.get_or_load_validated(name, load)
+    return CatalogList(items, etag, last_modified)
+
+
+async def get_theme_list(db: AsyncSession) -> CatalogList[ThemeRead]:
+    """Return all active themes sorted by label, with their validators."""
+
+    return await _cached_catalog(THEMES, db, list_themes, ThemeRead)
+
+
+async def get_character_list(db: AsyncSession) -> CatalogList[CharacterRead]:
+    """Return active characters sorted by name, with their validators."""
+
+    return await _cached_catalog(CHARACTERS, db, list_characters, CharacterRead)
+
+
+async def get_series_list(db: AsyncSession) -> CatalogList[StorySeriesRead]:
+    """Return all story series ordered by creation date descending, with their validators."""
+
+    return await _cached_catalog(SERIES, db, list_series, StorySeriesRead)
+
+
+async def get_recent_episodes(db: AsyncSession) -> tuple[EpisodeRead, ...]:
+    """Return recent episodes for quick UI selection."""
+
+    return await _cached(RECENT_EPISODES, db, list_recent_episodes, EpisodeRead)
+
+
+def invalidate_characters() -> None:
+    """Drop cached characters after a character write."""
+
+    catalog_cache.invalidate(CHARACTERS)
+
+
+def invalidate_recent_episodes() -> None:
+    """Drop cached recent episodes after an episode write."""
+
+    catalog_cache.invalidate(RECENT_EPISODES)
@@ -1,62 +1,199 @@
 """Episode orchestration service for phase 1."""
 
-from fastapi import BackgroundTasks, HTTPException, status
+import hashlib
+from collections import Counter
+from typing import Any
+
+from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.repositories.character_repository import get_characters_by_ids
-from app.repositories.episode_repository import create_episode, get_episode
-from app.repositories.job_repository import create_job
-from app.repositories.series_repository import get_default_series, get_series
-from app.repositories.theme_repository import get_theme
-from app.schemas.episode import EpisodeCreate
-from app.services.job_service import run_job_stub
+from app.core.config import get_settings
+from app.models.job import JOB_PRIORITY_BATCH, JOB_PRIORITY_DEFAULT
+from app.repositories.character_repository import get_existing_character_ids
+from app.repositories.episode_repository import get_episode_references, get_existing_episode_ids, insert_episodes
+from app.repositories.idempotency_repository import (
+    claim_idempotency_key,
+    complete_idempotency_key,
+    get_idempotency_key,
+)
+from app.repositories.job_repository import insert_jobs
+from app.repositories.series_repository import get_default_series, get_existing_series_ids, reserve_episode_numbers
+from app.repositories.theme_repository import get_active_theme_ids
+from app.schemas.episode import EpisodeBatchItemResult, EpisodeCreate
+from app.services.catalog_service import invalidate_recent_episodes
 
 
-def _resolve_series_id(db: Session, series_id: int | None) -> int:
-    """Resolve a requested series id or fallback to the default series."""
+def _episode_row(payload: EpisodeCreate, series_id: int, episode_number: int) -> dict[str, Any]:
+    """Return the insert values of a new draft episode."""
 
-    if series_id is not None:
-        if not get_series(db, series_id):
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Series not found")
-        return series_id
+    return {
+        "series_id": series_id,
+        "episode_number": episode_number,
+        "title": payload.title or "Generated Episode",
+        "user_prompt": payload.user_prompt,
+        "theme_id": payload.theme_id,
+        "continuation_from_episode_id": payload.continuation_from_episode_id,
+        "target_duration_sec": payload.target_duration_sec,
+        "status": "draft",
+    }
 
-    default_series = get_default_series(db)
-    if not default_series:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No story series available")
-    return default_series.id
 
+def _replay_idempotent_request(
+    db: Session, idempotency_key: str, client_key: str, request_hash: str
+) -> tuple[int, int]:
+    """Return the ids created by the earlier request ``client_key`` sent with ``idempotency_key``."""
 
-def create_episode_and_job(db: Session, payload: EpisodeCreate, background_tasks: BackgroundTasks) -> tuple[int, int]:
-    """Validate payload, create episode + job, and schedule a stub background task."""
+    existing = get_idempotency_key(db, idempotency_key, client_key=client_key)
+    if existing is not None and existing.request_hash != request_hash:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Idempotency-Key was already used for a different request",
+        )
+    if existing is None or existing.episode_id is None or existing.job_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="A request with this Idempotency-Key is in progress"
+        )
+    return existing.episode_id, existing.job_id
 
-    theme = get_theme(db, payload.theme_id)
-    if not theme or not theme.active:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Theme not found")
 
-    if payload.continuation_from_episode_id is not None:
-        continuation_episode = get_episode(db, payload.continuation_from_episode_id)
-        if not continuation_episode:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Continuation episode not found")
+def create_episode_and_job(
+    db: Session,
+    payload: EpisodeCreate,
+    *,
+    client_key: str = "anonymous",
+    priority: int = JOB_PRIORITY_DEFAULT,
+    idempotency_key: str | None = None,
+) -> tuple[int, int]:
+    """Validate payload, create episode + job, and leave the job queued for a worker.
 
-    characters = get_characters_by_ids(db, payload.character_ids)
-    if len(characters) != len(set(payload.character_ids)):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="One or more characters were not found")
+    All references are validated with one query, then the episode number, episode,
+    character links and job are written with ``RETURNING`` statements and committed
+    once, so creation costs a fixed handful of round trips. The job is queued with
+    ``priority`` in the fair-share rotation of ``client_key``.
+
+    With an ``idempotency_key`` the key is claimed for ``client_key`` first in the
+    same transaction; a repeated request from that client, including one racing the
+    original, returns the original ids without writing anything.
+    """
 
-    resolved_series_id = _resolve_series_id(db, payload.series_id)
-    title = payload.title or "Generated Episode"
+    if idempotency_key is not None:
+        request_hash = hashlib.sha256(payload.model_dump_json().encode()).hexdigest()
+        ttl_seconds = get_settings().idempotency_key_ttl_sec
+        if not claim_idempotency_key(
+            db, idempotency_key, client_key=client_key, request_hash=request_hash, ttl_seconds=ttl_seconds
+        ):
+            return _replay_idempotent_request(db, idempotency_key, client_key, request_hash)
 
-    episode = create_episode(
+    references = get_episode_references(
         db,
-        series_id=resolved_series_id,
-        title=title,
-        user_prompt=payload.user_prompt,
         theme_id=payload.theme_id,
         continuation_from_episode_id=payload.continuation_from_episode_id,
         character_ids=payload.character_ids,
-        target_duration_sec=payload.target_duration_sec,
+        series_id=payload.series_id,
+        client_key=client_key,
     )
+    if not references.theme_active:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Theme not found")
+    if not references.continuation_exists:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Continuation episode not found")
+    if references.character_count != len(set(payload.character_ids)):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="One or more characters were not found")
+    if references.series_id is None:
+        if payload.series_id is not None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Series not found")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No story series available")
 
-    job = create_job(db, episode.id)
-    background_tasks.add_task(run_job_stub, job.id)
+    series_id = references.series_id
+    episode_numbers = reserve_episode_numbers(db, {series_id: 1})
+    if series_id not in episode_numbers:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Series not found")
+    episode_number = episode_numbers[series_id]
+    (episode_id,) = insert_episodes(
+        db, [_episode_row(payload, series_id, episode_number)], [list(dict.fromkeys(payload.character_ids))]
+    )
+    (job_id,) = insert_jobs(
+        db,
+        [episode_id],
+        cache_bypass=[payload.bypass_cache],
+        priority=priority,
+        client_key=client_key,
+        rank_base=references.job_rank_base,
+    )
+    if idempotency_key is not None:
+        complete_idempotency_key(db, idempotency_key, client_key=client_key, episode_id=episode_id, job_id=job_id)
+    db.commit()
+    invalidate_recent_episodes()
+
+    return episode_id, job_id
+
+
+def create_episodes_batch(
+    db: Session,
+    payloads: list[EpisodeCreate],
+    *,
+    client_key: str = "anonymous",
+    priority: int = JOB_PRIORITY_BATCH,
+) -> list[EpisodeBatchItemResult]:
+    """Validate and create many episodes + jobs in one transaction.
+
+    References are checked with one set-based query per entity type. Items that
+    fail validation are reported individually; all valid items are inserted with
+    bulk statements and committed together. Batch jobs default to the lowest
+    priority so bulk backfills never delay interactive submissions.
+    """
+
+    theme_ids = get_active_theme_ids(db, {item.theme_id for item in payloads})
+    series_ids = get_existing_series_ids(db, {item.series_id for item in payloads if item.series_id is not None})
+    continuation_ids = get_existing_episode_ids(
+        db, {item.continuation_from_episode_id for item in payloads if item.continuation_from_episode_id is not None}
+    )
+    character_ids = get_existing_character_ids(db, {cid for item in payloads for cid in item.character_ids})
+    default_series = get_default_series(db) if any(item.series_id is None for item in payloads) else None
+
+    results = [EpisodeBatchItemResult(index=index) for index in range(len(payloads))]
+    accepted: list[tuple[int, EpisodeCreate, int]] = []
+    for index, item in enumerate(payloads):
+        if item.theme_id not in theme_ids:
+            results[index].error = "Theme not found"
+        elif item.continuation_from_episode_id is not None and item.continuation_from_episode_id not in continuation_ids:
+            results[index].error = "Continuation episode not found"
+        elif not character_ids.issuperset(item.character_ids):
+            results[index].error = "One or more characters were not found"
+        elif item.series_id is not None and item.series_id not in series_ids:
+            results[index].error = "Series not found"
+        elif item.series_id is None and default_series is None:
+            results[index].error = "No story series available"
+        else:
+            accepted.append((index, item, item.series_id if item.series_id is not None else default_series.id))
+
+    if not accepted:
+        return results
+
+    next_numbers = reserve_episode_numbers(db, Counter(series_id for _, _, series_id in accepted))
+    # A series deleted since validation reserves nothing; its items fail like any missing series.
+    for index, _, series_id in accepted:
+        if series_id not in next_numbers:
+            results[index].error = "Series not found"
+    accepted = [entry for entry in accepted if entry[2] in next_numbers]
+    if not accepted:
+        return results
+
+    rows = []
+    for _, item, series_id in accepted:
+        rows.append(_episode_row(item, series_id, next_numbers[series_id]))
+        next_numbers[series_id] += 1
+    episode_ids = insert_episodes(db, rows, [list(dict.fromkeys(item.character_ids)) for _, item, _ in accepted])
+    job_ids = insert_jobs(
+        db,
+        episode_ids,
+        cache_bypass=[item.bypass_cache for _, item, _ in accepted],
+        priority=priority,
+        client_key=client_key,
+    )
+    db.commit()
+    invalidate_recent_episodes()
 
-    return episode.id, job.id
+    for (index, _, _), episode_id, job_id in zip(accepted, episode_ids, job_ids):
+        results[index].episode_id = episode_id
+        results[index].job_id = job_id
+    return results
@@ -1,23 +1,216 @@
-"""Background job simulation service for phase 1."""
+"""Episode generation job handlers."""
 
 import time
+from collections.abc import Callable
+from contextlib import nullcontext
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
 
-from app.db.session import SessionLocal
-from app.repositories.job_repository import update_job_state
+from app.core.config import get_settings
+from app.pipeline import (
+    Pipeline,
+    PipelineCancelledError,
+    PipelineError,
+    build_episode_pipeline,
+    lease_stage_executor,
+    replace_stage_executor,
+)
+from app.pipeline.cache import generation_cache_key, get_generation_cache
+from app.pipeline.stages import GENERATION_MODEL_VERSION
+from app.rag import knowledge_version
+from app.repositories.episode_repository import get_job_episode, save_episode_script
+from app.repositories.job_repository import get_job_status
+from app.services.catalog_service import invalidate_recent_episodes
+from app.services.progress_writer import ProgressWriter
+from app.services.script_writer import ScriptWriter
+from app.services.story_context_service import load_story_context
 
+# Share of the progress bar reserved for the stages; the rest covers saving results.
+PIPELINE_PROGRESS_PCT = 95
 
-def run_job_stub(job_id: int) -> None:
-    """Simulate asynchronous processing by updating a job through fixed steps."""
 
-    steps = [
-        ("running", 25, "validating input", 0.1),
-        ("running", 60, "assembling context", 0.1),
-        ("running", 90, "preparing output", 0.1),
-        ("completed", 100, "completed", 0.0),
-    ]
+@dataclass(frozen=True, slots=True)
+class _EpisodeRequest:
+    episode_id: int
+    inputs: dict[str, Any]
+    cache_key: str
+    cache_bypass: bool
+    # Restored when the generation fails or is cancelled.
+    status: str
+    script_text: str | None
 
-    for status, progress_pct, step, delay in steps:
-        if delay:
-            time.sleep(delay)
-        with SessionLocal() as db:
-            update_job_state(db, job_id, status=status, progress_pct=progress_pct, step=step)
+
+def _load_episode_request(progress: ProgressWriter, job_id: int) -> _EpisodeRequest:
+    """Load the episode of a job and build the pipeline inputs and cache key."""
+
+    with progress.session_factory() as db:
+        loaded = get_job_episode(db, job_id)
+        if loaded is None:
+            raise ValueError(f"Job {job_id} has no episode")
+        episode, cache_bypass = loaded
+        story_context = None
+        if episode.continuation_from_episode_id is not None:
+            story_context = load_story_context(db, episode.continuation_from_episode_id)
+        theme = {"key": episode.theme.key, "label": episode.theme.label, "description": episode.theme.description}
+        characters = [
+            {
+                "name": link.character.name,
+                "speech_style": link.character.speech_style,
+                "description": link.character.description,
+            }
+            for link in episode.characters
+        ]
+        inputs = {
+            "user_prompt": episode.user_prompt,
+            "theme_key": theme["key"],
+            "theme_label": theme["label"],
+            "theme_description": theme["description"],
+            "characters": characters,
+            "story_context": story_context,
+        }
+        cache_key = generation_cache_key(
+            user_prompt=episode.user_prompt,
+            theme=theme,
+            characters=characters,
+            target_duration_sec=episode.target_duration_sec,
+            story_context=story_context,
+            knowledge_version=knowledge_version(theme["key"]),
+            model_version=GENERATION_MODEL_VERSION,
+        )
+        if episode.status == "generating":
+            # Left behind by an attempt whose worker died; its partial script is discarded.
+            status, script_text = episode.status_before_generation or "draft", episode.script_before_generation
+            return _EpisodeRequest(episode.id, inputs, cache_key, cache_bypass, status, script_text)
+        return _EpisodeRequest(episode.id, inputs, cache_key, cache_bypass, episode.status, episode.script_text)
+
+
+def _is_cancelled(progress: ProgressWriter, job_id: int) -> bool:
+    """Return whether the job was cancelled while it was running."""
+
+    with progress.session_factory() as db:
+        return get_job_status(db, job_id) == "cancelled"
+
+
+def _should_stop(progress: ProgressWriter, job_id: int) -> bool:
+    """Return whether the job lost its worker's lease or was cancelled."""
+
+    return progress.lease_revoked(job_id) or _is_cancelled(progress, job_id)
+
+
+def _taken_over(progress: ProgressWriter, job_id: int) -> bool:
+    """Return whether another worker may own the job now, so its episode must be left alone."""
+
+    return progress.lease_revoked(job_id) and not _is_cancelled(progress, job_id)
+
+
+def _cancellation_check(progress: ProgressWriter, job_id: int, interval_sec: float) -> Callable[[], bool]:
+    """Return a ``should_stop`` callback cheap enough for every streamed chunk.
+
+    A lost lease is seen at once; the job status is read at most once per
+    ``interval_sec``, and the callback stays true once the job was seen cancelled.
+    """
+
+    checked_at = 0.0
+    cancelled = False
+
+    def should_stop() -> bool:
+        nonlocal checked_at, cancelled
+        if progress.lease_revoked(job_id):
+            return True
+        now = time.monotonic()
+        if not cancelled and now - checked_at >= interval_sec:
+            checked_at = now
+            cancelled = _is_cancelled(progress, job_id)
+        return cancelled
+
+    return should_stop
+
+
+def _complete(progress: ProgressWriter, job_id: int, episode_id: int, script_text: str, summary: str) -> None:
+    """Store the generated text on the episode and mark the job completed."""
+
+    if progress.lease_revoked(job_id):
+        raise PipelineCancelledError("Job lease was lost")
+    with progress.session_factory() as db:
+        save_episode_script(db, episode_id, script_text=script_text, summary=summary)
+    invalidate_recent_episodes()
+    progress.report(job_id, status="completed", progress_pct=100, step="completed")
+
+
+def run_episode_pipeline(
+    job_id: int,
+    progress: ProgressWriter | None = None,
+    *,
+    pipeline: Pipeline | None = None,
+    executor: Executor | None = None,
+) -> None:
+    """Generate an episode by running the stage graph and store its script and summary.
+
+    Identical earlier requests are answered from the generation cache without
+    running any stage, unless the job asked to bypass it. Otherwise progress is the
+    completed share of the stages' weights, reported after each stage, and the new
+    result is cached. With a thread executor the script is appended to the episode
+    in batches while the LLM stage streams it, so viewers can follow along.
+
+    The job's status and lease are checked after every stage, by the streaming LLM
+    stage on every chunk, and before results are stored; a cancelled job, or one
+    whose lease the worker lost, raises ``PipelineCancelledError`` without storing
+    results. ``JOB_TIMEOUT_SEC`` bounds the
+    whole run and stage timeouts bound each stage (``PipelineTimeoutError``). When the
+    stages fail, time out or are cancelled, the partial streamed script is dropped and
+    the episode gets back the status it had before the run, unless another worker
+    may have taken the job over. Stages abandoned while
+    still running retire the shared stage executor, so their stuck workers do not
+    shrink it for later jobs; it is shut down once no run uses it any more.
+    """
+
+    progress = progress or ProgressWriter()
+    request = _load_episode_request(progress, job_id)
+    cache = get_generation_cache() if get_settings().generation_cache_enabled else None
+
+    if cache is not None and not request.cache_bypass:
+        cached = cache.get(request.cache_key)
+        if cached is not None:
+            if _should_stop(progress, job_id):
+                raise PipelineCancelledError("Pipeline was cancelled")
+            _complete(progress, job_id, request.episode_id, cached["script"], cached["summary"])
+            return
+
+    shared_executor = executor is None
+    # The lease keeps a replaced shared pool alive until this run is done with it.
+    with lease_stage_executor() if shared_executor else nullcontext(executor) as executor:
+        script_writer = None
+        if pipeline is None:
+            # Chunk callbacks cannot cross a process boundary; process pools store the script once.
+            if not isinstance(executor, ProcessPoolExecutor):
+                should_stop = _cancellation_check(progress, job_id, get_settings().script_stream_flush_interval_sec)
+                script_writer = ScriptWriter(request.episode_id, progress.session_factory, should_stop=should_stop)
+                script_writer.start()
+            pipeline = build_episode_pipeline(script_writer.append if script_writer else None)
+
+        def report(stage: str, fraction: float) -> None:
+            progress.report(job_id, status="running", progress_pct=int(fraction * PIPELINE_PROGRESS_PCT), step=stage)
+
+        try:
+            results = pipeline.run(
+                request.inputs,
+                executor,
+                on_progress=report,
+                timeout_sec=get_settings().job_timeout_sec,
+                should_stop=lambda: _should_stop(progress, job_id),
+            )
+        except BaseException as exc:
+            if script_writer is not None:
+                reset = not _taken_over(progress, job_id)
+                script_writer.abort(status=request.status, script_text=request.script_text, reset=reset)
+            if shared_executor and isinstance(exc, PipelineError) and exc.abandoned:
+                replace_stage_executor(executor)
+            raise
+        finally:
+            if script_writer is not None:
+                script_writer.close()
+
+    _complete(progress, job_id, request.episode_id, results["script"], results["summary"])
+    if cache is not None:
+        cache.put(request.cache_key, {"script": results["script"], "summary": results["summary"]})
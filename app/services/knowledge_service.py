@@ -0,0 +1,46 @@
+"""Build the per-theme knowledge vector indexes."""
+
+import math
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.rag import HashingEmbedder, write_index
+from app.repositories.knowledge_repository import list_theme_keys_with_knowledge, list_theme_passages
+
+EMBED_BATCH_SIZE = 1024
+
+
+def build_theme_index(db: Session, theme_key: str, *, root: Path | None = None, nlist: int | None = None) -> int:
+    """Embed all passages of a theme into a new index generation; return the row count.
+
+    Without an explicit ``nlist`` an IVF quantizer with ``sqrt(rows)`` clusters is
+    built once the theme has ``KNOWLEDGE_IVF_MIN_ROWS`` passages.
+    """
+
+    settings = get_settings()
+    passages = list_theme_passages(db, theme_key)
+    embedder = HashingEmbedder(settings.knowledge_embedding_dim)
+    texts = [text for _, text in passages]
+    batches = [embedder.embed(texts[start : start + EMBED_BATCH_SIZE]) for start in range(0, len(texts), EMBED_BATCH_SIZE)]
+    vectors = np.concatenate(batches) if batches else np.zeros((0, embedder.dim), dtype=np.float32)
+    if nlist is None:
+        nlist = int(math.sqrt(len(passages))) if len(passages) >= settings.knowledge_ivf_min_rows else 0
+    write_index(
+        root or Path(settings.knowledge_index_dir),
+        theme_key,
+        [passage_id for passage_id, _ in passages],
+        vectors,
+        texts,
+        embedder=embedder.name,
+        nlist=nlist,
+    )
+    return len(passages)
+
+
+def build_all_theme_indexes(db: Session, *, root: Path | None = None, nlist: int | None = None) -> dict[str, int]:
+    """Rebuild the index of every theme that has knowledge passages."""
+
+    return {key: build_theme_index(db, key, root=root, nlist=nlist) for key in list_theme_keys_with_knowledge(db)}
@@ -0,0 +1,135 @@
+"""Coalescing writer for job progress reported by workers."""
+
+import threading
+import time
+from types import TracebackType
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import get_settings
+from app.db.session import SessionLocal
+from app.models.job import JOB_TERMINAL_STATUSES
+from app.repositories.job_repository import JobStateUpdate, update_job_states
+
+
+class ProgressWriter:
+    """Merge rapid job progress reports into batched ``UPDATE ... RETURNING`` writes.
+
+    A report is written at once when its job has not been flushed within the
+    coalescing window or when it carries a terminal status; otherwise it replaces
+    the job's pending state. Every write flushes all pending jobs together, so one
+    statement carries progress for many jobs. Call ``flush`` periodically to push
+    trailing updates and ``close`` when done.
+
+    Workers register the lease of each job they run with ``hold_lease``; reports of
+    such a job only apply while that lease still owns the row, and once the lease is
+    revoked ``lease_revoked`` tells the job to stop.
+    """
+
+    def __init__(self, session_factory: sessionmaker = SessionLocal, *, window_sec: float | None = None) -> None:
+        self.session_factory = session_factory
+        self.window_sec = window_sec if window_sec is not None else get_settings().job_progress_flush_interval_sec
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending: dict[int, JobStateUpdate] = {}
+        self._last_written: dict[int, float] = {}
+        self._leases: dict[int, tuple[str, int]] = {}
+        self._revoked: set[int] = set()
+
+    def report(self, job_id: int, *, status: str, progress_pct: int, step: str, error_message: str | None = None) -> None:
+        """Record the latest state of a job, writing it now if it is due."""
+
+        with self._lock:
+            worker_id, attempt = self._leases.get(job_id, (None, None))
+            self._pending[job_id] = JobStateUpdate(
+                job_id, status, progress_pct, step, error_message, worker_id=worker_id, attempt=attempt
+            )
+            last_written = self._last_written.get(job_id)
+            if (
+                status not in JOB_TERMINAL_STATUSES
+                and last_written is not None
+                and time.monotonic() - last_written < self.window_sec
+            ):
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        """Write every pending update in one statement."""
+
+        # Writes are serialized so a slower batch can never overwrite a newer state.
+        with self._write_lock:
+            with self._lock:
+                batch = self._take_pending(time.monotonic())
+            if batch:
+                with self.session_factory() as db:
+                    update_job_states(db, batch)
+
+    def discard(self, job_id: int) -> None:
+        """Forget a job that ended without a terminal report from this writer, e.g. when cancelled."""
+
+        with self._lock:
+            self._pending.pop(job_id, None)
+            self._last_written.pop(job_id, None)
+
+    def hold_lease(self, job_id: int, *, worker_id: str, attempt: int) -> None:
+        """Apply later reports of a job only while ``worker_id`` holds claim ``attempt`` of it."""
+
+        with self._lock:
+            self._leases[job_id] = (worker_id, attempt)
+            self._revoked.discard(job_id)
+
+    def release_lease(self, job_id: int) -> None:
+        """Forget the lease of a job whose run ended; reports already made keep their guard."""
+
+        with self._lock:
+            self._leases.pop(job_id, None)
+            self._revoked.discard(job_id)
+
+    def held_leases(self) -> dict[int, str]:
+        """Return the worker id of every held, unrevoked lease by job id."""
+
+        with self._lock:
+            return {job_id: worker_id for job_id, (worker_id, _) in self._leases.items() if job_id not in self._revoked}
+
+    def revoke_lease(self, job_id: int) -> bool:
+        """Mark a held lease as lost; return False if the job's run already ended."""
+
+        with self._lock:
+            if job_id not in self._leases:
+                return False
+            self._revoked.add(job_id)
+            return True
+
+    def lease_revoked(self, job_id: int) -> bool:
+        """Return whether the job's lease was lost, so its run must stop."""
+
+        with self._lock:
+            return job_id in self._revoked
+
+    def close(self) -> None:
+        """Flush remaining updates."""
+
+        self.flush()
+
+    def __enter__(self) -> "ProgressWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _take_pending(self, now: float) -> list[JobStateUpdate]:
+        """Detach the pending updates and mark their jobs as written; caller holds the lock."""
+
+        batch = list(self._pending.values())
+        self._pending.clear()
+        for item in batch:
+            if item.status in JOB_TERMINAL_STATUSES:
+                self._last_written.pop(item.job_id, None)
+            else:
+                self._last_written[item.job_id] = now
+        return batch
@@ -0,0 +1,121 @@
+"""Batching writer for script text streamed by the generation stage."""
+
+import threading
+import time
+from collections.abc import Callable
+from types import TracebackType
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import get_settings
+from app.db.session import SessionLocal
+from app.pipeline import PipelineCancelledError
+from app.repositories.episode_repository import append_episode_script, reset_episode_script, start_episode_script
+
+
+class ScriptWriter:
+    """Append streamed script chunks to an episode in batched ``UPDATE`` statements.
+
+    Chunks are buffered and written once ``flush_chars`` characters are pending or
+    ``window_sec`` has passed since the last write, so a script of thousands of
+    tokens costs a bounded number of statements while viewers still see text
+    shortly after the first token. ``append`` may be called from any thread; after
+    ``close`` it is ignored. After ``abort``, or once ``should_stop`` (checked on
+    every chunk) returns true, it raises ``PipelineCancelledError``, so a streaming
+    stage that was cancelled or abandoned on timeout stops instead of holding its
+    executor worker until the model finishes.
+    """
+
+    def __init__(
+        self,
+        episode_id: int,
+        session_factory: sessionmaker = SessionLocal,
+        *,
+        flush_chars: int | None = None,
+        window_sec: float | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> None:
+        settings = get_settings()
+        self.episode_id = episode_id
+        self.session_factory = session_factory
+        self.flush_chars = flush_chars if flush_chars is not None else settings.script_stream_flush_chars
+        self.window_sec = window_sec if window_sec is not None else settings.script_stream_flush_interval_sec
+        self.should_stop = should_stop
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._last_written = 0.0
+        self._closed = False
+        self._aborted = False
+
+    def start(self) -> None:
+        """Clear text left by an earlier attempt and mark the episode as generating."""
+
+        with self.session_factory() as db:
+            start_episode_script(db, self.episode_id)
+        self._last_written = time.monotonic()
+
+    def append(self, chunk: str) -> None:
+        """Buffer a chunk, writing the buffer now if it is due."""
+
+        if self._aborted or (self.should_stop is not None and self.should_stop()):
+            raise PipelineCancelledError("Script stream was stopped")
+        with self._lock:
+            if self._closed:
+                return
+            self._pending.append(chunk)
+            self._pending_chars += len(chunk)
+            if self._pending_chars < self.flush_chars and time.monotonic() - self._last_written < self.window_sec:
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        """Write every pending chunk in one statement."""
+
+        # Writes are serialized so batches are appended in the order they were taken.
+        with self._write_lock:
+            with self._lock:
+                text = "".join(self._pending)
+                self._pending.clear()
+                self._pending_chars = 0
+                self._last_written = time.monotonic()
+            if text:
+                with self.session_factory() as db:
+                    append_episode_script(db, self.episode_id, text)
+
+    def abort(self, *, status: str, script_text: str | None, reset: bool = True) -> None:
+        """Drop pending and later chunks and give the episode back its earlier status and script.
+
+        With ``reset=False`` the episode is left as it is, e.g. when another worker
+        took the job over and is streaming its own script.
+        """
+
+        with self._lock:
+            self._closed = True
+            self._aborted = True
+            self._pending.clear()
+            self._pending_chars = 0
+        # Waits for a batch that is being written, so the reset is the last write.
+        with self._write_lock:
+            if reset:
+                with self.session_factory() as db:
+                    reset_episode_script(db, self.episode_id, status=status, script_text=script_text)
+
+    def close(self) -> None:
+        """Flush remaining chunks and ignore any later ones."""
+
+        with self._lock:
+            self._closed = True
+        self.flush()
+
+    def __enter__(self) -> "ScriptWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
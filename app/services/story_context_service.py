@@ -0,0 +1,55 @@
+"""Story-so-far context assembled from an episode's continuation chain."""
+
+from collections.abc import Sequence
+
+from sqlalchemy.orm import Session
+
+from app.models.episode import Episode
+from app.repositories.episode_repository import get_continuation_chain
+from app.repositories.story_context_repository import get_story_context, save_story_context
+
+STORY_CONTEXT_MAX_CHARS = 4000
+
+
+def compact_story_context(chain: Sequence[Episode], max_chars: int = STORY_CONTEXT_MAX_CHARS) -> str:
+    """Join one line per episode, oldest first, dropping the oldest lines beyond ``max_chars``."""
+
+    lines = [f"Episode {episode.episode_number}: {episode.summary or episode.user_prompt}" for episode in chain]
+    kept: list[str] = []
+    length = 0
+    for line in reversed(lines):
+        if kept and length + len(line) + 1 > max_chars:
+            break
+        kept.append(line)
+        length += len(line) + 1
+    omitted = len(lines) - len(kept)
+    if omitted:
+        kept.append(f"({omitted} earlier episodes omitted)")
+    return "\n".join(reversed(kept))
+
+
+def load_story_context(db: Session, episode_id: int) -> str | None:
+    """Return the story context up to and including an episode, memoizing it.
+
+    A hit costs one query; a miss loads the whole chain with one recursive query and
+    stores the result. Saving a new summary drops the memo of the episode and of all
+    its descendants; the memo also records the chain's length and latest
+    ``updated_at`` as loaded, and the read checks them, so a context built from a
+    chain that changed while it was being loaded is never served.
+    """
+
+    memo = get_story_context(db, episode_id)
+    if memo is not None:
+        return memo.context_text
+    chain = get_continuation_chain(db, episode_id)
+    if not chain:
+        return None
+    context_text = compact_story_context(chain)
+    save_story_context(
+        db,
+        episode_id,
+        context_text=context_text,
+        chain_length=len(chain),
+        chain_updated_at=max(episode.updated_at for episode in chain),
+    )
+    return context_text
@@ -0,0 +1,194 @@
+"""Database-backed job queue workers."""
+
+import logging
+import os
+import socket
+import threading
+from collections.abc import Callable
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import get_settings
+from app.db.session import SessionLocal
+from app.models.job import JOB_ERROR_MESSAGE_MAX_CHARS
+from app.pipeline import PipelineCancelledError
+from app.repositories.job_repository import claim_next_job, reap_expired_jobs, renew_job_leases
+from app.services.job_service import run_episode_pipeline
+from app.services.progress_writer import ProgressWriter
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[int, ProgressWriter], None]
+
+JOB_HANDLERS: dict[str, JobHandler] = {
+    "episode_pipeline": run_episode_pipeline,
+    # Jobs queued before the pipeline replaced the phase 1 stub steps.
+    "phase1_stub": run_episode_pipeline,
+}
+
+
+class WorkerPool:
+    """Run a fixed number of worker threads that claim jobs from the ``jobs`` table.
+
+    Each thread leases one job at a time through ``claim_next_job`` and runs the
+    handler registered for its type, so throughput scales with the worker count and
+    is independent of the API process. Claims follow job priority and rotate between
+    clients, optionally capping how many jobs one client has running. All slots
+    share one ``ProgressWriter`` whose pending updates are flushed together once per
+    coalescing window.
+
+    A heartbeat thread renews the leases of all running jobs of the pool in one
+    statement, and a reaper thread re-queues or fails jobs whose lease expired
+    because their worker died. A job whose lease was not renewed is stopped, and
+    its progress writes only ever apply while the lease is held.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker = SessionLocal,
+        *,
+        concurrency: int | None = None,
+        lease_seconds: int | None = None,
+        poll_interval_sec: float | None = None,
+        max_running_per_client: int | None = None,
+        heartbeat_interval_sec: float | None = None,
+        reaper_interval_sec: float | None = None,
+        max_attempts: int | None = None,
+    ) -> None:
+        settings = get_settings()
+        self.session_factory = session_factory
+        self.concurrency = concurrency or settings.worker_concurrency
+        self.lease_seconds = lease_seconds or settings.job_lease_seconds
+        self.poll_interval_sec = poll_interval_sec if poll_interval_sec is not None else settings.worker_poll_interval_sec
+        self.max_running_per_client = max_running_per_client or settings.job_max_running_per_client
+        self.heartbeat_interval_sec = (
+            heartbeat_interval_sec or settings.job_heartbeat_interval_sec or self.lease_seconds / 3
+        )
+        self.reaper_interval_sec = reaper_interval_sec or settings.job_reaper_interval_sec
+        self.max_attempts = max_attempts or settings.job_max_attempts
+        self.progress = ProgressWriter(session_factory)
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def worker_id(self, slot: int) -> str:
+        """Return the identifier recorded on jobs leased by one worker slot."""
+
+        return f"{self.name}:{slot}"
+
+    def run_once(self, slot: int = 0) -> bool:
+        """Claim and run a single job; return False when the queue is empty."""
+
+        with self.session_factory() as db:
+            job = claim_next_job(
+                db,
+                worker_id=self.worker_id(slot),
+                lease_seconds=self.lease_seconds,
+                max_running_per_client=self.max_running_per_client,
+            )
+        if not job:
+            return False
+
+        self.progress.hold_lease(job.id, worker_id=job.worker_id, attempt=job.attempts)
+        handler = JOB_HANDLERS.get(job.type)
+        try:
+            if handler is None:
+                raise ValueError(f"No handler registered for job type '{job.type}'")
+            handler(job.id, self.progress)
+        except PipelineCancelledError:
+            # The cancel request or the job's new owner already stored its state.
+            if self.progress.lease_revoked(job.id):
+                logger.warning("Job %s stopped after losing its lease", job.id)
+            else:
+                logger.info("Job %s was cancelled", job.id)
+            self.progress.discard(job.id)
+        except Exception as exc:
+            logger.exception("Job %s failed", job.id)
+            error_message = str(exc)
+            if len(error_message) > JOB_ERROR_MESSAGE_MAX_CHARS:
+                error_message = error_message[: JOB_ERROR_MESSAGE_MAX_CHARS - 1] + "…"
+            self.progress.report(
+                job.id, status="failed", progress_pct=job.progress_pct, step="failed", error_message=error_message
+            )
+        finally:
+            self.progress.release_lease(job.id)
+        return True
+
+    def heartbeat(self) -> None:
+        """Renew the leases of every job this pool is running and stop jobs whose lease was lost."""
+
+        leases = self.progress.held_leases()
+        if not leases:
+            return
+        with self.session_factory() as db:
+            renewed = renew_job_leases(db, leases, lease_seconds=self.lease_seconds)
+        for job_id in sorted(leases.keys() - renewed):
+            if self.progress.revoke_lease(job_id):
+                logger.warning("Lease of job %s was not renewed; it was cancelled or reaped", job_id)
+
+    def reap(self) -> None:
+        """Re-queue or fail running jobs whose worker stopped sending heartbeats."""
+
+        with self.session_factory() as db:
+            requeued, failed = reap_expired_jobs(db, max_attempts=self.max_attempts)
+        for job in requeued:
+            logger.warning("Re-queued job %s after its lease expired (attempt %s)", job.id, job.attempts)
+        for job in failed:
+            logger.error("Failed job %s after its lease expired %s times", job.id, job.attempts)
+
+    def _run_slot(self, slot: int) -> None:
+        """Loop claiming jobs until the pool is stopped."""
+
+        while not self._stop.is_set():
+            try:
+                processed = self.run_once(slot)
+            except Exception:
+                logger.exception("Worker %s could not claim a job", self.worker_id(slot))
+                processed = False
+            if not processed:
+                self._stop.wait(self.poll_interval_sec)
+
+    def _run_flusher(self) -> None:
+        """Push coalesced progress updates once per window until the pool is stopped."""
+
+        while not self._stop.wait(self.progress.window_sec):
+            try:
+                self.progress.flush()
+            except Exception:
+                logger.exception("Could not flush job progress")
+
+    def _run_every(self, interval_sec: float, task: Callable[[], None], description: str) -> None:
+        """Call ``task`` once per interval until the pool is stopped."""
+
+        while not self._stop.wait(interval_sec):
+            try:
+                task()
+            except Exception:
+                logger.exception("Could not %s", description)
+
+    def start(self) -> None:
+        """Start the worker threads, the progress flusher, the heartbeat and the reaper."""
+
+        self._stop.clear()
+        for slot in range(self.concurrency):
+            thread = threading.Thread(target=self._run_slot, args=(slot,), name=f"job-worker-{slot}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        background = [
+            ("job-progress-flusher", self._run_flusher, ()),
+            ("job-heartbeat", self._run_every, (self.heartbeat_interval_sec, self.heartbeat, "renew job leases")),
+            ("job-reaper", self._run_every, (self.reaper_interval_sec, self.reap, "reap expired jobs")),
+        ]
+        for name, target, args in background:
+            thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Signal all worker threads to finish their current job and exit."""
+
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+        self.progress.close()
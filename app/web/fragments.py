@@ -0,0 +1,44 @@
+"""Cache of rendered template fragments for catalog data shared by every user."""
+
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from jinja2 import Environment
+from markupsafe import Markup
+
+
+@dataclass(frozen=True, slots=True)
+class _Fragment:
+    version: Hashable
+    html: Markup
+
+
+class FragmentCache:
+    """Reuse rendered fragments while the catalog they were rendered from is unchanged.
+
+    Fragments are keyed by the version of their source catalog, such as the ETag
+    the catalog cache serves with a list, so a fragment is rendered once per
+    catalog version. A reload of unchanged data keeps its version and its fragment.
+    """
+
+    def __init__(self, env: Environment) -> None:
+        self.env = env
+        self._fragments: dict[str, _Fragment] = {}
+        self.renders = 0
+
+    def render(self, template_name: str, source: Sequence[Any], version: Hashable, **context: Any) -> Markup:
+        """Return ``template_name`` rendered with ``items=source``, reusing the last render of ``version``."""
+
+        fragment = self._fragments.get(template_name)
+        if fragment is not None and fragment.version == version:
+            return fragment.html
+        html = Markup(self.env.get_template(template_name).render(items=source, **context))
+        self._fragments[template_name] = _Fragment(version, html)
+        self.renders += 1
+        return html
+
+    def clear(self) -> None:
+        """Drop every rendered fragment."""
+
+        self._fragments.clear()
@@ -1,42 +1,106 @@
 """Server-rendered web routes for phase 1."""
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Form, HTTPException, Request
-from fastapi.responses import HTMLResponse
+import asyncio
+import hashlib
+import uuid
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+from fastapi import APIRouter, Depends, Form, HTTPException, Request
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
-
-from app.db.session import get_db
-from app.repositories.episode_repository import get_episode, list_recent_episodes
-from app.repositories.job_repository import get_job
-from app.repositories.series_repository import list_series
-from app.repositories.theme_repository import list_themes
-from app.repositories.character_repository import list_characters
+from jinja2 import BytecodeCache, FileSystemBytecodeCache
+from jinja2.bccache import Bucket
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.clients import client_key
+from app.core.conditional import is_not_modified, not_modified, validator_headers, version_tag
+from app.core.config import get_settings
+from app.core.job_events import JobEvent, JobSubscription, job_event_broker
+from app.db.session import get_async_db
+from app.models.job import JOB_PRIORITY_INTERACTIVE
+from app.repositories.aio import get_episode, get_job
 from app.schemas.episode import EpisodeCreate
+from app.services.catalog_service import get_character_list, get_recent_episodes, get_series_list, get_theme_list
 from app.services.episode_service import create_episode_and_job
+from app.web.fragments import FragmentCache
 
 router = APIRouter(tags=["web"])
-templates = Jinja2Templates(directory="app/templates")
+
+
+class _TemplateBytecodeCache(BytecodeCache):
+    """Store compiled templates on disk, so restarted workers skip compiling.
+
+    The directory is read from ``TEMPLATE_BYTECODE_CACHE_DIR`` on every load and
+    dump and only created on the first dump, so importing this module touches no
+    files; an unset directory disables the cache.
+    """
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        directory = get_settings().template_bytecode_cache_dir
+        if directory:
+            FileSystemBytecodeCache(directory).load_bytecode(bucket)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        directory = get_settings().template_bytecode_cache_dir
+        if directory:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+            FileSystemBytecodeCache(directory).dump_bytecode(bucket)
+
+
+templates = Jinja2Templates(directory="app/templates", bytecode_cache=_TemplateBytecodeCache())
+catalog_fragments = FragmentCache(templates.env)
+
+SSE_KEEPALIVE_SEC = 15.0
+
+
+def precompile_templates() -> None:
+    """Load every template into the environment's cache, from bytecode when available."""
+
+    for name in templates.env.list_templates(extensions=["html"]):
+        templates.env.get_template(name)
+
+
+def _template_digest(*names: str) -> str:
+    """Return a short digest of template sources, so page ETags change when the markup does."""
+
+    digest = hashlib.sha256()
+    for name in names:
+        source, _, _ = templates.env.loader.get_source(templates.env, name)
+        digest.update(source.encode())
+    return digest.hexdigest()[:12]
+
+
+EPISODE_DETAIL_DIGEST = _template_digest("base.html", "episode_detail.html")
 
 
 @router.get("/", response_class=HTMLResponse)
-def index(request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
-    """Render the main input form with catalog data and recent episodes."""
+async def index(request: Request, db: AsyncSession = Depends(get_async_db)) -> HTMLResponse:
+    """Render the main input form with catalog data and recent episodes.
+
+    The theme, series and character options are identical for every user and are
+    rendered once per catalog version; only the rest of the page is rendered per
+    request.
+    """
 
+    themes = await get_theme_list(db)
+    series = await get_series_list(db)
+    characters = await get_character_list(db)
     context = {
         "request": request,
-        "themes": list_themes(db),
-        "characters": list_characters(db),
-        "series": list_series(db),
-        "recent_episodes": list_recent_episodes(db),
+        "idempotency_key": uuid.uuid4().hex,
+        "theme_options": catalog_fragments.render("_theme_options.html", themes.items, themes.etag),
+        "series_options": catalog_fragments.render("_series_options.html", series.items, series.etag),
+        "character_options": catalog_fragments.render("_character_options.html", characters.items, characters.etag),
+        "recent_episodes": await get_recent_episodes(db),
     }
     return templates.TemplateResponse("index.html", context)
 
 
 @router.post("/web/episodes/create", response_class=HTMLResponse)
-def create_episode_from_form(
+async def create_episode_from_form(
     request: Request,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_prompt: str = Form(...),
     theme_id: int = Form(...),
     series_id: int | None = Form(None),
@@ -44,8 +108,10 @@ def create_episode_from_form(
     character_ids: list[int] = Form(default=[]),
     target_duration_sec: int = Form(15),
     title: str = Form(""),
+    bypass_cache: bool = Form(False),
+    idempotency_key: str = Form("", max_length=255),
 ) -> HTMLResponse:
-    """Handle form submission and return a polling job-status partial."""
+    """Handle form submission and return a live job-status partial fed by SSE."""
 
     continuation_id = int(continuation_from_episode_id) if continuation_from_episode_id else None
     payload = EpisodeCreate(
@@ -56,24 +122,35 @@ def create_episode_from_form(
         character_ids=character_ids,
         target_duration_sec=target_duration_sec,
         title=title or None,
+        bypass_cache=bypass_cache,
     )
 
+    key = client_key(request)
     try:
-        episode_id, job_id = create_episode_and_job(db, payload, background_tasks)
+        episode_id, job_id = await db.run_sync(
+            lambda session: create_episode_and_job(
+                session,
+                payload,
+                client_key=key,
+                priority=JOB_PRIORITY_INTERACTIVE,
+                idempotency_key=idempotency_key or None,
+            )
+        )
     except HTTPException as exc:
         context = {"request": request, "error_message": exc.detail}
-        return templates.TemplateResponse("_job_status.html", context, status_code=exc.status_code)
+        return templates.TemplateResponse("_job_status_sse.html", context, status_code=exc.status_code)
 
-    job = get_job(db, job_id)
-    context = {"request": request, "job": job, "episode_id": episode_id}
-    return templates.TemplateResponse("_job_status.html", context)
+    # The job was just inserted as queued; render that state instead of reading it back.
+    job = JobEvent(id=job_id, episode_id=episode_id, status="queued", progress_pct=0, step="queued")
+    context = {"request": request, "job": job, "episode_id": episode_id, "next_idempotency_key": uuid.uuid4().hex}
+    return templates.TemplateResponse("_job_status_sse.html", context)
 
 
 @router.get("/web/jobs/{job_id}/status", response_class=HTMLResponse)
-def get_job_status_partial(job_id: int, request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
+async def get_job_status_partial(job_id: int, request: Request, db: AsyncSession = Depends(get_async_db)) -> HTMLResponse:
     """Render a partial snippet with current job state for HTMX polling."""
 
-    job = get_job(db, job_id)
+    job = await get_job(db, job_id)
     if not job:
         context = {"request": request, "error_message": "Job not found"}
         return templates.TemplateResponse("_job_status.html", context, status_code=404)
@@ -82,13 +159,79 @@ def get_job_status_partial(job_id: int, request: Request, db: Session = Depends(
     return templates.TemplateResponse("_job_status.html", context)
 
 
+def _format_sse(event_name: str, html: str) -> str:
+    """Frame an HTML fragment as one Server-Sent Event."""
+
+    data = "\n".join(f"data: {line}" for line in html.strip().splitlines())
+    return f"event: {event_name}\n{data}\n\n"
+
+
+def _render_job_event(event: JobEvent) -> str:
+    """Render a job event as the SSE message the HTMX partial swaps in."""
+
+    if event.is_terminal:
+        html = templates.get_template("_job_status_sse.html").render(job=event, episode_id=event.episode_id)
+        return _format_sse("job-done", html)
+    html = templates.get_template("_job_status_fields.html").render(job=event, episode_id=event.episode_id)
+    return _format_sse("job-status", html)
+
+
+async def _job_event_stream(subscription: JobSubscription, event: JobEvent) -> AsyncGenerator[str, None]:
+    """Yield the current job state, then every change until the job finishes."""
+
+    try:
+        yield _render_job_event(event)
+        last_event = event
+        while not last_event.is_terminal:
+            try:
+                event = await asyncio.wait_for(subscription.next_event(), timeout=SSE_KEEPALIVE_SEC)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if event != last_event:
+                yield _render_job_event(event)
+                last_event = event
+    finally:
+        subscription.close()
+
+
+@router.get("/web/jobs/{job_id}/events")
+async def stream_job_events(job_id: int, db: AsyncSession = Depends(get_async_db)) -> StreamingResponse:
+    """Stream job state changes as Server-Sent Events for the HTMX ``sse`` partial."""
+
+    subscription = job_event_broker.subscribe(job_id)
+    try:
+        job = await get_job(db, job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        event = JobEvent.from_job(job)
+        if not event.is_terminal:
+            job_event_broker.ensure_relay(db.bind)
+    except BaseException:
+        subscription.close()
+        raise
+    finally:
+        # Release the pooled connection now; the stream itself never queries again.
+        await db.close()
+
+    return StreamingResponse(
+        _job_event_stream(subscription, event),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/web/episodes/{episode_id}", response_class=HTMLResponse)
-def episode_detail(episode_id: int, request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
-    """Render the detail page for one episode record."""
+async def episode_detail(episode_id: int, request: Request, db: AsyncSession = Depends(get_async_db)) -> Response:
+    """Render the detail page for one episode record, or ``304`` if the browser's copy is current."""
 
-    episode = get_episode(db, episode_id)
+    episode = await get_episode(db, episode_id)
     if not episode:
         raise HTTPException(status_code=404, detail="Episode not found")
+    etag = version_tag("episode-page", EPISODE_DETAIL_DIGEST, episode_id, episode.updated_at)
+    headers = validator_headers(etag, episode.updated_at)
+    if is_not_modified(request, etag, episode.updated_at):
+        return not_modified(headers)
 
     context = {"request": request, "episode": episode}
-    return templates.TemplateResponse("episode_detail.html", context)
+    return templates.TemplateResponse("episode_detail.html", context, headers=headers)
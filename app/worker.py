@@ -0,0 +1,36 @@
+"""Job queue worker entrypoint.
+
+Run with:
+    python -m app.worker --concurrency 4
+"""
+
+import argparse
+import logging
+import signal
+import threading
+
+from app.services.worker_service import WorkerPool
+
+
+def main() -> None:
+    """Run a worker pool until SIGINT or SIGTERM is received."""
+
+    parser = argparse.ArgumentParser(description="Process queued episode jobs.")
+    parser.add_argument("--concurrency", type=int, default=None, help="number of worker threads")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s [%(name)s] %(message)s")
+
+    stop_requested = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_requested.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_requested.set())
+
+    pool = WorkerPool(concurrency=args.concurrency)
+    pool.start()
+    logging.getLogger(__name__).info("Worker pool started with %s threads", pool.concurrency)
+    stop_requested.wait()
+    pool.stop()
+
+
+if __name__ == "__main__":
+    main()
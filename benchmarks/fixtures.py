@@ -0,0 +1,172 @@
+"""Bulk generator of scale fixture databases for the microbenchmarks.
+
+A fixture of ``rows`` holds that many characters, episodes and jobs (plus one
+character link per episode), ten themes and one series per thousand episodes.
+Rows are written with chunked ``INSERT`` executemany calls, so even the 1M row
+fixture builds in minutes. Build the default SQLite fixtures with:
+    python -m benchmarks.fixtures --rows 1000 100000 1000000
+"""
+
+import argparse
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Engine, create_engine, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models.character import Character
+from app.models.episode import Episode, EpisodeCharacter
+from app.models.job import JOB_PRIORITY_DEFAULT, Job
+from app.models.story_series import StorySeries
+from app.models.theme import Theme
+
+FIXTURE_DIR = Path("data/benchmark_fixtures")
+DEFAULT_SCALES = (1000, 100_000, 1_000_000)
+EPISODES_PER_SERIES = 1000
+THEME_COUNT = 10
+CHUNK_SIZE = 10_000
+
+JOB_STATUSES = ("completed", "completed", "failed", "queued", "running")
+EPISODE_STATUSES = ("generated", "generated", "draft", "generating")
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def fixture_url(rows: int) -> str:
+    """Return the SQLite URL of the default fixture with ``rows`` rows."""
+
+    return f"sqlite+pysqlite:///{FIXTURE_DIR / f'scale_{rows}.db'}"
+
+
+def _chunks(rows: Iterator[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def _characters(rows: int) -> Iterator[dict[str, Any]]:
+    for index in range(rows):
+        yield {
+            "name": f"Character {index:07d}",
+            "speech_style": ("calm", "direct", "playful")[index % 3],
+            "traits_json": {"index": index},
+            "description": "Generated benchmark character",
+            "active": index % 10 != 0,
+            "created_at": EPOCH + timedelta(seconds=index),
+        }
+
+
+def _episodes(rows: int) -> Iterator[dict[str, Any]]:
+    for index in range(rows):
+        yield {
+            "series_id": index // EPISODES_PER_SERIES + 1,
+            "episode_number": index % EPISODES_PER_SERIES + 1,
+            "title": f"Episode {index}",
+            "user_prompt": "A generated benchmark episode.",
+            "theme_id": index % THEME_COUNT + 1,
+            "continuation_from_episode_id": index if index % EPISODES_PER_SERIES else None,
+            "summary": "Summary of a generated episode.",
+            "script_text": "Narrator: Once upon a time.",
+            "target_duration_sec": 15,
+            "status": EPISODE_STATUSES[index % len(EPISODE_STATUSES)],
+            "created_at": EPOCH + timedelta(seconds=index),
+        }
+
+
+def _episode_characters(rows: int) -> Iterator[dict[str, Any]]:
+    for index in range(rows):
+        yield {"episode_id": index + 1, "character_id": (index * 7919) % rows + 1, "role": "support"}
+
+
+def _jobs(rows: int) -> Iterator[dict[str, Any]]:
+    for index in range(rows):
+        status = JOB_STATUSES[index % len(JOB_STATUSES)]
+        yield {
+            "episode_id": index + 1,
+            "type": "episode_pipeline",
+            "status": status,
+            "progress_pct": 100 if status == "completed" else 0,
+            "step": status,
+            "attempts": 0 if status == "queued" else 1,
+            "priority": JOB_PRIORITY_DEFAULT,
+            "client_key": f"client-{index % 100}",
+            "fair_rank": index + 1,
+            "created_at": EPOCH + timedelta(seconds=index),
+            "updated_at": EPOCH + timedelta(seconds=index),
+        }
+
+
+def build_fixture(engine: Engine, rows: int, *, chunk_size: int = CHUNK_SIZE) -> None:
+    """Create the schema on ``engine`` and fill it with ``rows`` rows per large table."""
+
+    Base.metadata.create_all(bind=engine)
+    series_count = max(1, -(-rows // EPISODES_PER_SERIES))
+    with Session(engine) as db:
+        db.execute(
+            insert(Theme),
+            [
+                {"key": f"theme-{index}", "label": f"Theme {index}", "description": "Benchmark theme", "active": True}
+                for index in range(THEME_COUNT)
+            ],
+        )
+        db.execute(
+            insert(StorySeries),
+            [
+                {
+                    "title": f"Series {index}",
+                    "description": "Benchmark series",
+                    "language": "en",
+                    "last_episode_number": min(EPISODES_PER_SERIES, rows - index * EPISODES_PER_SERIES),
+                }
+                for index in range(series_count)
+            ],
+        )
+        for table, generate in [
+            (Character, _characters),
+            (Episode, _episodes),
+            (EpisodeCharacter, _episode_characters),
+            (Job, _jobs),
+        ]:
+            for chunk in _chunks(generate(rows), chunk_size):
+                db.execute(insert(table), chunk)
+        db.commit()
+
+
+def ensure_fixture(rows: int, database_url: str | None = None) -> Engine:
+    """Return an engine for the fixture of ``rows`` rows, building it first if the database is empty."""
+
+    url = database_url or fixture_url(rows)
+    if database_url is None:
+        FIXTURE_DIR.mkdir(parents=True, exist_ok=True)
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        existing = db.scalar(select(func.count(Character.id)))
+    if not existing:
+        build_fixture(engine, rows)
+    elif existing < rows:
+        raise ValueError(f"Database {url} holds {existing} characters, fewer than the requested {rows}")
+    return engine
+
+
+def main() -> None:
+    """Build the requested scale fixtures."""
+
+    parser = argparse.ArgumentParser(description="Build scale fixture databases for the microbenchmarks.")
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_SCALES), help="rows per large table")
+    parser.add_argument("--database-url", default=None, help="fill this database instead (single --rows value)")
+    args = parser.parse_args()
+    if args.database_url is not None and len(args.rows) != 1:
+        parser.error("--database-url takes exactly one --rows value")
+
+    for rows in args.rows:
+        started_at = time.perf_counter()
+        ensure_fixture(rows, args.database_url).dispose()
+        print(f"{rows} row fixture ready in {time.perf_counter() - started_at:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
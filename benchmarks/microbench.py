@@ -0,0 +1,165 @@
+"""Microbenchmarks of repository and serialization hot paths across data sizes.
+
+Every benchmark runs against each scale fixture (see ``benchmarks/fixtures.py``)
+and reports the median and p95 time per call. ``scaling_exponent`` is the slope
+of the median on a log-log scale between the smallest and the largest fixture:
+about 0 means the call does not depend on table size, about 1 means it is O(n).
+Run from the project root with:
+    python -m benchmarks.microbench --rows 1000 100000 1000000
+"""
+
+import argparse
+import json
+import math
+import random
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.character import Character
+from app.models.episode import Episode
+from app.models.job import Job
+from app.repositories.character_repository import get_characters_by_ids, list_characters
+from app.repositories.job_repository import JobStateUpdate, update_job_states
+from app.schemas.episode import EpisodeCreate, EpisodeRead
+from app.schemas.job import JobRead
+from app.services.episode_service import create_episode_and_job, create_episodes_batch
+from benchmarks.fixtures import DEFAULT_SCALES, ensure_fixture
+
+ID_LIST_SIZE = 1000
+SERIALIZE_BATCH = 100
+# Episodes per batch creation and jobs per progress flush.
+WRITE_BATCH = 100
+# An exponent above this marks a path whose cost grows with the data.
+GROWTH_THRESHOLD = 0.3
+
+Benchmark = Callable[[], object]
+
+
+def time_calls(call: Benchmark, *, budget_sec: float, min_calls: int = 5, max_calls: int = 1000) -> dict[str, Any]:
+    """Call ``call`` repeatedly for about ``budget_sec`` and return per-call timings in microseconds."""
+
+    call()
+    timings = []
+    started_at = time.perf_counter()
+    while len(timings) < min_calls or (time.perf_counter() - started_at < budget_sec and len(timings) < max_calls):
+        call_started_at = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - call_started_at) * 1_000_000)
+    timings.sort()
+    return {
+        "calls": len(timings),
+        "median_us": round(statistics.median(timings), 1),
+        "p95_us": round(timings[min(len(timings) - 1, math.ceil(len(timings) * 0.95) - 1)], 1),
+    }
+
+
+def build_benchmarks(sessions: sessionmaker, rng: random.Random) -> dict[str, Benchmark]:
+    """Return the benchmarks bound to one fixture database, keyed by name."""
+
+    with sessions() as db:
+        max_character_id = db.scalar(select(func.max(Character.id)))
+        active_character_ids = list(db.scalars(select(Character.id).where(Character.active.is_(True)).limit(1000)))
+        series_id, theme_id = db.execute(select(Episode.series_id, Episode.theme_id).limit(1)).one()
+        running_job_ids = list(db.scalars(select(Job.id).where(Job.status == "running").limit(1000)))
+        episodes = list(db.scalars(select(Episode).order_by(Episode.id.desc()).limit(SERIALIZE_BATCH)))
+        jobs = list(db.scalars(select(Job).order_by(Job.id.desc()).limit(SERIALIZE_BATCH)))
+
+    def with_session(call: Callable[[Session], object]) -> Benchmark:
+        def run() -> object:
+            with sessions() as db:
+                return call(db)
+
+        return run
+
+    def episode_payload() -> EpisodeCreate:
+        return EpisodeCreate(
+            user_prompt="A benchmark episode.",
+            theme_id=theme_id,
+            series_id=series_id,
+            character_ids=rng.sample(active_character_ids, 2),
+        )
+
+    def progress_updates() -> list[JobStateUpdate]:
+        job_ids = rng.sample(running_job_ids, min(WRITE_BATCH, len(running_job_ids)))
+        return [JobStateUpdate(job_id, "running", rng.randrange(100), "llm") for job_id in job_ids]
+
+    return {
+        "list_characters": with_session(list_characters),
+        f"get_characters_by_ids[{ID_LIST_SIZE}]": with_session(
+            lambda db: get_characters_by_ids(
+                db, rng.sample(range(1, max_character_id + 1), min(ID_LIST_SIZE, max_character_id))
+            )
+        ),
+        "create_episode_and_job": with_session(lambda db: create_episode_and_job(db, episode_payload())),
+        f"create_episodes_batch[{WRITE_BATCH}]": with_session(
+            lambda db: create_episodes_batch(db, [episode_payload() for _ in range(WRITE_BATCH)])
+        ),
+        f"update_job_states[{WRITE_BATCH}]": with_session(lambda db: update_job_states(db, progress_updates())),
+        f"EpisodeRead.model_validate[{SERIALIZE_BATCH}]": lambda: [EpisodeRead.model_validate(e) for e in episodes],
+        f"JobRead.model_validate[{SERIALIZE_BATCH}]": lambda: [JobRead.model_validate(job) for job in jobs],
+    }
+
+
+def scaling_exponent(results: dict[int, dict[str, Any]]) -> float | None:
+    """Return the log-log slope of the median between the smallest and largest scale."""
+
+    if len(results) < 2:
+        return None
+    smallest, largest = min(results), max(results)
+    ratio = results[largest]["median_us"] / results[smallest]["median_us"]
+    return round(math.log(ratio) / math.log(largest / smallest), 2)
+
+
+def run_microbenchmarks(
+    scales: list[int], *, budget_sec: float = 1.0, database_url: str | None = None, seed: int = 0
+) -> dict[str, Any]:
+    """Run every benchmark on every scale fixture and return the report."""
+
+    timings: dict[str, dict[int, dict[str, Any]]] = {}
+    for rows in sorted(scales):
+        engine: Engine = ensure_fixture(rows, database_url)
+        try:
+            sessions = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+            for name, call in build_benchmarks(sessions, random.Random(seed)).items():
+                timings.setdefault(name, {})[rows] = time_calls(call, budget_sec=budget_sec)
+        finally:
+            engine.dispose()
+
+    report: dict[str, Any] = {"scales": sorted(scales), "benchmarks": {}}
+    for name, results in timings.items():
+        exponent = scaling_exponent(results)
+        report["benchmarks"][name] = {
+            "by_rows": {str(rows): stats for rows, stats in results.items()},
+            "scaling_exponent": exponent,
+            "grows_with_data": exponent is not None and exponent > GROWTH_THRESHOLD,
+        }
+    return report
+
+
+def main() -> None:
+    """Run the microbenchmarks and print the report."""
+
+    parser = argparse.ArgumentParser(description="Time repository and serialization hot paths across data sizes.")
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_SCALES), help="fixture sizes to run")
+    parser.add_argument("--budget-sec", type=float, default=1.0, help="time spent per benchmark and size")
+    parser.add_argument("--database-url", default=None, help="fixture database to use (single --rows value)")
+    parser.add_argument("--output", type=Path, default=None, help="also write the report to this file")
+    args = parser.parse_args()
+    if args.database_url is not None and len(args.rows) != 1:
+        parser.error("--database-url takes exactly one --rows value")
+
+    report = run_microbenchmarks(args.rows, budget_sec=args.budget_sec, database_url=args.database_url)
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output is not None:
+        args.output.write_text(output + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Per-object cost of JSON response serialization, FastAPI default versus ``JSONAdapter``.
+
+The default path is FastAPI's own ``serialize_response`` (validation against the
+``response_model`` field and conversion to Python primitives) followed by
+``JSONResponse`` encoding; the fast path is ``JSONAdapter.dump_json``. Both start
+from ORM rows, as the routes do. Run from the project root with:
+    python -m benchmarks.serialization --objects 1 100 1000
+"""
+
+import argparse
+import json
+from collections.abc import Callable, Coroutine
+from datetime import datetime, timezone
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.api.responses import JSONAdapter
+from app.models.episode import Episode
+from app.models.job import Job
+from app.schemas.episode import EpisodeRead
+from app.schemas.job import JobRead
+from benchmarks.microbench import time_calls
+
+CREATED_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def sample_episode(index: int) -> Episode:
+    """Return a detached episode row with a typical script length."""
+
+    return Episode(
+        id=index,
+        series_id=1,
+        episode_number=index,
+        title=f"Episode {index}",
+        user_prompt="A benchmark episode.",
+        theme_id=1,
+        continuation_from_episode_id=index - 1 or None,
+        summary="Summary of a generated episode.",
+        script_text="Narrator: Once upon a time. " * 20,
+        target_duration_sec=15,
+        status="generated",
+        created_at=CREATED_AT,
+    )
+
+
+def sample_job(index: int) -> Job:
+    """Return a detached running job row."""
+
+    return Job(
+        id=index,
+        episode_id=index,
+        type="episode_pipeline",
+        status="running",
+        progress_pct=40,
+        step="llm",
+        error_message=None,
+        priority=10,
+        client_key="benchmark",
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
+    )
+
+
+def _run_inline(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    # serialize_response never suspends for coroutine endpoints, so no event loop is needed.
+    try:
+        coroutine.send(None)
+    except StopIteration as finished:
+        return finished.value
+    raise RuntimeError("serialize_response suspended unexpectedly")
+
+
+def fastapi_default(type_: Any) -> Callable[[Any], bytes]:
+    """Return FastAPI's default response serialization for ``type_``."""
+
+    field = create_model_field(name="Response", type_=type_, mode="serialization")
+
+    def serialize(rows: Any) -> bytes:
+        return JSONResponse(_run_inline(serialize_response(field=field, response_content=rows))).body
+
+    return serialize
+
+
+def run_serialization_benchmark(object_counts: list[int], *, budget_sec: float = 0.5) -> dict[str, Any]:
+    """Time both serialization paths for lists of episodes and jobs and return per-object costs."""
+
+    report: dict[str, Any] = {}
+    for name, schema, build in [("EpisodeRead", EpisodeRead, sample_episode), ("JobRead", JobRead, sample_job)]:
+        default, fast = fastapi_default(list[schema]), JSONAdapter(list[schema])
+        results = {}
+        for count in object_counts:
+            rows = [build(index) for index in range(1, count + 1)]
+            if json.loads(default(rows)) != json.loads(fast.dump_json(rows)):
+                raise AssertionError(f"{name}: serialization paths disagree")
+            default_us = time_calls(lambda: default(rows), budget_sec=budget_sec)["median_us"] / count
+            fast_us = time_calls(lambda: fast.dump_json(rows), budget_sec=budget_sec)["median_us"] / count
+            results[str(count)] = {
+                "fastapi_default_us_per_object": round(default_us, 2),
+                "json_adapter_us_per_object": round(fast_us, 2),
+                "speedup": round(default_us / fast_us, 2),
+            }
+        report[name] = results
+    return report
+
+
+def main() -> None:
+    """Run the serialization benchmark and print the report."""
+
+    parser = argparse.ArgumentParser(description="Compare JSON response serialization paths.")
+    parser.add_argument("--objects", type=int, nargs="+", default=[1, 100, 1000], help="list sizes to serialize")
+    parser.add_argument("--budget-sec", type=float, default=0.5, help="time spent per path and size")
+    args = parser.parse_args()
+    print(json.dumps(run_serialization_benchmark(args.objects, budget_sec=args.budget_sec), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Build the theme knowledge vector indexes used by the RAG stage.
+
+Run with:
+    python -m scripts.build_knowledge_index [theme_key ...] [--nlist N]
+"""
+
+import argparse
+
+from app.db.session import SessionLocal
+from app.services.knowledge_service import build_all_theme_indexes, build_theme_index
+
+
+def main() -> None:
+    """Rebuild the indexes of the given themes, or of every theme with knowledge."""
+
+    parser = argparse.ArgumentParser(description="Build theme knowledge vector indexes.")
+    parser.add_argument("theme_keys", nargs="*", help="themes to rebuild (default: all with knowledge)")
+    parser.add_argument("--nlist", type=int, default=None, help="IVF cluster count (0 disables IVF)")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        if args.theme_keys:
+            counts = {key: build_theme_index(db, key, nlist=args.nlist) for key in args.theme_keys}
+        else:
+            counts = build_all_theme_indexes(db, nlist=args.nlist)
+    for key, count in counts.items():
+        print(f"{key}: {count} passages indexed")
+
+
+if __name__ == "__main__":
+    main()
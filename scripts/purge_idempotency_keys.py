@@ -0,0 +1,20 @@
+"""Delete expired idempotency keys.
+
+Run periodically (for example from cron) with:
+    python -m scripts.purge_idempotency_keys
+"""
+
+from app.db.session import SessionLocal
+from app.repositories.idempotency_repository import delete_expired_idempotency_keys
+
+
+def main() -> None:
+    """Remove every idempotency key past its TTL."""
+
+    with SessionLocal() as db:
+        deleted = delete_expired_idempotency_keys(db)
+    print(f"{deleted} expired idempotency keys deleted")
+
+
+if __name__ == "__main__":
+    main()
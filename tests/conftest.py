@@ -1,29 +1,47 @@
 """Pytest fixtures for phase 1 API and service tests."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Callable, Generator
+from pathlib import Path
+from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
+from app.core.blob_store import get_blob_store
+from app.core.catalog_cache import catalog_cache
+from app.core.config import get_settings
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.main import create_app
 from app.models.character import Character
 from app.models.story_series import StorySeries
 from app.models.theme import Theme
+from app.pipeline.cache import get_generation_cache
 
 
 @pytest.fixture()
-def test_session_factory() -> Generator[sessionmaker, None, None]:
-    """Create an isolated in-memory SQLite session factory for each test."""
+def test_database_path(tmp_path: Path) -> Path:
+    """Return the path of an isolated SQLite database file for each test.
+
+    A file (rather than ``:memory:``) lets the sync worker engine and the async
+    request engine share the same data.
+    """
+
+    return tmp_path / "test.db"
+
+
+@pytest.fixture()
+def test_session_factory(test_database_path: Path) -> Generator[sessionmaker, None, None]:
+    """Create an isolated SQLite session factory for each test."""
 
     engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
+        f"sqlite+pysqlite:///{test_database_path}",
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+        poolclass=NullPool,
     )
     TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
     Base.metadata.create_all(bind=engine)
@@ -34,6 +52,19 @@ def test_session_factory() -> Generator[sessionmaker, None, None]:
         engine.dispose()
 
 
+@pytest.fixture()
+def test_async_session_factory(
+    test_database_path: Path, test_session_factory: sessionmaker
+) -> Generator[async_sessionmaker, None, None]:
+    """Create an aiosqlite session factory over the same database file."""
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{test_database_path}", poolclass=NullPool)
+    try:
+        yield async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    finally:
+        engine.sync_engine.dispose()
+
+
 @pytest.fixture()
 def seeded_db(test_session_factory: sessionmaker) -> Session:
     """Return a database session pre-loaded with one theme, series, and two characters."""
@@ -64,19 +95,93 @@ def seeded_db(test_session_factory: sessionmaker) -> Session:
 
 
 @pytest.fixture()
-def client(test_session_factory: sessionmaker) -> Generator[TestClient, None, None]:
+def client(test_async_session_factory: async_sessionmaker) -> Generator[TestClient, None, None]:
     """Create a FastAPI TestClient with DB dependency override."""
 
     app = create_app()
 
-    def override_get_db() -> Generator[Session, None, None]:
-        db = test_session_factory()
-        try:
+    async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with test_async_session_factory() as db:
             yield db
-        finally:
-            db.close()
 
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def create_episode(client: TestClient, seeded_db: Session) -> Callable[..., dict[str, int]]:
+    """Return a helper that creates an episode through the API and returns its ``episode_id`` and ``job_id``."""
+
+    def create(user_prompt: str = "A test episode.", **fields: Any) -> dict[str, int]:
+        response = client.post("/api/v1/episodes", json={"user_prompt": user_prompt, "theme_id": 1, **fields})
+        assert response.status_code == 201, response.text
+        return response.json()
+
+    return create
+
+
+@pytest.fixture()
+def capture_statements() -> Generator[Callable[..., list[str]], None, None]:
+    """Return a helper that records the SQL sent through a session factory's engine from then on.
+
+    ``capture_statements(factory, prefix="UPDATE")`` keeps only statements starting
+    with ``prefix``. Works for sync and async session factories; the listeners are
+    removed when the test ends.
+    """
+
+    listeners: list[tuple[Engine, Callable[..., None]]] = []
+
+    def capture(session_factory: sessionmaker | async_sessionmaker, *, prefix: str = "") -> list[str]:
+        bind = session_factory.kw["bind"]
+        engine = getattr(bind, "sync_engine", bind)
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany) -> None:
+            if statement.lstrip().upper().startswith(prefix):
+                statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        listeners.append((engine, record))
+        return statements
+
+    yield capture
+    for engine, record in listeners:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture(autouse=True)
+def isolated_generation_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Keep generation cache entries in a per-test directory."""
+
+    monkeypatch.setattr(get_settings(), "generation_cache_dir", str(tmp_path / "generation_cache"))
+    get_generation_cache.cache_clear()
+    yield
+    get_generation_cache.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_media_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Keep uploaded media blobs in a per-test directory."""
+
+    monkeypatch.setattr(get_settings(), "media_root", str(tmp_path / "media"))
+    get_blob_store.cache_clear()
+    yield
+    get_blob_store.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_template_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep compiled template bytecode in a per-test directory."""
+
+    monkeypatch.setattr(get_settings(), "template_bytecode_cache_dir", str(tmp_path / "template_cache"))
+
+
+@pytest.fixture(autouse=True)
+def reset_catalog_cache() -> Generator[None, None, None]:
+    """Start every test with an empty catalog cache."""
+
+    catalog_cache.clear()
+    yield
+    catalog_cache.clear()
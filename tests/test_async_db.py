@@ -0,0 +1,35 @@
+"""Tests for the async database layer."""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.db.session import async_database_url
+from app.repositories import aio
+
+
+def test_async_database_url_switches_driver() -> None:
+    """Sync URLs are mapped to the async driver of the same backend."""
+
+    assert async_database_url("postgresql+psycopg://u:p@db:5432/app") == "postgresql+psycopg://u:p@db:5432/app"
+    assert async_database_url("postgresql://u:p@db/app") == "postgresql+psycopg://u:p@db/app"
+    assert async_database_url("sqlite:///./local.db") == "sqlite+aiosqlite:///./local.db"
+    with pytest.raises(ValueError):
+        async_database_url("mysql://u:p@db/app")
+
+
+def test_async_repositories_read_shared_data(seeded_db: Session, test_async_session_factory: async_sessionmaker) -> None:
+    """Async repository helpers see rows written through the sync engine."""
+
+    async def load() -> tuple[list[str], list[str]]:
+        async with test_async_session_factory() as db:
+            themes = await aio.list_themes(db)
+            characters = await aio.list_characters(db)
+        return [theme.key for theme in themes], [character.name for character in characters]
+
+    theme_keys, character_names = asyncio.run(load())
+
+    assert theme_keys == ["betrayal"]
+    assert character_names == ["Character One", "Character Two"]
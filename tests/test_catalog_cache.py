@@ -0,0 +1,73 @@
+"""Tests for the catalog read-through cache."""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.core.catalog_cache import CatalogCache
+
+CHARACTER_PAYLOAD = {
+    "name": "Mira Holt",
+    "speech_style": "Dry",
+    "traits_json": {},
+    "description": "Keeps the ledger.",
+}
+
+
+def test_invalidate_during_load_discards_stale_value() -> None:
+    """A value loaded before an invalidation is returned once but never cached."""
+
+    cache = CatalogCache(ttl_sec=60, max_entries=4, max_items=10)
+
+    async def stale_loader() -> list[str]:
+        cache.invalidate("themes")
+        return ["stale"]
+
+    assert asyncio.run(cache.get_or_load("themes", stale_loader)) == ("stale",)
+    assert cache.get("themes") is None
+
+
+def test_memory_bounds_and_ttl() -> None:
+    """Entries are LRU-bounded, oversized lists are skipped and old entries expire."""
+
+    cache = CatalogCache(ttl_sec=60, max_entries=2, max_items=3)
+    cache.put("a", [1], 0)
+    cache.put("b", [2], 0)
+    cache.get("a")
+    cache.put("c", [3], 0)
+    cache.put("too_big", [1, 2, 3, 4], 0)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == (1,)
+    assert cache.get("too_big") is None
+    assert cache.stats()["evictions"] == 1
+
+    expired = CatalogCache(ttl_sec=0, max_entries=2, max_items=3)
+    expired.put("a", [1], 0)
+    assert expired.get("a") is None
+
+
+def test_catalog_endpoints_skip_database_on_hit(
+    client, seeded_db: Session, test_async_session_factory: async_sessionmaker, capture_statements
+) -> None:
+    """Repeated catalog reads are served from memory until a write invalidates them."""
+
+    statements = capture_statements(test_async_session_factory)
+
+    assert client.get("/api/v1/characters").status_code == 200
+    assert client.get("/").status_code == 200
+    statements.clear()
+
+    assert client.get("/api/v1/characters").status_code == 200
+    assert client.get("/api/v1/themes").status_code == 200
+    assert client.get("/").status_code == 200
+    assert statements == []
+
+    created = client.post("/api/v1/characters", json=CHARACTER_PAYLOAD)
+    names = [item["name"] for item in client.get("/api/v1/characters").json()]
+    assert created.json()["name"] in names
+
+    stats = client.get("/health/cache").json()
+    assert stats["hits"] >= 4
+    assert stats["misses"] >= 5
@@ -0,0 +1,93 @@
+"""Tests for ETag and Last-Modified validators on catalog, episode and page routes."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core import catalog_cache as catalog_cache_module
+from app.core.catalog_cache import catalog_cache
+from app.models.theme import Theme
+from app.repositories.episode_repository import append_episode_script
+
+CHARACTER_PAYLOAD = {"name": "Character Three", "speech_style": "dry", "description": "Third test character"}
+
+
+def test_catalog_revalidation_skips_rows_and_tracks_writes(
+    client,
+    seeded_db: Session,
+    test_session_factory: sessionmaker,
+    test_async_session_factory: async_sessionmaker,
+    capture_statements,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A matching ETag is answered from memory; writes, even from other processes, change it."""
+
+    first = client.get("/api/v1/themes")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+    assert "last-modified" in first.headers
+
+    statements = capture_statements(test_async_session_factory)
+    revalidated = client.get("/api/v1/themes", headers={"If-None-Match": etag})
+    assert (revalidated.status_code, revalidated.content, revalidated.headers["etag"]) == (304, b"", etag)
+    assert statements == []
+
+    # A write that bypasses this process's cache invalidation shows once the cached list expires.
+    with test_session_factory() as db:
+        db.execute(update(Theme).values(label="Broken Trust"))
+        db.commit()
+    assert client.get("/api/v1/themes", headers={"If-None-Match": etag}).status_code == 304
+    expired = time.monotonic() + catalog_cache.ttl_sec
+    monkeypatch.setattr(catalog_cache_module, "time", SimpleNamespace(monotonic=lambda: expired))
+    changed = client.get("/api/v1/themes", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert [theme["label"] for theme in changed.json()] == ["Broken Trust"]
+    monkeypatch.undo()
+
+    characters_etag = client.get("/api/v1/characters").headers["etag"]
+    series_etag = client.get("/api/v1/series").headers["etag"]
+    client.post("/api/v1/characters", json=CHARACTER_PAYLOAD)
+    client.post("/api/v1/episodes", json={"user_prompt": "Numbered.", "theme_id": 1})
+    assert client.get("/api/v1/characters", headers={"If-None-Match": characters_etag}).status_code == 200
+    # Reserving an episode number does not change any series representation.
+    assert client.get("/api/v1/series", headers={"If-None-Match": series_etag}).status_code == 304
+
+
+def test_episode_validators_follow_updates(
+    client,
+    seeded_db: Session,
+    test_session_factory: sessionmaker,
+    test_async_session_factory: async_sessionmaker,
+    capture_statements,
+) -> None:
+    """API and page validators of an episode change with its row; the page honours If-Modified-Since."""
+
+    episode_id = client.post("/api/v1/episodes", json={"user_prompt": "Cache me.", "theme_id": 1}).json()["episode_id"]
+    statements = capture_statements(test_async_session_factory)
+    api = client.get(f"/api/v1/episodes/{episode_id}")
+    # The validators come from the same row as the body.
+    assert len(statements) == 1
+    page = client.get(f"/web/episodes/{episode_id}")
+    assert api.headers["etag"] != page.headers["etag"]
+
+    api_url, page_url = f"/api/v1/episodes/{episode_id}", f"/web/episodes/{episode_id}"
+    assert client.get(api_url, headers={"If-None-Match": api.headers["etag"]}).status_code == 304
+    assert client.get(page_url, headers={"If-None-Match": page.headers["etag"]}).status_code == 304
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(minutes=1), usegmt=True)
+    earlier = format_datetime(datetime.now(timezone.utc) - timedelta(minutes=1), usegmt=True)
+    assert client.get(page_url, headers={"If-Modified-Since": later}).status_code == 304
+    assert client.get(page_url, headers={"If-Modified-Since": earlier}).status_code == 200
+
+    with test_session_factory() as db:
+        append_episode_script(db, episode_id, "Narrator: Hello.")
+    updated = client.get(api_url, headers={"If-None-Match": api.headers["etag"]})
+    assert updated.status_code == 200
+    assert updated.json()["script_text"] == "Narrator: Hello."
+    assert client.get(page_url, headers={"If-None-Match": page.headers["etag"]}).status_code == 200
+    assert client.get("/api/v1/episodes/999", headers={"If-None-Match": "*"}).status_code == 404
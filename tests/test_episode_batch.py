@@ -0,0 +1,92 @@
+"""Tests for batch episode creation."""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.episode import Episode, EpisodeCharacter
+from app.models.job import Job
+from app.services import episode_service
+
+
+def test_batch_creates_valid_items_and_reports_failures(
+    client, seeded_db: Session, test_session_factory: sessionmaker
+) -> None:
+    """Valid items get episode/job ids; invalid ones report why, in request order."""
+
+    response = client.post(
+        "/api/v1/episodes:batch",
+        json={
+            "items": [
+                {"user_prompt": "One.", "theme_id": 1, "character_ids": [1, 2, 2]},
+                {"user_prompt": "Bad theme.", "theme_id": 999},
+                {"user_prompt": "Two.", "theme_id": 1, "series_id": 1},
+                {"user_prompt": "Bad continuation.", "theme_id": 1, "continuation_from_episode_id": 999},
+                {"user_prompt": "Bad character.", "theme_id": 1, "character_ids": [999]},
+            ]
+        },
+    )
+
+    assert response.status_code == 201
+    results = response.json()["results"]
+    assert [item["index"] for item in results] == [0, 1, 2, 3, 4]
+    assert [item["error"] for item in results] == [
+        None,
+        "Theme not found",
+        None,
+        "Continuation episode not found",
+        "One or more characters were not found",
+    ]
+    assert results[0]["episode_id"] and results[0]["job_id"]
+    assert results[1]["episode_id"] is None
+
+    with test_session_factory() as db:
+        episodes = db.scalars(select(Episode).order_by(Episode.id)).all()
+        assert [episode.episode_number for episode in episodes] == [1, 2]
+        assert [episode.id for episode in episodes] == [results[0]["episode_id"], results[2]["episode_id"]]
+        links = db.scalars(select(EpisodeCharacter.character_id).where(EpisodeCharacter.episode_id == episodes[0].id))
+        assert sorted(links) == [1, 2]
+        jobs = db.scalars(select(Job).order_by(Job.id)).all()
+        assert [(job.episode_id, job.status) for job in jobs] == [(episodes[0].id, "queued"), (episodes[1].id, "queued")]
+
+
+def test_batch_uses_set_based_statements(
+    client, seeded_db: Session, test_async_session_factory: async_sessionmaker, capture_statements
+) -> None:
+    """Statement count does not grow with the number of items."""
+
+    statements = capture_statements(test_async_session_factory)
+
+    items = [{"user_prompt": f"Item {n}.", "theme_id": 1, "character_ids": [1, 2]} for n in range(50)]
+    response = client.post("/api/v1/episodes:batch", json={"items": items})
+
+    assert response.status_code == 201
+    assert all(item["error"] is None for item in response.json()["results"])
+    assert len(statements) <= 10, statements
+
+
+def test_series_deleted_after_validation_fails_its_items_only(
+    client, seeded_db: Session, test_session_factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A series that passed validation but is gone when numbers are reserved reports "Series not found"."""
+
+    validated = episode_service.get_existing_series_ids
+    monkeypatch.setattr(episode_service, "get_existing_series_ids", lambda db, ids: validated(db, ids) | {999})
+
+    response = client.post(
+        "/api/v1/episodes:batch",
+        json={
+            "items": [
+                {"user_prompt": "Gone.", "theme_id": 1, "series_id": 999},
+                {"user_prompt": "Kept.", "theme_id": 1, "series_id": 1},
+            ]
+        },
+    )
+
+    assert response.status_code == 201
+    results = response.json()["results"]
+    assert [item["error"] for item in results] == ["Series not found", None]
+    assert results[0]["episode_id"] is None and results[1]["episode_id"]
+    with test_session_factory() as db:
+        assert db.scalars(select(Episode.series_id)).all() == [1]
@@ -0,0 +1,59 @@
+"""Tests for the single-episode creation transaction."""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.episode import Episode, EpisodeCharacter
+from app.models.job import Job
+
+
+def test_creation_uses_a_fixed_number_of_statements(
+    client,
+    seeded_db: Session,
+    test_async_session_factory: async_sessionmaker,
+    test_session_factory: sessionmaker,
+    capture_statements,
+) -> None:
+    """One validation query plus one RETURNING statement per written table."""
+
+    statements = capture_statements(test_async_session_factory)
+
+    response = client.post(
+        "/api/v1/episodes", json={"user_prompt": "Counted.", "theme_id": 1, "character_ids": [1, 2, 2]}
+    )
+
+    assert response.status_code == 201
+    assert [statement.split()[0] for statement in statements] == ["SELECT", "UPDATE", "INSERT", "INSERT", "INSERT"]
+    assert all("RETURNING" in statement for statement in statements[1:3] + statements[4:])
+
+    with test_session_factory() as db:
+        episode = db.get(Episode, response.json()["episode_id"])
+        links = db.scalars(
+            select(EpisodeCharacter.character_id).where(EpisodeCharacter.episode_id == episode.id)
+        ).all()
+        job = db.get(Job, response.json()["job_id"])
+    assert (episode.series_id, episode.episode_number, episode.status) == (1, 1, "draft")
+    assert sorted(links) == [1, 2]
+    assert (job.episode_id, job.status) == (episode.id, "queued")
+
+
+@pytest.mark.parametrize(
+    ("overrides", "status_code", "detail"),
+    [
+        ({"theme_id": 99}, 404, "Theme not found"),
+        ({"continuation_from_episode_id": 99}, 404, "Continuation episode not found"),
+        ({"character_ids": [1, 99]}, 404, "One or more characters were not found"),
+        ({"series_id": 99}, 404, "Series not found"),
+    ],
+)
+def test_creation_reports_the_first_missing_reference(
+    client, seeded_db: Session, overrides: dict, status_code: int, detail: str
+) -> None:
+    """The combined validation query keeps the per-reference error messages."""
+
+    response = client.post("/api/v1/episodes", json={"user_prompt": "Invalid.", "theme_id": 1, **overrides})
+
+    assert response.status_code == status_code
+    assert response.json()["detail"] == detail
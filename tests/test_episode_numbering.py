@@ -0,0 +1,57 @@
+"""Tests for the per-series episode counter."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.episode import Episode
+from app.models.story_series import StorySeries
+from app.repositories.series_repository import reserve_episode_numbers
+
+
+def test_single_and_batch_creation_share_the_counter(
+    client, seeded_db: Session, test_session_factory: sessionmaker
+) -> None:
+    """Numbers continue across single and batch creation without gaps."""
+
+    for prompt in ("One.", "Two."):
+        assert client.post("/api/v1/episodes", json={"user_prompt": prompt, "theme_id": 1}).status_code == 201
+    batch = [{"user_prompt": f"Batch {n}.", "theme_id": 1} for n in range(3)]
+    assert client.post("/api/v1/episodes:batch", json={"items": batch}).status_code == 201
+
+    with test_session_factory() as db:
+        numbers = db.scalars(select(Episode.episode_number).order_by(Episode.id)).all()
+        counter = db.scalar(select(StorySeries.last_episode_number).where(StorySeries.id == 1))
+    assert numbers == [1, 2, 3, 4, 5]
+    assert counter == 5
+
+
+def test_concurrent_reservations_never_collide(seeded_db: Session, test_session_factory: sessionmaker) -> None:
+    """Parallel reservations in one series each receive a distinct number."""
+
+    def reserve(_: int) -> int:
+        with test_session_factory() as db:
+            number = reserve_episode_numbers(db, {1: 1})[1]
+            db.commit()
+            return number
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        numbers = list(pool.map(reserve, range(40)))
+
+    assert sorted(numbers) == list(range(1, 41))
+
+
+def test_reserving_a_range_for_several_series(seeded_db: Session, test_session_factory: sessionmaker) -> None:
+    """One statement reserves consecutive ranges for several series at once."""
+
+    seeded_db.add(StorySeries(title="Second", description="", language="en"))
+    seeded_db.commit()
+
+    with test_session_factory() as db:
+        first = reserve_episode_numbers(db, {1: 3, 2: 2})
+        second = reserve_episode_numbers(db, {1: 1, 2: 1, 99: 1})
+        db.commit()
+
+    assert first == {1: 1, 2: 1}
+    assert second == {1: 4, 2: 3}
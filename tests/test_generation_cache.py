@@ -0,0 +1,136 @@
+"""Tests for the two-tier generation cache and its use by episode jobs."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.character import Character
+from app.models.episode import Episode
+from app.models.job import Job
+from app.pipeline import Pipeline, PipelineCancelledError, PipelineError, Stage
+from app.pipeline import stages
+from app.pipeline.cache import GenerationCache, generation_cache_key
+from app.services.job_service import run_episode_pipeline
+from app.services.progress_writer import ProgressWriter
+
+
+def _key(**overrides) -> str:
+    values = {
+        "user_prompt": "A storm gathers.",
+        "theme": {"key": "betrayal", "label": "Betrayal", "description": "Trust broken"},
+        "characters": [{"name": "Two", "speech_style": "direct"}, {"name": "One", "speech_style": "calm"}],
+        "target_duration_sec": 15,
+        "story_context": None,
+        "knowledge_version": "1-1",
+        "model_version": "v1",
+    }
+    return generation_cache_key(**{**values, **overrides})
+
+
+def test_key_normalizes_equivalent_requests() -> None:
+    """Whitespace and character order do not matter; resolved inputs and versions do."""
+
+    reordered = [{"speech_style": "calm", "name": "One"}, {"name": "Two", "speech_style": "direct"}]
+    assert _key() == _key(user_prompt="  A storm\n gathers. ", characters=reordered)
+    assert _key() != _key(story_context="Episode 1: Calm seas")
+    assert _key() != _key(model_version="v2")
+    assert _key() != _key(target_duration_sec=30)
+    assert _key() != _key(theme={"key": "betrayal", "label": "Betrayal", "description": "Trust restored"})
+    assert _key() != _key(characters=[{"name": "Renamed", "speech_style": "calm"}, reordered[1]])
+    assert _key() != _key(knowledge_version="2-1")
+
+
+def test_entries_survive_in_the_disk_tier(tmp_path: Path) -> None:
+    """Entries dropped from the memory LRU, or from another process, are read from disk."""
+
+    cache = GenerationCache(tmp_path, memory_entries=1, disk_max_bytes=1_000_000)
+    cache.put("aa01", {"script": "one"})
+    cache.put("bb02", {"script": "two"})
+
+    assert cache.get("aa01") == {"script": "one"}
+    assert GenerationCache(tmp_path, memory_entries=1, disk_max_bytes=1_000_000).get("bb02") == {"script": "two"}
+    assert cache.get("cc03") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_disk_tier_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    """Exceeding the byte budget deletes the oldest files; recent reads protect an entry."""
+
+    cache = GenerationCache(tmp_path, memory_entries=0, disk_max_bytes=250)
+    for index in range(4):
+        cache.put(f"k{index}", {"script": "x" * 40})
+        path = tmp_path / f"k{index}"[:2] / f"k{index}.json"
+        os.utime(path, (1000 + index, 1000 + index))
+    cache.get("k0")
+    cache.put("k4", {"script": "x" * 40})
+
+    remaining = sorted(path.stem for path in tmp_path.glob("*/*.json"))
+    assert sum(path.stat().st_size for path in tmp_path.glob("*/*.json")) <= 250
+    assert "k0" in remaining and "k4" in remaining
+    assert "k1" not in remaining
+
+
+def _failing_pipeline() -> Pipeline:
+    def fail(inputs: dict) -> dict:
+        raise RuntimeError("pipeline should not run")
+
+    return Pipeline([Stage("llm", fail, outputs=("script", "summary"))])
+
+
+def test_repeated_request_completes_from_the_cache(
+    client, seeded_db: Session, test_session_factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A second identical request skips the pipeline; bypass_cache forces a new run."""
+
+    monkeypatch.setattr(stages, "STUB_LATENCY_SEC", 0.0)
+    payload = {"user_prompt": "The vault opens.", "theme_id": 1, "character_ids": [1, 2]}
+    equivalent = {**payload, "user_prompt": " The vault  opens.", "character_ids": [2, 1]}
+    first = client.post("/api/v1/episodes", json=payload).json()
+    second = client.post("/api/v1/episodes", json=equivalent).json()
+    bypassed = client.post("/api/v1/episodes", json={**payload, "bypass_cache": True}).json()
+    progress = ProgressWriter(test_session_factory, window_sec=0)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        run_episode_pipeline(first["job_id"], progress, executor=executor)
+        run_episode_pipeline(second["job_id"], progress, pipeline=_failing_pipeline(), executor=executor)
+        with pytest.raises(PipelineError):
+            run_episode_pipeline(bypassed["job_id"], progress, pipeline=_failing_pipeline(), executor=executor)
+
+    with test_session_factory() as db:
+        original = db.get(Episode, first["episode_id"])
+        cached = db.get(Episode, second["episode_id"])
+        job = db.get(Job, second["job_id"])
+    assert cached.script_text == original.script_text
+    assert cached.summary == original.summary
+    assert (cached.status, job.status, job.progress_pct) == ("generated", "completed", 100)
+
+
+def test_edited_character_and_cancelled_job_skip_the_cache(
+    client, seeded_db: Session, test_session_factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Renaming a character invalidates cached scripts; a cancelled job never stores a cached one."""
+
+    monkeypatch.setattr(stages, "STUB_LATENCY_SEC", 0.0)
+    payload = {"user_prompt": "The vault opens.", "theme_id": 1, "character_ids": [1, 2]}
+    first = client.post("/api/v1/episodes", json=payload).json()
+    renamed = client.post("/api/v1/episodes", json=payload).json()
+    cancelled = client.post("/api/v1/episodes", json=payload).json()
+    progress = ProgressWriter(test_session_factory, window_sec=0)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        run_episode_pipeline(first["job_id"], progress, executor=executor)
+        with test_session_factory() as db:
+            db.get(Character, 1).name = "Character Renamed"
+            db.commit()
+        run_episode_pipeline(renamed["job_id"], progress, executor=executor)
+        assert client.post(f"/api/v1/jobs/{cancelled['job_id']}/cancel").status_code == 200
+        with pytest.raises(PipelineCancelledError):
+            run_episode_pipeline(cancelled["job_id"], progress, pipeline=_failing_pipeline(), executor=executor)
+
+    with test_session_factory() as db:
+        assert "Character Renamed" in db.get(Episode, renamed["episode_id"]).script_text
+        assert db.get(Episode, cancelled["episode_id"]).script_text is None
+        assert db.get(Job, cancelled["job_id"]).status == "cancelled"
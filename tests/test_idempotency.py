@@ -0,0 +1,125 @@
+"""Tests for idempotent episode creation."""
+
+import threading
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import get_settings
+from app.models.episode import Episode
+from app.models.idempotency_key import IdempotencyKey
+from app.models.job import Job
+from app.repositories.idempotency_repository import delete_expired_idempotency_keys
+from app.schemas.episode import EpisodeCreate
+from app.services.episode_service import create_episode_and_job
+
+PAYLOAD = {"user_prompt": "Only once.", "theme_id": 1, "character_ids": [1]}
+
+
+def _counts(session_factory: sessionmaker) -> tuple[int, int]:
+    with session_factory() as db:
+        return db.scalar(select(func.count(Episode.id))), db.scalar(select(func.count(Job.id)))
+
+
+def test_repeated_key_returns_original_ids_without_writes(
+    client,
+    seeded_db: Session,
+    test_async_session_factory: async_sessionmaker,
+    test_session_factory: sessionmaker,
+    capture_statements,
+) -> None:
+    """A retry gets the first response back and only reads the stored key."""
+
+    headers = {"Idempotency-Key": "retry-1"}
+    first = client.post("/api/v1/episodes", json=PAYLOAD, headers=headers)
+
+    statements = capture_statements(test_async_session_factory)
+    second = client.post("/api/v1/episodes", json=PAYLOAD, headers=headers)
+
+    assert first.status_code == second.status_code == 201
+    assert second.json() == first.json()
+    assert [statement.split()[0] for statement in statements] == ["INSERT", "SELECT"]
+    assert _counts(test_session_factory) == (1, 1)
+
+
+def test_key_reused_for_a_different_request_is_rejected(client, seeded_db: Session) -> None:
+    """Reusing a key with another payload is a client error, not a silent replay."""
+
+    headers = {"Idempotency-Key": "retry-2"}
+    assert client.post("/api/v1/episodes", json=PAYLOAD, headers=headers).status_code == 201
+
+    response = client.post("/api/v1/episodes", json={**PAYLOAD, "user_prompt": "Other."}, headers=headers)
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Idempotency-Key was already used for a different request"
+
+
+def test_keys_are_scoped_to_the_client(client, seeded_db: Session, test_session_factory: sessionmaker) -> None:
+    """Another client sending the same key gets its own episode, not the first client's ids."""
+
+    key = {"Idempotency-Key": "shared"}
+    first = client.post("/api/v1/episodes", json=PAYLOAD, headers={**key, "X-Client-Key": "a"})
+    other = client.post("/api/v1/episodes", json={**PAYLOAD, "user_prompt": "Other."}, headers={**key, "X-Client-Key": "b"})
+
+    assert first.status_code == other.status_code == 201
+    assert other.json()["episode_id"] != first.json()["episode_id"]
+    assert _counts(test_session_factory) == (2, 2)
+
+
+def test_failed_and_expired_requests_release_the_key(
+    client, seeded_db: Session, test_session_factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A rejected request stores no key, and an expired key can start a new request."""
+
+    headers = {"Idempotency-Key": "retry-3"}
+    assert client.post("/api/v1/episodes", json={**PAYLOAD, "theme_id": 99}, headers=headers).status_code == 404
+
+    monkeypatch.setattr(get_settings(), "idempotency_key_ttl_sec", 0)
+    first = client.post("/api/v1/episodes", json=PAYLOAD, headers=headers).json()
+    second = client.post("/api/v1/episodes", json=PAYLOAD, headers=headers).json()
+
+    assert second["episode_id"] != first["episode_id"]
+    with test_session_factory() as db:
+        assert delete_expired_idempotency_keys(db) == 1
+        assert db.scalar(select(func.count(IdempotencyKey.id))) == 0
+
+
+def test_concurrent_duplicates_create_one_episode(seeded_db: Session, test_session_factory: sessionmaker) -> None:
+    """Racing requests with one key all receive the ids of a single episode and job."""
+
+    payload = EpisodeCreate(**PAYLOAD)
+    barrier = threading.Barrier(4)
+    results: list[tuple[int, int]] = []
+
+    def submit() -> None:
+        with test_session_factory() as db:
+            barrier.wait()
+            results.append(create_episode_and_job(db, payload, idempotency_key="race"))
+
+    threads = [threading.Thread(target=submit) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 4 and len(set(results)) == 1
+    assert _counts(test_session_factory) == (1, 1)
+
+
+def test_form_rotates_its_idempotency_key(client, seeded_db: Session) -> None:
+    """The form carries a key, and a successful submission swaps in a fresh one."""
+
+    page = client.get("/")
+    key = page.text.split('name="idempotency_key" value="', 1)[1].split('"', 1)[0]
+    form = {"user_prompt": "Form.", "theme_id": "1", "idempotency_key": key}
+
+    first = client.post("/web/episodes/create", data=form)
+    double_click = client.post("/web/episodes/create", data=form)
+
+    assert first.status_code == double_click.status_code == 200
+    assert 'hx-swap-oob="true"' in first.text
+    assert key not in first.text
+    job_url = first.text.split('sse-connect="', 1)[1].split('"', 1)[0]
+    assert job_url in double_click.text
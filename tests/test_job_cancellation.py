@@ -0,0 +1,166 @@
+"""Tests for job cancellation and pipeline timeouts."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import get_settings
+from app.models.episode import Episode
+from app.models.job import Job
+from app.pipeline import (
+    Pipeline,
+    PipelineTimeoutError,
+    Stage,
+    create_stage_executor,
+    get_stage_executor,
+    lease_stage_executor,
+    replace_stage_executor,
+)
+from app.pipeline import stages
+from app.repositories.job_repository import JobStateUpdate, update_job_states
+from app.services.worker_service import WorkerPool
+
+
+def _sleep(seconds: float, output: str = "out"):
+    def run(inputs: dict[str, Any]) -> dict[str, Any]:
+        time.sleep(seconds)
+        return {output: seconds}
+
+    return run
+
+
+def test_cancelled_queued_job_is_never_claimed(
+    client, create_episode, seeded_db: Session, test_session_factory: sessionmaker
+) -> None:
+    """Cancelling a queued job is immediate and final; later progress cannot revive it."""
+
+    job_id = create_episode("Stop me.")["job_id"]
+
+    response = client.post(f"/api/v1/jobs/{job_id}/cancel")
+
+    assert response.status_code == 200
+    assert (response.json()["status"], response.json()["step"]) == ("cancelled", "cancelled")
+    assert WorkerPool(test_session_factory, concurrency=1).run_once() is False
+    with test_session_factory() as db:
+        assert update_job_states(db, [JobStateUpdate(job_id, "running", 50, "llm")]) == []
+    assert client.get(f"/api/v1/jobs/{job_id}").json()["status"] == "cancelled"
+    assert client.post(f"/api/v1/jobs/{job_id}/cancel").status_code == 409
+    assert client.post("/api/v1/jobs/999/cancel").status_code == 404
+
+
+def test_running_job_stops_at_the_next_stage_boundary(
+    client, create_episode, seeded_db: Session, test_session_factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The worker notices the cancellation, stores no results and frees its slot."""
+
+    monkeypatch.setattr(stages, "STUB_LATENCY_SEC", 0.3)
+    job_id = create_episode("Stop me.")["job_id"]
+    pool = WorkerPool(test_session_factory, concurrency=1)
+    worker = threading.Thread(target=pool.run_once)
+    worker.start()
+    while client.get(f"/api/v1/jobs/{job_id}").json()["status"] == "queued":
+        time.sleep(0.01)
+
+    assert client.post(f"/api/v1/jobs/{job_id}/cancel").status_code == 200
+    worker.join(timeout=2)
+
+    assert not worker.is_alive()
+    with test_session_factory() as db:
+        job = db.get(Job, job_id)
+        episode = db.get(Episode, job.episode_id)
+    assert job.status == "cancelled"
+    assert (episode.status, episode.script_text, episode.summary) == ("draft", None, None)
+
+
+def test_stage_and_run_timeouts_return_without_waiting() -> None:
+    """A stuck stage or an overlong run raises at its deadline instead of blocking."""
+
+    stuck = Pipeline([Stage("llm", _sleep(1.0), outputs=("out",), timeout_sec=0.05)])
+    slow = Pipeline(
+        [Stage("a", _sleep(0.1), outputs=("out",)), Stage("b", _sleep(1.0), inputs=("out",), outputs=("x",))]
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        started_at = time.perf_counter()
+        with pytest.raises(PipelineTimeoutError, match="Stage 'llm' timed out after 0.05s") as stage_error:
+            stuck.run({}, executor)
+        with pytest.raises(PipelineTimeoutError, match="Pipeline timed out after 0.3s"):
+            slow.run({}, executor, timeout_sec=0.3)
+        elapsed = time.perf_counter() - started_at
+
+    assert stage_error.value.stage == "llm"
+    assert elapsed < 0.7
+
+
+def test_stage_timeout_runs_from_its_start() -> None:
+    """Time a stage spends queued behind busy executor workers does not count against its timeout."""
+
+    pipeline = Pipeline(
+        [
+            Stage("busy", _sleep(0.3), outputs=("out",)),
+            Stage("queued", _sleep(0.05, "x"), outputs=("x",), timeout_sec=0.2),
+        ]
+    )
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        values = pipeline.run({}, executor)
+
+    assert values == {"out": 0.3, "x": 0.05}
+
+
+def test_timed_out_job_fails_with_message(
+    client, create_episode, seeded_db: Session, test_session_factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Per-stage timeouts from settings fail the job and release its worker and executor capacity at once."""
+
+    monkeypatch.setattr(stages, "STUB_LATENCY_SEC", 1.0)
+    monkeypatch.setattr(get_settings(), "pipeline_stage_timeouts", {"llm": 0.1})
+    job_id = create_episode("Stop me.")["job_id"]
+
+    executor = get_stage_executor()
+    started_at = time.perf_counter()
+    assert WorkerPool(test_session_factory, concurrency=1).run_once() is True
+    elapsed = time.perf_counter() - started_at
+
+    payload = client.get(f"/api/v1/jobs/{job_id}").json()
+    assert payload["status"] == "failed"
+    assert payload["error_message"] == "Stage 'llm' timed out after 0.1s"
+    assert elapsed < 0.8
+    # The abandoned stage's worker is not lent to later jobs.
+    assert get_stage_executor() is not executor
+    with pytest.raises(RuntimeError):
+        executor.submit(time.sleep, 0)
+    with test_session_factory() as db:
+        episode = db.get(Episode, payload["episode_id"])
+    assert (episode.status, episode.script_text) == ("draft", None)
+
+
+def test_replaced_executor_is_shut_down_after_its_last_run() -> None:
+    """Runs still leasing a replaced pool keep it; the last one to leave shuts it down."""
+
+    with lease_stage_executor() as executor, lease_stage_executor() as same:
+        assert same is executor
+        replace_stage_executor(executor)
+        assert get_stage_executor() is not executor
+        assert executor.submit(sum, [1, 2]).result() == 3
+
+    with pytest.raises(RuntimeError):
+        executor.submit(sum, [1, 2])
+
+
+def test_replaced_process_pool_terminates_stuck_workers() -> None:
+    """A stage stuck in a worker process does not outlive the replaced pool."""
+
+    executor = create_stage_executor("process", 1)
+    executor.submit(time.sleep, 30)
+    processes = list(executor._processes.values())
+
+    replace_stage_executor(executor)
+
+    for process in processes:
+        process.join(timeout=5)
+        assert not process.is_alive()
@@ -0,0 +1,185 @@
+"""Tests for Server-Sent Events job status streaming."""
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncGenerator
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core import job_events
+from app.core.job_events import JobEventBroker
+from app.models.job import Job
+from app.services.worker_service import WorkerPool
+
+
+def test_event_stream_for_finished_job_sends_final_state(
+    client, create_episode, seeded_db: Session, test_session_factory: sessionmaker
+) -> None:
+    """A finished job yields a single terminal event and closes the stream."""
+
+    job_id = create_episode("Stream me.")["job_id"]
+    WorkerPool(test_session_factory, concurrency=1).run_once()
+
+    response = client.get(f"/web/jobs/{job_id}/events")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text.count("event: ") == 1
+    assert "event: job-done" in response.text
+    assert "Status: completed" in response.text
+    assert "sse-connect" not in response.text
+
+
+def test_event_stream_pushes_worker_updates(
+    client, create_episode, seeded_db: Session, test_session_factory: sessionmaker
+) -> None:
+    """State changes made by a worker are pushed until the job completes."""
+
+    job_id = create_episode("Stream me.")["job_id"]
+
+    def run_worker() -> None:
+        time.sleep(0.2)
+        WorkerPool(test_session_factory, concurrency=1).run_once()
+
+    worker = threading.Thread(target=run_worker)
+    worker.start()
+    response = client.get(f"/web/jobs/{job_id}/events")
+    worker.join()
+
+    events = [line for line in response.text.splitlines() if line.startswith("event: ")]
+    assert events[0] == "event: job-status"
+    assert events[-1] == "event: job-done"
+    assert "Status: queued" in response.text
+    assert "Status: running" in response.text
+    assert response.text.rstrip().endswith("</div>")
+
+
+def test_event_stream_for_missing_job_returns_404(client, seeded_db: Session) -> None:
+    """Unknown jobs are rejected before the stream opens."""
+
+    response = client.get("/web/jobs/9999/events")
+    assert response.status_code == 404
+
+
+def test_form_submission_returns_sse_partial(client, seeded_db: Session) -> None:
+    """The web form hands back the SSE-connected status partial."""
+
+    theme_id = client.get("/api/v1/themes").json()[0]["id"]
+    response = client.post("/web/episodes/create", data={"user_prompt": "From the form.", "theme_id": theme_id})
+
+    assert response.status_code == 200
+    assert 'sse-connect="/web/jobs/' in response.text
+    assert 'sse-swap="job-status"' in response.text
+
+
+def test_relay_restarts_for_viewer_subscribing_while_it_stops(
+    client, create_episode, seeded_db: Session, test_async_session_factory: async_sessionmaker
+) -> None:
+    """A viewer arriving between the relay's last empty check and its exit still gets events."""
+
+    job_id = create_episode("Stream me.")["job_id"]
+    engine = test_async_session_factory.kw["bind"]
+    broker = JobEventBroker(poll_interval_sec=0.01)
+    subscribed_job_ids = broker.subscribed_job_ids
+    late_viewers = []
+
+    def viewer_subscribes_after_check() -> list[int]:
+        if late_viewers:
+            return subscribed_job_ids()
+        # The relay has just seen no viewers; a new one subscribes before the task finishes.
+        late_viewers.append(broker.subscribe(job_id))
+        broker.ensure_relay(engine)
+        return []
+
+    broker.subscribed_job_ids = viewer_subscribes_after_check
+
+    async def watch() -> str:
+        broker.ensure_relay(engine)
+        while not late_viewers:
+            await asyncio.sleep(0.01)
+        event = await asyncio.wait_for(late_viewers[0].next_event(), timeout=5)
+        late_viewers[0].close()
+        return event.status
+
+    assert asyncio.run(watch()) == "queued"
+
+
+def test_listen_relay_publishes_changes_made_before_listen_was_active(
+    create_episode,
+    seeded_db: Session,
+    test_session_factory: sessionmaker,
+    test_async_session_factory: async_sessionmaker,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A terminal update whose NOTIFY was sent before LISTEN still reaches the viewer."""
+
+    job_id = create_episode("Stream me.")["job_id"]
+    engine = test_async_session_factory.kw["bind"]
+    broker = JobEventBroker(poll_interval_sec=0.01)
+
+    class Connection:
+        async def __aenter__(self) -> "Connection":
+            return self
+
+        async def __aexit__(self, *exc_info: object) -> None:
+            return None
+
+        async def execute(self, query: str) -> None:
+            # The job finishes after the viewer read it but before LISTEN; its NOTIFY is lost.
+            with test_session_factory() as db:
+                db.execute(update(Job).where(Job.id == job_id).values(status="completed", progress_pct=100))
+                db.commit()
+
+        async def notifies(self, timeout: float) -> AsyncGenerator[object, None]:
+            await asyncio.sleep(timeout)
+            return
+            yield
+
+    async def connect(conninfo: str, autocommit: bool) -> Connection:
+        return Connection()
+
+    monkeypatch.setattr(job_events.psycopg.AsyncConnection, "connect", connect)
+
+    async def watch() -> str:
+        subscription = broker.subscribe(job_id)
+        relay = asyncio.create_task(broker._listen(engine))
+        event = await asyncio.wait_for(subscription.next_event(), timeout=5)
+        subscription.close()
+        await relay
+        return event.status
+
+    assert asyncio.run(watch()) == "completed"
+
+
+def test_failed_relay_restarts_while_viewers_remain(
+    create_episode, seeded_db: Session, test_async_session_factory: async_sessionmaker
+) -> None:
+    """A relay that fails is restarted after a backoff and resumes delivering events."""
+
+    job_id = create_episode("Stream me.")["job_id"]
+    engine = test_async_session_factory.kw["bind"]
+    broker = JobEventBroker(poll_interval_sec=0.01, retry_backoff_sec=0.01)
+    poll = broker._poll
+    failures = []
+
+    async def poll_failing_once(engine: AsyncEngine) -> None:
+        if not failures:
+            failures.append(True)
+            raise ConnectionError("connection dropped")
+        await poll(engine)
+
+    broker._poll = poll_failing_once
+
+    async def watch() -> str:
+        subscription = broker.subscribe(job_id)
+        broker.ensure_relay(engine)
+        event = await asyncio.wait_for(subscription.next_event(), timeout=5)
+        subscription.close()
+        return event.status
+
+    assert asyncio.run(watch()) == "queued"
+    assert failures == [True]
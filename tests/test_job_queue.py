@@ -0,0 +1,78 @@
+"""Tests for the database-backed job queue and worker pool."""
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.episode import Episode
+from app.models.job import JOB_ERROR_MESSAGE_MAX_CHARS, Job
+from app.repositories.job_repository import claim_next_job
+from app.services import worker_service
+from app.services.worker_service import WorkerPool
+
+
+def test_created_job_stays_queued_until_claimed(client, create_episode, seeded_db: Session) -> None:
+    """The API only enqueues; the job does not run inside the web process."""
+
+    job_id = create_episode("Queue me.")["job_id"]
+
+    payload = client.get(f"/api/v1/jobs/{job_id}").json()
+    assert payload["status"] == "queued"
+    assert payload["progress_pct"] == 0
+
+
+def test_worker_pool_runs_queued_job(
+    client, create_episode, seeded_db: Session, test_session_factory: sessionmaker
+) -> None:
+    """A worker claims the queued job and drives it to completion."""
+
+    job_id = create_episode("Queue me.")["job_id"]
+    pool = WorkerPool(test_session_factory, concurrency=1, lease_seconds=30)
+
+    assert pool.run_once() is True
+    assert pool.run_once() is False
+
+    payload = client.get(f"/api/v1/jobs/{job_id}").json()
+    assert payload["status"] == "completed"
+    assert payload["progress_pct"] == 100
+
+
+def test_claim_next_job_leases_each_job_once(seeded_db: Session, test_session_factory: sessionmaker) -> None:
+    """Claims hand out queued jobs oldest first and never twice."""
+
+    episode = Episode(series_id=1, episode_number=1, title="Queued", user_prompt="p", theme_id=1)
+    seeded_db.add(episode)
+    seeded_db.flush()
+    seeded_db.add_all([Job(episode_id=episode.id), Job(episode_id=episode.id)])
+    seeded_db.commit()
+
+    with test_session_factory() as db:
+        first = claim_next_job(db, worker_id="w:0", lease_seconds=60)
+        second = claim_next_job(db, worker_id="w:1", lease_seconds=60)
+        third = claim_next_job(db, worker_id="w:2", lease_seconds=60)
+
+    assert first is not None and second is not None
+    assert first.id < second.id
+    assert third is None
+    assert first.status == "running"
+    assert first.worker_id == "w:0"
+    assert first.attempts == 1
+    assert first.lease_expires_at is not None
+
+
+def test_failure_message_is_capped(
+    client, create_episode, seeded_db: Session, test_session_factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An unbounded exception text is truncated before it is stored with the failed job."""
+
+    def fail(job_id: int, progress: object) -> None:
+        raise RuntimeError("x" * 20_000)
+
+    monkeypatch.setitem(worker_service.JOB_HANDLERS, "episode_pipeline", fail)
+    job_id = create_episode("Fail loudly.")["job_id"]
+
+    assert WorkerPool(test_session_factory, concurrency=1).run_once() is True
+
+    payload = client.get(f"/api/v1/jobs/{job_id}").json()
+    assert payload["status"] == "failed"
+    assert len(payload["error_message"]) == JOB_ERROR_MESSAGE_MAX_CHARS
+    assert payload["error_message"].endswith("…")
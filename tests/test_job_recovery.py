@@ -0,0 +1,200 @@
+"""Tests for job lease heartbeats and recovery of jobs from dead workers."""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.episode import Episode
+from app.models.job import Job
+from app.pipeline import stages
+from app.repositories.episode_repository import append_episode_script, start_episode_script
+from app.repositories.job_repository import claim_next_job
+from app.services.worker_service import WorkerPool
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Runs a real worker process whose stages are slow enough to kill it mid-job.
+SLOW_WORKER = "from app.pipeline import stages; stages.STUB_LATENCY_SEC = 30; from app.worker import main; main()"
+
+
+def _wait_for(predicate, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.05)
+
+
+def test_job_of_killed_worker_is_recovered(
+    client,
+    create_episode,
+    seeded_db: Session,
+    test_session_factory: sessionmaker,
+    test_database_path: Path,
+    tmp_path: Path,
+) -> None:
+    """Heartbeats keep a live worker's lease; after SIGKILL the reaper re-queues the job for another worker."""
+
+    job_id = create_episode("Survive a crash.")["job_id"]
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+pysqlite:///{test_database_path}",
+        "WORKER_CONCURRENCY": "1",
+        "JOB_LEASE_SECONDS": "1",
+        "JOB_HEARTBEAT_INTERVAL_SEC": "0.2",
+        "GENERATION_CACHE_DIR": str(tmp_path / "worker_cache"),
+        "METRICS_ENABLED": "false",
+    }
+    worker = subprocess.Popen([sys.executable, "-c", SLOW_WORKER], cwd=PROJECT_ROOT, env=env)
+    try:
+        _wait_for(lambda: client.get(f"/api/v1/jobs/{job_id}").json()["status"] == "running")
+
+        # Outlive the one second lease: heartbeats must keep the job away from the reaper.
+        time.sleep(1.5)
+        pool = WorkerPool(test_session_factory, concurrency=1, max_attempts=3)
+        pool.reap()
+        assert client.get(f"/api/v1/jobs/{job_id}").json()["status"] == "running"
+    finally:
+        worker.kill()
+        worker.wait()
+
+    time.sleep(1.2)
+    pool.reap()
+    payload = client.get(f"/api/v1/jobs/{job_id}").json()
+    assert (payload["status"], payload["step"]) == ("queued", "requeued")
+
+    assert pool.run_once() is True
+    with test_session_factory() as db:
+        job = db.get(Job, job_id)
+    assert (job.status, job.attempts, job.worker_id) == ("completed", 2, pool.worker_id(0))
+
+
+def test_job_fails_after_max_attempts(
+    client, create_episode, seeded_db: Session, test_session_factory: sessionmaker
+) -> None:
+    """A job whose lease keeps expiring is failed instead of being retried forever."""
+
+    job_id = create_episode("Survive a crash.")["job_id"]
+    expired = datetime.now(timezone.utc) - timedelta(seconds=5)
+    with test_session_factory() as db:
+        db.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(status="running", worker_id="gone:1:0", attempts=2, lease_expires_at=expired)
+        )
+        episode_id = db.get(Job, job_id).episode_id
+        db.execute(update(Episode).where(Episode.id == episode_id).values(status="generating", script_text="Half a"))
+        db.commit()
+
+    WorkerPool(test_session_factory, concurrency=1, max_attempts=2).reap()
+
+    payload = client.get(f"/api/v1/jobs/{job_id}").json()
+    assert payload["status"] == "failed"
+    assert payload["error_message"] == "Worker stopped responding; gave up after 2 attempts"
+    with test_session_factory() as db:
+        episode = db.get(Episode, episode_id)
+    assert (episode.status, episode.script_text) == ("draft", None)
+
+
+def test_failed_regeneration_restores_the_earlier_script(
+    client, create_episode, seeded_db: Session, test_session_factory: sessionmaker
+) -> None:
+    """A reaped job gives its episode back the status and script it had before generation started."""
+
+    job_id = create_episode("Survive a crash.")["job_id"]
+    expired = datetime.now(timezone.utc) - timedelta(seconds=5)
+    with test_session_factory() as db:
+        episode_id = db.get(Job, job_id).episode_id
+        db.execute(update(Episode).where(Episode.id == episode_id).values(status="generated", script_text="Old script"))
+        db.commit()
+        start_episode_script(db, episode_id)
+        append_episode_script(db, episode_id, "Half a")
+        # A later attempt restarting the stream keeps the state saved by the first one.
+        start_episode_script(db, episode_id)
+        db.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(status="running", worker_id="gone:1:0", attempts=2, lease_expires_at=expired)
+        )
+        db.commit()
+
+    WorkerPool(test_session_factory, concurrency=1, max_attempts=2).reap()
+
+    with test_session_factory() as db:
+        episode = db.get(Episode, episode_id)
+    assert (episode.status, episode.script_text) == ("generated", "Old script")
+    assert (episode.status_before_generation, episode.script_before_generation) == (None, None)
+
+
+def test_heartbeat_renews_only_own_running_jobs(
+    client, create_episode, seeded_db: Session, test_session_factory: sessionmaker
+) -> None:
+    """A reaped job is not revived by a late heartbeat from its old worker."""
+
+    job_id = create_episode("Survive a crash.")["job_id"]
+    pool = WorkerPool(test_session_factory, concurrency=1, lease_seconds=30)
+    expired = datetime.now(timezone.utc) - timedelta(seconds=5)
+    with test_session_factory() as db:
+        db.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(status="running", worker_id=pool.worker_id(0), attempts=1, lease_expires_at=expired)
+        )
+        db.commit()
+    pool.progress.hold_lease(job_id, worker_id=pool.worker_id(0), attempt=1)
+
+    pool.heartbeat()
+    pool.reap()
+    assert client.get(f"/api/v1/jobs/{job_id}").json()["status"] == "running"
+
+    with test_session_factory() as db:
+        db.execute(update(Job).where(Job.id == job_id).values(lease_expires_at=expired))
+        db.commit()
+    pool.reap()
+    pool.heartbeat()
+    with test_session_factory() as db:
+        job = db.get(Job, job_id)
+    assert (job.status, job.worker_id, job.lease_expires_at) == ("queued", None, None)
+    assert pool.progress.lease_revoked(job_id)
+
+    with test_session_factory() as db:
+        claim_next_job(db, worker_id="other:1:0", lease_seconds=30)
+    pool.progress.report(job_id, status="failed", progress_pct=40, step="failed", error_message="stale")
+    with test_session_factory() as db:
+        job = db.get(Job, job_id)
+    assert (job.status, job.worker_id, job.attempts, job.error_message) == ("running", "other:1:0", 2, None)
+
+
+def test_worker_stops_a_job_whose_lease_was_lost(
+    client, create_episode, seeded_db: Session, test_session_factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Once another worker claimed the job, the old one stops and leaves the job and episode to it."""
+
+    monkeypatch.setattr(stages, "STUB_LATENCY_SEC", 0.3)
+    job_id = create_episode("Survive a crash.")["job_id"]
+    pool = WorkerPool(test_session_factory, concurrency=1, lease_seconds=30)
+    worker = threading.Thread(target=pool.run_once)
+    worker.start()
+    _wait_for(lambda: client.get(f"/api/v1/jobs/{job_id}").json()["status"] == "running")
+
+    # The reaper re-queued the job and another worker claimed it.
+    with test_session_factory() as db:
+        db.execute(update(Job).where(Job.id == job_id).values(status="queued", worker_id=None, lease_expires_at=None))
+        db.commit()
+        claim_next_job(db, worker_id="other:1:0", lease_seconds=30)
+    pool.heartbeat()
+    worker.join(timeout=2)
+
+    assert not worker.is_alive()
+    with test_session_factory() as db:
+        job = db.get(Job, job_id)
+        episode = db.get(Episode, job.episode_id)
+    assert (job.status, job.step, job.worker_id, job.attempts) == ("running", "claimed", "other:1:0", 2)
+    assert episode.status == "generating"
@@ -0,0 +1,68 @@
+"""Tests for priority and fair-share job scheduling."""
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.job import JOB_PRIORITY_BATCH, JOB_PRIORITY_DEFAULT, JOB_PRIORITY_INTERACTIVE, Job
+from app.repositories.job_repository import claim_next_job
+
+
+def _batch(client, client_key: str, count: int) -> list[int]:
+    """Submit ``count`` episodes through the batch API and return their job ids."""
+
+    items = [{"user_prompt": f"{client_key} {index}", "theme_id": 1} for index in range(count)]
+    response = client.post("/api/v1/episodes:batch", json={"items": items}, headers={"X-Client-Key": client_key})
+    assert response.status_code == 201
+    return [result["job_id"] for result in response.json()["results"]]
+
+
+def _claim_all(session_factory: sessionmaker, **kwargs) -> list[int]:
+    claimed = []
+    with session_factory() as db:
+        while (job := claim_next_job(db, worker_id="w:0", lease_seconds=60, **kwargs)) is not None:
+            claimed.append(job.id)
+    return claimed
+
+
+def test_form_submissions_outrank_batch_backfills(
+    client, seeded_db: Session, test_session_factory: sessionmaker
+) -> None:
+    """A web form job submitted after a bulk batch is claimed first, then single API jobs."""
+
+    batch_ids = _batch(client, "backfill", 5)
+    api_job_id = client.post("/api/v1/episodes", json={"user_prompt": "API", "theme_id": 1}).json()["job_id"]
+    form = client.post("/web/episodes/create", data={"user_prompt": "Form", "theme_id": "1"})
+    assert form.status_code == 200
+
+    claimed = _claim_all(test_session_factory)
+
+    with test_session_factory() as db:
+        priorities = [db.get(Job, job_id).priority for job_id in claimed]
+        assert db.get(Job, api_job_id).client_key == "testclient"
+    assert priorities == [JOB_PRIORITY_INTERACTIVE, JOB_PRIORITY_DEFAULT] + [JOB_PRIORITY_BATCH] * 5
+    assert claimed[1] == api_job_id
+    assert claimed[2:] == batch_ids
+    # Client keys hold other callers' addresses, so the API never returns them.
+    assert "client_key" not in client.get(f"/api/v1/jobs/{api_job_id}").json()
+    assert all("client_key" not in job for job in client.get("/api/v1/jobs").json()["items"])
+
+
+def test_clients_are_served_round_robin(client, seeded_db: Session, test_session_factory: sessionmaker) -> None:
+    """A later client's jobs interleave with an earlier client's backlog instead of waiting behind it."""
+
+    first = _batch(client, "alpha", 4)
+    with test_session_factory() as db:
+        claim_next_job(db, worker_id="w:0", lease_seconds=60)
+    second = _batch(client, "beta", 2)
+    more_first = _batch(client, "alpha", 1)
+
+    assert _claim_all(test_session_factory) == [first[1], second[0], first[2], second[1], first[3], more_first[0]]
+
+
+def test_per_client_cap_skips_busy_clients(client, seeded_db: Session, test_session_factory: sessionmaker) -> None:
+    """A client at its running cap is passed over while others still get workers."""
+
+    alpha = _batch(client, "alpha", 3)
+    beta = _batch(client, "beta", 1)
+
+    assert _claim_all(test_session_factory, max_running_per_client=1) == [alpha[0], beta[0]]
+    assert _claim_all(test_session_factory, max_running_per_client=2) == [alpha[1]]
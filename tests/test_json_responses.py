@@ -0,0 +1,48 @@
+"""Tests for the precompiled JSON response path."""
+
+import json
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.responses import JSONAdapter
+from app.models.episode import Episode
+from app.models.job import Job
+from app.schemas.episode import EpisodeRead
+from app.schemas.job import JobRead
+from app.schemas.theme import ThemeRead
+from benchmarks.serialization import fastapi_default, sample_episode
+
+
+def test_adapter_matches_fastapi_default_serialization() -> None:
+    """ORM rows and schema instances produce the same JSON FastAPI would."""
+
+    rows = [sample_episode(index) for index in range(1, 4)]
+    adapter = JSONAdapter(list[EpisodeRead])
+
+    assert json.loads(adapter.dump_json(rows)) == json.loads(fastapi_default(list[EpisodeRead])(rows))
+    assert adapter.dump_json([EpisodeRead.model_validate(row) for row in rows]) == adapter.dump_json(rows)
+
+
+def test_detail_and_list_routes_return_schema_json(
+    client, seeded_db: Session, test_session_factory: sessionmaker
+) -> None:
+    """Routes on the fast path keep their payloads and OpenAPI response schemas."""
+
+    created = client.post("/api/v1/episodes", json={"user_prompt": "Serialize me.", "theme_id": 1}).json()
+
+    episode_response = client.get(f"/api/v1/episodes/{created['episode_id']}")
+    job_page = client.get("/api/v1/jobs", params={"limit": 5}).json()
+    themes = client.get("/api/v1/themes").json()
+
+    assert episode_response.headers["content-type"] == "application/json"
+    with test_session_factory() as db:
+        episode = db.get(Episode, created["episode_id"])
+        job = db.get(Job, created["job_id"])
+    assert episode_response.json() == EpisodeRead.model_validate(episode).model_dump(mode="json")
+    assert job_page == {"items": [JobRead.model_validate(job).model_dump(mode="json")], "next_cursor": None}
+    assert [ThemeRead.model_validate(item).key for item in themes] == ["betrayal"]
+
+    schema = client.get("/openapi.json").json()["paths"]["/api/v1/episodes/{episode_id}"]["get"]
+    assert schema["responses"]["200"]["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/EpisodeRead"
+    }
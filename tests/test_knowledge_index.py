@@ -0,0 +1,132 @@
+"""Tests for the memory-mapped theme knowledge index."""
+
+from collections.abc import Generator
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.theme_knowledge import ThemeKnowledge
+from app.rag import HashingEmbedder, IndexRegistry, VectorIndex, get_index_registry, retrieve_passages, write_index
+from app.rag import index as index_module
+from app.services.knowledge_service import build_theme_index
+
+
+@pytest.fixture()
+def index_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path, None, None]:
+    """Point the process-wide index registry at an empty temporary directory."""
+
+    root = tmp_path / "knowledge"
+    monkeypatch.setattr(get_settings(), "knowledge_index_dir", str(root))
+    get_index_registry.cache_clear()
+    yield root
+    get_index_registry.cache_clear()
+
+
+def _unit_vectors(count: int, dim: int, seed: int = 0) -> np.ndarray:
+    vectors = np.random.default_rng(seed).standard_normal((count, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_flat_search_matches_brute_force(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Chunked batched top-k equals a full sort, and short results are padded."""
+
+    monkeypatch.setattr(index_module, "SEARCH_CHUNK_ROWS", 64)
+    vectors = _unit_vectors(300, 16)
+    ids = list(range(1000, 1300))
+    write_index(tmp_path, "love", ids, vectors, [f"passage {i}" for i in ids], embedder="test")
+    index = IndexRegistry(tmp_path).get("love")
+    queries = _unit_vectors(5, 16, seed=1)
+
+    result = index.search(queries, 7)
+
+    expected = np.argsort(-(queries @ vectors.T), axis=1)[:, :7] + 1000
+    assert isinstance(index.vectors, np.memmap)
+    assert np.array_equal(result.ids, expected)
+    assert np.all(np.diff(result.scores, axis=1) <= 0)
+    assert index.text(int(result.ids[0, 0]) - 1000) == f"passage {result.ids[0, 0]}"
+
+    short = index.search(queries[:1], 400)
+    assert short.ids.shape == (1, 400)
+    assert short.ids[0, -1] == -1 and short.scores[0, -1] == -np.inf
+
+
+def test_ivf_search_finds_stored_vectors(tmp_path: Path) -> None:
+    """Probing a few clusters still finds exact matches; probing all equals flat search."""
+
+    vectors = _unit_vectors(2000, 32)
+    ids = list(range(2000))
+    write_index(tmp_path, "power", ids, vectors, [str(i) for i in ids], embedder="test", nlist=16)
+    index = IndexRegistry(tmp_path).get("power")
+    queries = vectors[[3, 500, 1999]]
+
+    assert index.nlist == 16
+    assert index.search(queries, 1, nprobe=2).ids[:, 0].tolist() == [3, 500, 1999]
+    assert np.array_equal(index.search(queries, 5, nprobe=16).ids, index.search(queries, 5).ids)
+
+
+def test_batched_ivf_search_matches_per_query_probes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Each query of a batch only sees the rows of its own probed clusters, padded when short."""
+
+    monkeypatch.setattr(index_module, "SEARCH_CHUNK_ROWS", 50)
+    vectors = _unit_vectors(600, 16)
+    write_index(tmp_path, "fate", list(range(600)), vectors, ["x"] * 600, embedder="test", nlist=12)
+    index = IndexRegistry(tmp_path).get("fate")
+    queries = _unit_vectors(6, 16, seed=2)
+
+    rows, scores = index.search_rows(queries, 400, nprobe=2)
+
+    for query, query_rows, query_scores in zip(queries, rows, scores):
+        clusters = np.argsort(-(index.centroids @ query))[:2]
+        probed = np.concatenate([np.arange(index.list_offsets[c], index.list_offsets[c + 1]) for c in clusters])
+        expected = probed[np.argsort(-(index.vectors[probed] @ query), kind="stable")]
+        assert np.array_equal(query_rows[: len(expected)], expected)
+        assert np.all(query_rows[len(expected) :] == -1) and np.all(query_scores[len(expected) :] == -np.inf)
+
+
+def test_rebuild_publishes_a_new_generation(tmp_path: Path) -> None:
+    """Readers switch to the new generation; only the newest generations are kept."""
+
+    registry = IndexRegistry(tmp_path)
+    for count in (1, 2, 3):
+        write_index(tmp_path, "hope", list(range(count)), _unit_vectors(count, 8), ["x"] * count, embedder="test")
+        assert registry.get("hope").count == count
+
+    assert len([path for path in (tmp_path / "hope").iterdir() if path.is_dir()]) == index_module.KEEP_GENERATIONS
+    assert registry.get("missing") is None
+    assert isinstance(registry.get("hope"), VectorIndex)
+
+
+def test_embedder_is_deterministic_and_normalized() -> None:
+    """Equal texts embed equally; rows have unit length; empty text is a zero row."""
+
+    embedder = HashingEmbedder(64)
+    vectors = embedder.embed(["A knife in the dark", "a KNIFE in the dark", ""])
+
+    assert np.array_equal(vectors[0], vectors[1])
+    assert np.isclose(np.linalg.norm(vectors[0]), 1.0)
+    assert not vectors[2].any()
+
+
+def test_built_index_serves_rag_retrieval(seeded_db: Session, index_root: Path) -> None:
+    """Passages stored for a theme are embedded, indexed and retrieved by similarity."""
+
+    seeded_db.add_all(
+        [
+            ThemeKnowledge(theme_id=1, source_text="The dagger was hidden behind a friendly smile."),
+            ThemeKnowledge(theme_id=1, source_text="Harvest festivals bring the village together."),
+            ThemeKnowledge(theme_id=1, source_text="A broken promise echoes through the court."),
+        ]
+    )
+    seeded_db.commit()
+
+    assert build_theme_index(seeded_db, "betrayal") == 3
+    passages = retrieve_passages("betrayal", ["a hidden dagger", "the village harvest"], 1)
+
+    assert passages == [
+        ["The dagger was hidden behind a friendly smile."],
+        ["Harvest festivals bring the village together."],
+    ]
+    assert retrieve_passages("love", ["anything"], 3) == [[]]
@@ -0,0 +1,37 @@
+"""Smoke tests for the in-process load test."""
+
+import asyncio
+from pathlib import Path
+
+from benchmarks.load_test import TRAFFIC_MIX, compare_to_baseline, run_load_test
+
+
+def test_load_test_reports_every_route(tmp_path: Path) -> None:
+    """A short run covers the whole traffic mix without errors."""
+
+    report = asyncio.run(
+        run_load_test(f"sqlite+pysqlite:///{tmp_path / 'bench.db'}", requests=120, concurrency=4, warmup=5)
+    )
+
+    assert report["database"] == "sqlite"
+    assert set(report["routes"]) == set(TRAFFIC_MIX)
+    assert sum(stats["requests"] for stats in report["routes"].values()) == 120
+    for stats in report["routes"].values():
+        assert stats["errors"] == 0
+        assert 0 < stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+
+
+def test_baseline_comparison_flags_regressions() -> None:
+    """Only new errors or latency or throughput beyond the tolerance count as a regression."""
+
+    baseline = {"routes": {"GET /": {"p95_ms": 10.0, "throughput_rps": 100.0}}}
+    within = {"routes": {"GET /": {"p95_ms": 12.0, "throughput_rps": 80.0}, "GET /new": {"p95_ms": 1.0}}}
+    slower = {"routes": {"GET /": {"p95_ms": 13.0, "throughput_rps": 70.0}}}
+    failing = {"routes": {"GET /": {"p95_ms": 10.0, "throughput_rps": 100.0, "errors": 3}}}
+
+    assert compare_to_baseline(within, baseline, max_regression=0.25) == []
+    assert compare_to_baseline(slower, baseline, max_regression=0.25) == [
+        "GET /: p95 13.0ms vs baseline 10.0ms",
+        "GET /: throughput 70.0/s vs baseline 100.0/s",
+    ]
+    assert compare_to_baseline(failing, baseline, max_regression=0.25) == ["GET /: 3 errors vs baseline 0"]
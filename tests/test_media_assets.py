@@ -0,0 +1,114 @@
+"""Tests for the content-addressed media asset store and its endpoints."""
+
+import asyncio
+import hashlib
+from pathlib import Path
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.blob_store import BlobStore, BlobTooLargeError, EmptyBlobError, get_blob_store
+from app.core.config import get_settings
+
+AUDIO = bytes(range(256)) * 64
+
+
+def _upload(client, episode_id: int, content: bytes = AUDIO, content_type: str = "audio/wav", **params):
+    return client.post(
+        f"/api/v1/episodes/{episode_id}/assets",
+        params={"kind": "audio", "filename": "line.wav", **params},
+        content=content,
+        headers={"Content-Type": content_type},
+    )
+
+
+def test_upload_round_trips_and_deduplicates(client, create_episode, seeded_db: Session) -> None:
+    """Uploads are stored once per content and served back byte for byte."""
+
+    episode_id = create_episode("Media.", character_ids=[1])["episode_id"]
+    first = _upload(client, episode_id)
+    second = _upload(client, episode_id, filename="copy.wav")
+
+    assert first.status_code == 201
+    asset = first.json()
+    assert asset["sha256"] == hashlib.sha256(AUDIO).hexdigest()
+    assert (asset["size_bytes"], asset["content_type"]) == (len(AUDIO), "audio/wav")
+    assert second.json()["sha256"] == asset["sha256"]
+
+    media_root = Path(get_settings().media_root)
+    blobs = [path for path in media_root.rglob("*") if path.is_file()]
+    assert blobs == [media_root / asset["sha256"][:2] / asset["sha256"][2:4] / asset["sha256"]]
+
+    listed = client.get(f"/api/v1/episodes/{episode_id}/assets").json()
+    assert [item["filename"] for item in listed] == ["line.wav", "copy.wav"]
+
+    download = client.get(f"/api/v1/assets/{asset['id']}/content")
+    assert download.status_code == 200
+    assert download.content == AUDIO
+    assert download.headers["content-type"] == "audio/wav"
+    assert download.headers["etag"] == f'"{asset["sha256"]}"'
+    assert download.headers["x-content-type-options"] == "nosniff"
+    assert "immutable" in download.headers["cache-control"]
+
+
+def test_download_supports_ranges_and_conditional_requests(client, create_episode, seeded_db: Session) -> None:
+    """Range requests return 206 with the slice; a matching ETag returns 304 without a body."""
+
+    asset = _upload(client, create_episode("Media.", character_ids=[1])["episode_id"]).json()
+    url = f"/api/v1/assets/{asset['id']}/content"
+
+    partial = client.get(url, headers={"Range": "bytes=100-199"})
+    assert partial.status_code == 206
+    assert partial.content == AUDIO[100:200]
+    assert partial.headers["content-range"] == f"bytes 100-199/{len(AUDIO)}"
+
+    cached = client.get(url, headers={"If-None-Match": f'"{asset["sha256"]}"'})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+
+def test_upload_errors(client, create_episode, seeded_db: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Unknown episodes or kinds, foreign media types and empty or oversized bodies leave nothing behind."""
+
+    episode_id = create_episode("Media.", character_ids=[1])["episode_id"]
+    assert _upload(client, 99).status_code == 404
+    assert _upload(client, episode_id, kind="text").status_code == 422
+    assert client.get("/api/v1/assets/99/content").status_code == 404
+    for kind, content_type in [
+        ("audio", "text/html"),
+        ("audio", "image/png"),
+        ("image", "image/svg+xml"),
+        ("audio", "audio/" + "x" * 200),
+        ("audio", ""),
+    ]:
+        assert _upload(client, episode_id, content_type=content_type, kind=kind).status_code == 415
+    assert _upload(client, episode_id, content=b"").status_code == 400
+    assert not [path for path in Path(get_settings().media_root).rglob("*") if path.is_file()]
+
+    monkeypatch.setattr(get_settings(), "media_max_upload_bytes", 1000)
+    get_blob_store.cache_clear()
+    assert _upload(client, episode_id).status_code == 413
+    assert client.get(f"/api/v1/episodes/{episode_id}/assets").json() == []
+
+
+def test_streamed_writes_are_atomic_and_bounded(tmp_path: Path) -> None:
+    """Chunked writes hash incrementally; a failed or empty write leaves no files behind."""
+
+    store = BlobStore(tmp_path, max_bytes=len(AUDIO))
+
+    async def chunks(data: bytes, size: int):
+        for start in range(0, len(data), size):
+            yield data[start : start + size]
+
+    blob = asyncio.run(store.write_stream(chunks(AUDIO, 1000)))
+    assert blob.sha256 == hashlib.sha256(AUDIO).hexdigest()
+    assert store.path_for(blob.sha256).read_bytes() == AUDIO
+
+    with pytest.raises(BlobTooLargeError):
+        asyncio.run(store.write_stream(chunks(AUDIO + b"x", 1000)))
+    with pytest.raises(BlobTooLargeError):
+        store.write_chunks([AUDIO, b"x"])
+    with pytest.raises(EmptyBlobError):
+        asyncio.run(store.write_stream(chunks(b"", 1000)))
+    assert list((tmp_path / "tmp").iterdir()) == []
+    assert store.write_chunks([AUDIO[:10], AUDIO[10:]]) == blob
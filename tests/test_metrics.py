@@ -0,0 +1,75 @@
+"""Tests for per-request SQL instrumentation and the /metrics endpoint."""
+
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.core import metrics
+from app.core.config import get_settings
+from app.core.metrics import Histogram, instrument_engine, request_db_statements, request_duration
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.reset_metrics()
+    yield
+    metrics.reset_metrics()
+
+
+def test_requests_are_recorded_per_route(client, seeded_db: Session, test_async_session_factory: async_sessionmaker) -> None:
+    """Statement counts are attributed to the route template, including run_sync work."""
+
+    instrument_engine(test_async_session_factory.kw["bind"].sync_engine)
+
+    for episode_number in range(2):
+        response = client.post("/api/v1/episodes", json={"user_prompt": f"Metered {episode_number}.", "theme_id": 1})
+        assert response.status_code == 201
+        assert client.get(f"/api/v1/episodes/{response.json()['episode_id']}").status_code == 200
+
+    create_labels = ("POST", "/api/v1/episodes")
+    assert request_duration.count(create_labels) == 2
+    assert request_db_statements.sum(create_labels) == 2 * 4
+    assert request_db_statements.count(("GET", "/api/v1/episodes/{episode_id}")) == 2
+
+    body = client.get("/metrics").text
+    assert '# TYPE http_request_duration_seconds histogram' in body
+    assert 'http_request_db_statements_bucket{method="POST",route="/api/v1/episodes",le="3"} 0' in body
+    assert 'http_request_db_statements_bucket{method="POST",route="/api/v1/episodes",le="5"} 2' in body
+    assert 'http_request_db_statements_count{method="POST",route="/api/v1/episodes"} 2' in body
+    assert 'route="/api/v1/episodes/{episode_id}"' in body
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    """Buckets are cumulative and the +Inf bucket equals the count."""
+
+    histogram = Histogram("demo_seconds", "Demo.", ("route",), (0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(("/x",), value)
+
+    assert histogram.render() == [
+        "# HELP demo_seconds Demo.",
+        "# TYPE demo_seconds histogram",
+        'demo_seconds_bucket{route="/x",le="0.1"} 1',
+        'demo_seconds_bucket{route="/x",le="1"} 3',
+        'demo_seconds_bucket{route="/x",le="+Inf"} 4',
+        'demo_seconds_sum{route="/x"} 4.05',
+        'demo_seconds_count{route="/x"} 4',
+    ]
+
+
+def test_slow_queries_are_logged(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    """Statements above the configured threshold are logged outside requests too."""
+
+    monkeypatch.setattr(get_settings(), "slow_query_threshold_ms", 0.0)
+    engine = create_engine("sqlite+pysqlite://", poolclass=NullPool)
+    instrument_engine(engine)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.metrics"), engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert any("Slow query" in record.message and "SELECT 1" in record.message for record in caplog.records)
+    engine.dispose()
@@ -0,0 +1,49 @@
+"""Smoke tests for the scale fixtures and the microbenchmarks."""
+
+from pathlib import Path
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.episode import Episode
+from app.models.job import Job
+from app.models.story_series import StorySeries
+from benchmarks.fixtures import ensure_fixture
+from benchmarks.microbench import run_microbenchmarks, scaling_exponent
+
+
+def test_fixture_generator_fills_every_table(tmp_path: Path) -> None:
+    """A fixture holds the requested rows with consistent episode numbering."""
+
+    engine = ensure_fixture(2500, f"sqlite+pysqlite:///{tmp_path / 'fixture.db'}")
+    with Session(engine) as db:
+        assert db.scalar(select(func.count(Episode.id))) == 2500
+        assert db.scalar(select(func.count(Job.id))) == 2500
+        assert list(db.scalars(select(StorySeries.last_episode_number).order_by(StorySeries.id))) == [1000, 1000, 500]
+    engine.dispose()
+
+
+def test_microbenchmarks_report_every_path(tmp_path: Path) -> None:
+    """Each hot path is timed on the fixture; one size yields no scaling exponent."""
+
+    report = run_microbenchmarks([200], budget_sec=0.01, database_url=f"sqlite+pysqlite:///{tmp_path / 'bench.db'}")
+
+    assert set(report["benchmarks"]) == {
+        "list_characters",
+        "get_characters_by_ids[1000]",
+        "create_episode_and_job",
+        "create_episodes_batch[100]",
+        "update_job_states[100]",
+        "EpisodeRead.model_validate[100]",
+        "JobRead.model_validate[100]",
+    }
+    for benchmark in report["benchmarks"].values():
+        assert benchmark["by_rows"]["200"]["calls"] >= 5
+        assert benchmark["scaling_exponent"] is None
+
+
+def test_scaling_exponent_separates_constant_from_linear_paths() -> None:
+    """A flat median scores 0 and a median growing with the rows scores 1."""
+
+    assert scaling_exponent({1000: {"median_us": 10.0}, 100_000: {"median_us": 10.0}}) == 0.0
+    assert scaling_exponent({1000: {"median_us": 10.0}, 100_000: {"median_us": 1000.0}}) == 1.0
@@ -0,0 +1,87 @@
+"""Tests for keyset-paginated list endpoints."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.models.character import Character
+from app.models.story_series import StorySeries
+
+
+def _collect(client, url: str, **params) -> list[dict]:
+    """Follow ``next_cursor`` until the listing is exhausted."""
+
+    items: list[dict] = []
+    cursor = None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        page = client.get(url, params=query)
+        assert page.status_code == 200
+        payload = page.json()
+        assert len(payload["items"]) <= params.get("limit", 20)
+        items.extend(payload["items"])
+        cursor = payload["next_cursor"]
+        if cursor is None:
+            return items
+
+
+def test_episode_pages_cover_every_row_once(client, seeded_db: Session) -> None:
+    """Paging visits all episodes newest first without gaps or repeats, with filters."""
+
+    seeded_db.add(StorySeries(title="Second", description="", language="en"))
+    seeded_db.commit()
+    items = [{"user_prompt": f"Episode {n}.", "theme_id": 1, "series_id": 1 + n % 2} for n in range(25)]
+    assert client.post("/api/v1/episodes:batch", json={"items": items}).status_code == 201
+
+    episodes = _collect(client, "/api/v1/episodes", limit=7)
+    ids = [episode["id"] for episode in episodes]
+    assert ids == sorted(ids, reverse=True)
+    assert len(set(ids)) == 25
+
+    second_series = _collect(client, "/api/v1/episodes", limit=4, series_id=2)
+    assert len(second_series) == 12
+    assert {episode["series_id"] for episode in second_series} == {2}
+    assert _collect(client, "/api/v1/episodes", status="published") == []
+
+
+def test_job_pages_filter_by_series_and_status(client, seeded_db: Session) -> None:
+    """Job listings join through episodes for series and theme filters."""
+
+    seeded_db.add(StorySeries(title="Second", description="", language="en"))
+    seeded_db.commit()
+    items = [{"user_prompt": f"Job {n}.", "theme_id": 1, "series_id": 1 + n % 2} for n in range(9)]
+    assert client.post("/api/v1/episodes:batch", json={"items": items}).status_code == 201
+
+    assert len(_collect(client, "/api/v1/jobs", limit=2)) == 9
+    assert len(_collect(client, "/api/v1/jobs", limit=2, series_id=1, theme_id=1, status="queued")) == 5
+    assert _collect(client, "/api/v1/jobs", status="completed") == []
+
+
+def test_character_pages_handle_mixed_timestamp_precision(client, seeded_db: Session) -> None:
+    """Rows sharing a timestamp second are neither skipped nor repeated across pages."""
+
+    base = seeded_db.get(Character, 1).created_at.replace(tzinfo=None)
+    for n in range(6):
+        seeded_db.add(
+            Character(
+                name=f"Extra {n}",
+                speech_style="plain",
+                traits_json={},
+                description="Paged.",
+                created_at=base + timedelta(microseconds=0 if n % 2 else 500) if n < 4 else datetime(2000, 1, 1),
+            )
+        )
+    seeded_db.commit()
+
+    characters = _collect(client, "/api/v1/characters/page", limit=3)
+    assert len(characters) == 8
+    assert len({character["id"] for character in characters}) == 8
+    assert characters[-1]["name"] == "Extra 4"
+
+
+def test_invalid_cursor_is_rejected(client, seeded_db: Session) -> None:
+    """Malformed cursors produce a 400 instead of a server error."""
+
+    response = client.get("/api/v1/episodes", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
@@ -0,0 +1,132 @@
+"""Tests for the stage graph executor and the episode pipeline."""
+
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.episode import Episode
+from app.models.job import Job
+from app.pipeline import Pipeline, PipelineError, Stage, build_episode_pipeline
+from app.pipeline import stages
+from app.services.job_service import run_episode_pipeline
+from app.services.progress_writer import ProgressWriter
+
+STAGE_SEC = 0.2
+
+
+def _sleep_then(outputs: dict[str, Any]):
+    def run(inputs: dict[str, Any]) -> dict[str, Any]:
+        time.sleep(STAGE_SEC)
+        return outputs
+
+    return run
+
+
+def _fail(inputs: dict[str, Any]) -> dict[str, Any]:
+    raise RuntimeError("provider unavailable")
+
+
+def test_independent_stages_run_concurrently() -> None:
+    """A diamond graph takes its critical path (3 stages), not the sum (4 stages)."""
+
+    pipeline = Pipeline(
+        [
+            Stage("sync", _sleep_then({"done": True}), inputs=("audio", "visuals"), outputs=("done",)),
+            Stage("tts", _sleep_then({"audio": "a"}), inputs=("script",), outputs=("audio",), weight=2),
+            Stage("visual", _sleep_then({"visuals": "v"}), inputs=("script",), outputs=("visuals",), weight=2),
+            Stage("llm", _sleep_then({"script": "s"}), inputs=("prompt",), outputs=("script",), weight=3),
+        ],
+        initial_inputs=("prompt",),
+    )
+    reports: list[tuple[str, float]] = []
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = pipeline.run({"prompt": "p"}, executor, on_progress=lambda *report: reports.append(report))
+    elapsed = time.perf_counter() - started_at
+
+    assert results == {"prompt": "p", "script": "s", "audio": "a", "visuals": "v", "done": True}
+    assert elapsed < 3.5 * STAGE_SEC
+    assert pipeline.order[0] == "llm" and pipeline.order[-1] == "sync"
+    assert reports[0] == ("llm", 3 / 8)
+    assert reports[-1] == ("sync", 1.0)
+    assert [fraction for _, fraction in reports] == sorted(fraction for _, fraction in reports)
+
+
+def test_invalid_graphs_are_rejected() -> None:
+    """Unknown inputs, duplicate outputs and cycles fail at construction."""
+
+    with pytest.raises(PipelineError, match="unknown inputs"):
+        Pipeline([Stage("llm", _fail, inputs=("lore",), outputs=("script",))])
+    with pytest.raises(PipelineError, match="more than once"):
+        Pipeline([Stage("a", _fail, outputs=("x",)), Stage("b", _fail, outputs=("x",))])
+    with pytest.raises(PipelineError, match="cycle"):
+        Pipeline([Stage("a", _fail, inputs=("y",), outputs=("x",)), Stage("b", _fail, inputs=("x",), outputs=("y",))])
+
+
+def test_failing_stage_stops_downstream_stages() -> None:
+    """The failure names the stage and dependent stages never start."""
+
+    downstream: list[str] = []
+
+    def synthesize(inputs: dict[str, Any]) -> dict[str, Any]:
+        downstream.append("tts")
+        return {"audio": 1}
+
+    pipeline = Pipeline(
+        [Stage("llm", _fail, outputs=("script",)), Stage("tts", synthesize, inputs=("script",), outputs=("audio",))]
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor, pytest.raises(PipelineError) as excinfo:
+        pipeline.run({}, executor)
+
+    assert excinfo.value.stage == "llm"
+    assert isinstance(excinfo.value.__cause__, RuntimeError)
+    assert downstream == []
+
+
+def test_episode_pipeline_runs_on_a_process_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Stub providers are picklable and produce every stage output."""
+
+    monkeypatch.setattr(stages, "STUB_LATENCY_SEC", 0.0)
+    inputs = {
+        "user_prompt": "A storm gathers.",
+        "theme_key": "betrayal",
+        "theme_label": "Betrayal",
+        "theme_description": "Trust broken",
+        "characters": [{"name": "Ada", "speech_style": "calm", "description": "Lead"}],
+        "story_context": None,
+    }
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = build_episode_pipeline().run(inputs, executor)
+
+    assert results["lore"] == "Betrayal: Trust broken"
+    assert "Ada: A storm gathers." in results["script"]
+    assert len(results["timeline"]) == len(results["script"].splitlines())
+
+
+def test_episode_job_stores_script_and_completes(
+    client, seeded_db: Session, test_session_factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The job handler writes script and summary to the episode and finishes the job."""
+
+    monkeypatch.setattr(stages, "STUB_LATENCY_SEC", 0.0)
+    response = client.post(
+        "/api/v1/episodes", json={"user_prompt": "The vault opens.", "theme_id": 1, "character_ids": [1, 2]}
+    )
+    job_id = response.json()["job_id"]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        run_episode_pipeline(job_id, ProgressWriter(test_session_factory, window_sec=0), executor=executor)
+
+    with test_session_factory() as db:
+        episode = db.get(Episode, response.json()["episode_id"])
+        job = db.get(Job, job_id)
+    assert episode.status == "generated"
+    assert "Character One: The vault opens." in episode.script_text
+    assert episode.summary == "Character One, Character Two: The vault opens."
+    assert (job.status, job.progress_pct, job.step) == ("completed", 100, "completed")
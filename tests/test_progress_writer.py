@@ -0,0 +1,73 @@
+"""Tests for coalesced job progress writes."""
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.episode import Episode
+from app.models.job import Job
+from app.services.progress_writer import ProgressWriter
+
+
+@pytest.fixture()
+def job_ids(seeded_db: Session) -> list[int]:
+    """Insert two queued jobs and return their ids."""
+
+    episode = Episode(series_id=1, episode_number=1, title="Progress", user_prompt="p", theme_id=1)
+    seeded_db.add(episode)
+    seeded_db.flush()
+    jobs = [Job(episode_id=episode.id), Job(episode_id=episode.id)]
+    seeded_db.add_all(jobs)
+    seeded_db.commit()
+    return [job.id for job in jobs]
+
+
+@pytest.fixture()
+def update_statements(test_session_factory: sessionmaker, capture_statements) -> list[str]:
+    """Capture every UPDATE statement sent to the test engine."""
+
+    return capture_statements(test_session_factory, prefix="UPDATE")
+
+
+def _job(test_session_factory: sessionmaker, job_id: int) -> Job:
+    with test_session_factory() as db:
+        return db.get(Job, job_id)
+
+
+def test_rapid_reports_are_coalesced(
+    test_session_factory: sessionmaker, job_ids: list[int], update_statements: list[str]
+) -> None:
+    """Reports inside the window merge; the terminal state is written at once."""
+
+    job_id = job_ids[0]
+    writer = ProgressWriter(test_session_factory, window_sec=60)
+
+    writer.report(job_id, status="running", progress_pct=10, step="one")
+    writer.report(job_id, status="running", progress_pct=20, step="two")
+    writer.report(job_id, status="running", progress_pct=30, step="three")
+    assert len(update_statements) == 1
+    assert _job(test_session_factory, job_id).progress_pct == 10
+
+    writer.report(job_id, status="completed", progress_pct=100, step="completed")
+    assert len(update_statements) == 2
+    job = _job(test_session_factory, job_id)
+    assert (job.status, job.progress_pct, job.step) == ("completed", 100, "completed")
+
+
+def test_flush_writes_many_jobs_in_one_statement(
+    test_session_factory: sessionmaker, job_ids: list[int], update_statements: list[str]
+) -> None:
+    """Pending progress for several jobs is flushed with a single UPDATE."""
+
+    writer = ProgressWriter(test_session_factory, window_sec=60)
+    for job_id in job_ids:
+        writer.report(job_id, status="running", progress_pct=5, step="start")
+    update_statements.clear()
+
+    writer.report(job_ids[0], status="running", progress_pct=40, step="first")
+    writer.report(job_ids[1], status="running", progress_pct=70, step="second")
+    assert update_statements == []
+
+    writer.flush()
+    assert len(update_statements) == 1
+    assert _job(test_session_factory, job_ids[0]).progress_pct == 40
+    assert _job(test_session_factory, job_ids[1]).step == "second"
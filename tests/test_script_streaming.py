@@ -0,0 +1,171 @@
+"""Tests for streamed script generation and its Server-Sent Events endpoint."""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.v1.episodes import _script_event_stream
+from app.core.config import get_settings
+from app.core.script_events import ScriptFeed, ScriptFeedHub
+from app.models.episode import Episode
+from app.pipeline import PipelineCancelledError
+from app.services.script_writer import ScriptWriter
+from app.services.worker_service import WorkerPool
+
+
+def _script_events(text: str) -> tuple[list[str], list[dict]]:
+    """Return the streamed script chunks and the remaining events' payloads."""
+
+    chunks, others = [], []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        payload = json.loads(fields["data"])
+        if fields["event"] == "script":
+            chunks.append(payload["text"])
+        else:
+            others.append({"event": fields["event"], **payload})
+    return chunks, others
+
+
+def test_writer_batches_appends(seeded_db: Session, test_session_factory: sessionmaker, capture_statements) -> None:
+    """Many small chunks are appended in a few statements, in order."""
+
+    seeded_db.add(Episode(series_id=1, episode_number=1, title="Draft", user_prompt="p", theme_id=1))
+    seeded_db.commit()
+    updates = capture_statements(test_session_factory)
+
+    chunks = [f"w{index} " for index in range(50)]
+    writer = ScriptWriter(1, test_session_factory, flush_chars=20, window_sec=60)
+    writer.start()
+    with writer:
+        for chunk in chunks:
+            writer.append(chunk)
+
+    writes = [statement for statement in updates if "script_text" in statement]
+    # One reset plus one append per 20 buffered characters and a final flush.
+    assert len(writes) <= 2 + len("".join(chunks)) // 20
+    with test_session_factory() as db:
+        episode = db.get(Episode, 1)
+    assert episode.script_text == "".join(chunks)
+    assert episode.status == "generating"
+
+
+def test_writer_stops_the_stream_when_asked_or_aborted(seeded_db: Session, test_session_factory: sessionmaker) -> None:
+    """A stop request or an abort makes the next chunk raise, ending the streaming stage."""
+
+    seeded_db.add(Episode(series_id=1, episode_number=1, title="Draft", user_prompt="p", theme_id=1))
+    seeded_db.commit()
+    stop = threading.Event()
+    writer = ScriptWriter(1, test_session_factory, flush_chars=1, window_sec=60, should_stop=stop.is_set)
+    writer.start()
+
+    writer.append("kept ")
+    stop.set()
+    with pytest.raises(PipelineCancelledError):
+        writer.append("dropped")
+    stop.clear()
+    writer.abort(status="draft", script_text=None)
+    with pytest.raises(PipelineCancelledError):
+        writer.append("dropped")
+
+    with test_session_factory() as db:
+        episode = db.get(Episode, 1)
+    assert (episode.status, episode.script_text) == ("draft", None)
+
+
+def test_stream_of_finished_episode_sends_script_then_done(
+    client, create_episode, seeded_db: Session, test_session_factory: sessionmaker
+) -> None:
+    """A finished episode yields its whole script, then a terminal event."""
+
+    episode_id = create_episode("Stream the script.", character_ids=[1, 2])["episode_id"]
+    WorkerPool(test_session_factory, concurrency=1).run_once()
+
+    response = client.get(f"/api/v1/episodes/{episode_id}/script/events")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    chunks, others = _script_events(response.text)
+    with test_session_factory() as db:
+        episode = db.get(Episode, episode_id)
+    assert "".join(chunks) == episode.script_text
+    assert episode.status == "generated"
+    assert others == [{"event": "done", "status": "completed"}]
+
+    offset = len(episode.script_text) - 10
+    event_id = f"{episode.script_generation}:{offset}"
+    resumed = client.get(f"/api/v1/episodes/{episode_id}/script/events", headers={"Last-Event-ID": event_id})
+    assert "".join(_script_events(resumed.text)[0]) == episode.script_text[offset:]
+
+    # An offset into an earlier script, e.g. one a retry cleared, restarts from the beginning.
+    stale_id = f"{episode.script_generation - 1}:{offset}"
+    restarted = client.get(f"/api/v1/episodes/{episode_id}/script/events", headers={"Last-Event-ID": stale_id})
+    chunks, others = _script_events(restarted.text)
+    assert "".join(chunks) == episode.script_text
+    assert others == [{"event": "reset"}, {"event": "done", "status": "completed"}]
+
+
+def test_stream_follows_a_running_job(
+    client, create_episode, seeded_db: Session, test_session_factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Text appended by the worker arrives in several events before the job completes."""
+
+    monkeypatch.setattr(get_settings(), "script_stream_flush_chars", 8)
+    monkeypatch.setattr(get_settings(), "script_stream_poll_interval_sec", 0.01)
+    episode_id = create_episode("Stream the script.", character_ids=[1, 2])["episode_id"]
+
+    def run_worker() -> None:
+        time.sleep(0.1)
+        WorkerPool(test_session_factory, concurrency=1).run_once()
+
+    worker = threading.Thread(target=run_worker)
+    worker.start()
+    response = client.get(f"/api/v1/episodes/{episode_id}/script/events")
+    worker.join()
+
+    chunks, others = _script_events(response.text)
+    with test_session_factory() as db:
+        assert "".join(chunks) == db.get(Episode, episode_id).script_text
+    assert len(chunks) > 1
+    assert others == [{"event": "done", "status": "completed"}]
+
+
+def test_stream_for_missing_episode_returns_404(client, seeded_db: Session) -> None:
+    """Unknown episodes are rejected before the stream starts."""
+
+    assert client.get("/api/v1/episodes/99/script/events").status_code == 404
+
+
+def test_viewers_of_one_episode_share_a_poll(
+    client,
+    create_episode,
+    seeded_db: Session,
+    test_session_factory: sessionmaker,
+    test_async_session_factory: async_sessionmaker,
+    capture_statements,
+) -> None:
+    """Concurrent viewers of an episode are fed by one query per poll, not one each."""
+
+    episode_id = create_episode("Stream the script.", character_ids=[1, 2])["episode_id"]
+    WorkerPool(test_session_factory, concurrency=1).run_once()
+    statements = capture_statements(test_async_session_factory)
+    hub = ScriptFeedHub()
+
+    async def watch() -> list[str]:
+        engine = test_async_session_factory.kw["bind"]
+        feeds = [hub.subscribe(engine, episode_id) for _ in range(3)]
+        assert feeds[0] is feeds[1] is feeds[2]
+
+        async def read(feed: ScriptFeed) -> str:
+            return "".join([event async for event in _script_event_stream(feed, None, 0)])
+
+        return await asyncio.gather(*(read(feed) for feed in feeds))
+
+    streams = asyncio.run(watch())
+    assert len({*streams}) == 1 and "event: done" in streams[0]
+    assert len([statement for statement in statements if "script_text" in statement]) == 1
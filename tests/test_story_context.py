@@ -0,0 +1,108 @@
+"""Tests for continuation chain loading and memoized story context."""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.episode import Episode
+from app.models.story_context import StoryContext
+from app.repositories.episode_repository import get_continuation_chain, save_episode_script
+from app.services import story_context_service
+from app.services.story_context_service import compact_story_context, load_story_context
+
+
+@pytest.fixture()
+def chain_ids(seeded_db: Session) -> list[int]:
+    """Insert a five-episode continuation chain plus a branch off the second episode."""
+
+    ids: list[int] = []
+    for number in range(1, 6):
+        episode = Episode(
+            series_id=1,
+            episode_number=number,
+            title=f"Part {number}",
+            user_prompt=f"Prompt {number}",
+            theme_id=1,
+            summary=f"Summary {number}",
+            continuation_from_episode_id=ids[-1] if ids else None,
+        )
+        seeded_db.add(episode)
+        seeded_db.flush()
+        ids.append(episode.id)
+    branch = Episode(
+        series_id=1, episode_number=6, title="Branch", user_prompt="Branch", theme_id=1, continuation_from_episode_id=ids[1]
+    )
+    seeded_db.add(branch)
+    seeded_db.commit()
+    return ids
+
+
+@pytest.fixture()
+def statements(test_session_factory: sessionmaker, capture_statements) -> list[str]:
+    """Capture every statement sent to the test engine."""
+
+    return capture_statements(test_session_factory)
+
+
+def test_chain_is_loaded_with_one_query(
+    test_session_factory: sessionmaker, chain_ids: list[int], statements: list[str]
+) -> None:
+    """The recursive CTE returns the episode and all ancestors, oldest first."""
+
+    with test_session_factory() as db:
+        chain = get_continuation_chain(db, chain_ids[-1])
+
+    assert [episode.id for episode in chain] == chain_ids
+    assert len(statements) == 1
+    assert "RECURSIVE" in statements[0].upper()
+
+
+def test_story_context_is_memoized_and_invalidated(
+    test_session_factory: sessionmaker, chain_ids: list[int], statements: list[str]
+) -> None:
+    """Reads hit the memo; a new ancestor summary drops the memos of its descendants only."""
+
+    with test_session_factory() as db:
+        first = load_story_context(db, chain_ids[-1])
+        load_story_context(db, chain_ids[0])
+        statements.clear()
+        assert load_story_context(db, chain_ids[-1]) == first
+    assert len(statements) == 1
+    assert first.splitlines() == [f"Episode {number}: Summary {number}" for number in range(1, 6)]
+
+    with test_session_factory() as db:
+        save_episode_script(db, chain_ids[1], script_text="...", summary="Rewritten")
+        memoized = set(db.scalars(select(StoryContext.episode_id)).all())
+        assert memoized == {chain_ids[0]}
+        assert load_story_context(db, chain_ids[-1]).splitlines()[1] == "Episode 2: Rewritten"
+
+
+def test_memo_built_from_a_stale_chain_is_not_served(
+    test_session_factory: sessionmaker, chain_ids: list[int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A summary saved between the chain read and the memo write invalidates that memo."""
+
+    def chain_then_rewrite(db: Session, episode_id: int) -> list[Episode]:
+        chain = get_continuation_chain(db, episode_id)
+        with test_session_factory() as other:
+            save_episode_script(other, chain_ids[1], script_text="...", summary="Rewritten")
+        return chain
+
+    with test_session_factory() as db:
+        monkeypatch.setattr(story_context_service, "get_continuation_chain", chain_then_rewrite)
+        assert load_story_context(db, chain_ids[-1]).splitlines()[1] == "Episode 2: Summary 2"
+        monkeypatch.undo()
+        db.expire_all()
+
+        assert load_story_context(db, chain_ids[-1]).splitlines()[1] == "Episode 2: Rewritten"
+
+
+def test_compaction_keeps_the_newest_episodes() -> None:
+    """Older summaries are dropped first when the context exceeds the budget."""
+
+    chain = [Episode(episode_number=number, summary="x" * 20, user_prompt="p") for number in range(1, 11)]
+
+    context = compact_story_context(chain, max_chars=100)
+
+    assert context.splitlines()[0] == "(7 earlier episodes omitted)"
+    assert context.splitlines()[-1].startswith("Episode 10: ")
@@ -0,0 +1,55 @@
+"""Tests for catalog fragment caching and the template bytecode cache."""
+
+import re
+from pathlib import Path
+
+import pytest
+from jinja2 import Environment, FileSystemLoader
+from sqlalchemy.orm import Session
+
+from app.core.catalog_cache import catalog_cache
+from app.core.config import get_settings
+from app.web import routes
+
+KEY_FIELD = re.compile(r'name="idempotency_key" value="(\w+)"')
+CHARACTER_PAYLOAD = {"name": "Character Three", "speech_style": "dry", "description": "Third test character"}
+
+
+def test_index_renders_catalog_fragments_once_per_version(client, seeded_db: Session) -> None:
+    """Repeated page views reuse the catalog options; a write re-renders only its own fragment."""
+
+    renders_before = routes.catalog_fragments.renders
+    first = client.get("/")
+    second = client.get("/")
+
+    assert routes.catalog_fragments.renders - renders_before == 3
+    assert '<option value="1">Betrayal</option>' in second.text
+    assert first.text.count("<option") == second.text.count("<option")
+    # The per-request parts are still rendered for every view.
+    assert KEY_FIELD.search(first.text).group(1) != KEY_FIELD.search(second.text).group(1)
+
+    client.post("/api/v1/characters", json=CHARACTER_PAYLOAD)
+    third = client.get("/")
+
+    assert routes.catalog_fragments.renders - renders_before == 4
+    assert "Character Three - dry" in third.text
+
+    # Reloading unchanged catalogs, as after the cache's TTL, keeps their version and fragments.
+    catalog_cache.clear()
+    assert "Character Three - dry" in client.get("/").text
+    assert routes.catalog_fragments.renders - renders_before == 4
+
+
+def test_bytecode_cache_persists_compiled_templates(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Compiled templates are written to the configured directory, which is created on first use."""
+
+    directory = tmp_path / "bytecode"
+    monkeypatch.setattr(get_settings(), "template_bytecode_cache_dir", str(directory))
+    env = Environment(loader=FileSystemLoader("app/templates"), bytecode_cache=routes._TemplateBytecodeCache())
+    assert not directory.exists()
+    env.get_template("index.html")
+    assert len(list(directory.glob("__jinja2_*.cache"))) == 1
+
+    monkeypatch.setattr(get_settings(), "template_bytecode_cache_dir", None)
+    env.get_template("base.html")
+    assert len(list(directory.glob("__jinja2_*.cache"))) == 1